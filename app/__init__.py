@@ -10,6 +10,11 @@ from app.domains.category_lines.views import app_categories_line
 from app.domains.products.views import app_products
 from app.domains.export_csv.views import app_export_csv
 from app.domains.import_csv.views import app_import_csv
+from app.domains.import_csv.jobs import import_jobs
+from app.domains.health.views import app_health
+from app.domains.categories.commands import reprice_category_command
+from app.cache import response_cache
+from app import serialization
 from database import db, migrate
 
 
@@ -18,8 +23,12 @@ def create_app():
     app.config.from_object('settings')
     db.init_app(app)
     migrate.init_app(app, db)
+    response_cache.init_app(app)
+    serialization.init_app(app)
+    import_jobs.init_app(app)
     _register_blueprint(app)
     _register_error_handler(app)
+    _register_commands(app)
     return app
 
 
@@ -33,6 +42,7 @@ def _register_blueprint(app):
     app.register_blueprint(app_categories_line)
     app.register_blueprint(app_import_csv)
     app.register_blueprint(app_products)
+    app.register_blueprint(app_health)
 
 
 def _handle_default_exception(e):
@@ -63,3 +73,7 @@ def _handle_internal_server_error_exception(e):
 def _register_error_handler(app):
     app.register_error_handler(HTTPException, _handle_default_exception)
     app.register_error_handler(InternalServerError, _handle_internal_server_error_exception)
+
+
+def _register_commands(app):
+    app.cli.add_command(reprice_category_command)
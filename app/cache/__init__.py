@@ -0,0 +1,190 @@
+import json
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, Optional, Tuple
+from uuid import uuid4
+
+from flask import Response, g, request
+
+try:
+    import redis
+except ImportError:
+    redis = None
+
+DEFAULT_CACHE_TTL: int = 300
+DEFAULT_CACHE_MAX_SIZE: int = 1024
+MISSING = object()
+
+
+class MemoryCache:
+    def __init__(self, max_size: int = DEFAULT_CACHE_MAX_SIZE, ttl: float = DEFAULT_CACHE_TTL,
+                 clock: Callable[[], float] = time.monotonic):
+        self._max_size = max_size
+        self._ttl = ttl
+        self._clock = clock
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable) -> Any:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return MISSING
+            value, expires_at = entry
+            if expires_at <= self._clock():
+                del self._entries[key]
+                return MISSING
+            self._entries.move_to_end(key)
+            return value
+
+    def set(self, key: Hashable, value: Any) -> None:
+        with self._lock:
+            self._entries[key] = (value, self._clock() + self._ttl)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._max_size:
+                self._entries.popitem(last=False)
+
+    def delete(self, *keys: Hashable) -> None:
+        with self._lock:
+            for key in keys:
+                self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+class RedisCache:
+    def __init__(self, client, namespace: str, ttl: int = DEFAULT_CACHE_TTL):
+        self._client = client
+        self._prefix = f'{namespace}:'
+        self._ttl = ttl
+
+    def get(self, key: str) -> Any:
+        value = self._client.get(self._prefix + key)
+        return MISSING if value is None else json.loads(value)
+
+    def set(self, key: str, value: Any) -> None:
+        self._client.set(self._prefix + key, json.dumps(value), ex=self._ttl)
+
+    def delete(self, *keys: str) -> None:
+        if keys:
+            self._client.delete(*[self._prefix + key for key in keys])
+
+    def clear(self) -> None:
+        keys = list(self._client.scan_iter(match=f'{self._prefix}*'))
+        if keys:
+            self._client.delete(*keys)
+
+
+class Cache:
+    def __init__(self, namespace: str):
+        self._namespace = namespace
+        self._backend = MemoryCache()
+
+    def init_app(self, app) -> None:
+        app.extensions[f'cache.{self._namespace}'] = self
+        self._backend = create_backend(app.config, self._namespace)
+
+    def get(self, key: str) -> Any:
+        return self._backend.get(key)
+
+    def set(self, key: str, value: Any) -> None:
+        self._backend.set(key, value)
+
+    def get_or_load(self, key: str, load: Callable[[], Any]) -> Any:
+        value = self._backend.get(key)
+        if value is MISSING:
+            value = load()
+            self._backend.set(key, value)
+        return value
+
+    def delete(self, *keys: str) -> None:
+        self._backend.delete(*keys)
+
+    def clear(self) -> None:
+        self._backend.clear()
+
+
+def create_backend(config: Dict[str, Any], namespace: str):
+    ttl = int(config.get('CACHE_TTL', DEFAULT_CACHE_TTL))
+    if config.get('CACHE_REDIS_URL'):
+        if redis is None:
+            raise ImportError('The redis package must be installed to use CACHE_REDIS_URL')
+        return RedisCache(redis.Redis.from_url(config['CACHE_REDIS_URL']), namespace, ttl)
+    return MemoryCache(int(config.get('CACHE_MAX_SIZE', DEFAULT_CACHE_MAX_SIZE)), ttl)
+
+
+class ResponseCache:
+    CACHED_HEADERS: Tuple[str, ...] = ('Content-Type', 'ETag', 'Last-Modified', 'X-Next-Cursor')
+
+    def __init__(self, namespace: str, collections: Dict[str, str]):
+        self._cache = Cache(namespace)
+        self._collections = collections
+
+    def init_app(self, app) -> None:
+        self._cache.init_app(app)
+        app.before_request(self._before_request)
+        app.after_request(self._after_request)
+
+    def invalidate(self, collection: str, *ids: str) -> None:
+        self._cache.set(self._generation_key(collection), uuid4().hex)
+        for id in ids:
+            self._cache.set(self._version_key(collection, id), uuid4().hex)
+
+    def key_of(self, method: str, path: str, query_string: str) -> Optional[str]:
+        if method != 'GET':
+            return None
+        for collection, prefix in self._collections.items():
+            if path == prefix:
+                return f'{collection}:list:{self._generation(collection)}:{query_string}'
+            id = path[len(prefix) + 1:] if path.startswith(f'{prefix}/') else ''
+            if id and '/' not in id and ':' not in id and not query_string:
+                return f'{collection}:item:{id}:{self._version(collection, id)}'
+        return None
+
+    def _before_request(self) -> Optional[Response]:
+        key = self.key_of(request.method, request.path, request.query_string.decode('utf-8'))
+        if key is None:
+            return None
+        cached = self._cache.get(key)
+        if cached is MISSING:
+            g.response_cache_key = key
+            return None
+        response = Response(cached['body'], 200, cached['headers'])
+        return response.make_conditional(request)
+
+    def _after_request(self, response: Response) -> Response:
+        key = g.pop('response_cache_key', None)
+        if key and response.status_code == 200 and not response.is_streamed:
+            self._cache.set(key, {'body': response.get_data(as_text=True),
+                                  'headers': {header: response.headers[header] for header in self.CACHED_HEADERS
+                                              if header in response.headers}})
+        return response
+
+    def _generation(self, collection: str) -> str:
+        return self._current(self._generation_key(collection))
+
+    def _version(self, collection: str, id: str) -> str:
+        return self._current(self._version_key(collection, id))
+
+    def _current(self, key: str) -> str:
+        value = self._cache.get(key)
+        if value is MISSING:
+            value = uuid4().hex
+            self._cache.set(key, value)
+        return value
+
+    def _generation_key(self, collection: str) -> str:
+        return f'{collection}:generation'
+
+    def _version_key(self, collection: str, id: str) -> str:
+        return f'{collection}:version:{id}'
+
+
+response_cache = ResponseCache('responses', {'categories': '/categories', 'category_lines': '/category_line',
+                                             'suppliers': '/suppliers'})
@@ -0,0 +1,47 @@
+import datetime
+import hashlib
+from typing import Any, Callable, Optional, Tuple
+
+from flask import Response, make_response, request
+from sqlalchemy import func
+
+from database import db
+
+Version = Tuple[str, Optional[datetime.datetime]]
+
+
+def etag_of(*parts: Any) -> str:
+    return hashlib.sha1('|'.join(str(part) for part in parts).encode('utf-8')).hexdigest()
+
+
+def collection_version(query, model: db.Model) -> Version:
+    last_modified, count = query.with_entities(func.max(model.on_update), func.count(model.id)).one()
+    return etag_of(last_modified, count), last_modified
+
+
+def item_version(model: db.Model, id: str) -> Optional[Version]:
+    last_modified = db.session.query(model.on_update).filter(model.id == id).scalar()
+    if last_modified is None:
+        return None
+    return etag_of(id, last_modified), last_modified
+
+
+def conditional_response(version: Optional[Version], build: Callable[[], Any]) -> Response:
+    if version is None:
+        return make_response(build())
+    etag, last_modified = version
+    response = Response(status=304) if is_not_modified(etag, last_modified) else make_response(build())
+    response.set_etag(etag)
+    if last_modified:
+        response.last_modified = last_modified
+    return response
+
+
+def is_not_modified(etag: str, last_modified: Optional[datetime.datetime]) -> bool:
+    if request.method not in ('GET', 'HEAD'):
+        return False
+    if request.if_none_match:
+        return request.if_none_match.contains(etag)
+    if request.if_modified_since and last_modified:
+        return last_modified.replace(microsecond=0) <= request.if_modified_since
+    return False
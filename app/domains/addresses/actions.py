@@ -1,5 +1,28 @@
+from typing import Any, Optional, Tuple
 from app.domains.addresses.models import *
-from database.repository import save, commit
+from app.validations.schemas import *
+from app.conditional import collection_version, item_version, Version
+from database.batch import insert_batch
+from database.repository import save, commit, update_fields
+from database.pagination import paginate, columns_of
+
+
+PAGE_FIELDS: List[str] = ['id', 'active', 'street', 'number', 'complement', 'zip_code', 'city', 'state', 'on_create',
+                          'on_update']
+CREATE_FIELDS: List[str] = ['street', 'number', 'complement', 'zip_code', 'city', 'state']
+UPDATE_FIELDS: List[str] = ['active', 'street', 'number', 'complement', 'zip_code', 'city', 'state']
+UPDATE_SCHEMA = Schema(
+    empty_fields(['active', 'complement']),
+    str_fields(['active', 'on_create', 'on_update']),
+    bool_fields(['active']),
+    alpha_numeric_fields(['street']),
+    numeric_fields(['number', 'zip_code']),
+    alpha_fields(['city', 'state']),
+    maximum_size_fields({'zip_code': MAX_ZIP_CODE_LENGTH, 'number': MAX_NUMBER_LENGTH,
+                         'complement': MAX_COMPLEMENT_LENGTH, 'street': MAX_LENGTH_OF_STREET_CITY_STATE,
+                         'city': MAX_LENGTH_OF_STREET_CITY_STATE, 'state': MAX_LENGTH_OF_STREET_CITY_STATE}),
+    fields=UPDATE_FIELDS
+)
 
 
 def create(data: Dict[str, Union[bool, str]]) -> Address:
@@ -7,10 +30,27 @@ def create(data: Dict[str, Union[bool, str]]) -> Address:
                         zip_code=data["zip_code"], city=data["city"], state=data["state"]))
 
 
+def create_many(data: List[Dict[str, Any]], atomic: bool = True) -> Dict[str, Any]:
+    return insert_batch(Address, data, CREATE_FIELDS, ADDRESS_SCHEMA.validate, optional_fields=['complement'],
+                        atomic=atomic)
+
+
 def get() -> List[Address]:
     return Address.query.all()
 
 
+def get_page(fields: List[str], limit: int, after: Optional[str]) -> Tuple[List[Dict[str, Any]], Optional[str]]:
+    return paginate(Address.query, columns_of(Address, PAGE_FIELDS), fields, limit, after)
+
+
+def get_page_version() -> Version:
+    return collection_version(Address.query, Address)
+
+
+def get_version(id: str) -> Optional[Version]:
+    return item_version(Address, id)
+
+
 def get_by_id(id: str) -> Address:
     address = Address.query.get(id)
     if not address:
@@ -18,26 +58,15 @@ def get_by_id(id: str) -> Address:
     return address
 
 
-def update(id: str, data: Dict[str, Union[bool, str]]) -> Address:
+def update(id: str, data: Dict[str, Union[bool, str]], partial: bool = False) -> Address:
     try:
         address = get_by_id(id)
         if not address:
             raise IdNotExistError()
-        address.active = data.get("active")
-        address.street = data.get("street")
-        address.number = data.get("number")
-        address.complement = data.get("complement")
-        address.zip_code = data.get("zip_code")
-        address.city = data.get("city")
-        address.state = data.get("state")
-
-        validating_empty_fields(['active', 'complement'], **address.serialize())
-        validating_if_field_is_not_str(['active', 'on_create', 'on_update'], **address.serialize())
-        validating_if_field_is_bool(['active'], **address.serialize())
-        validating_if_field_is_alpha_numeric(['street'], **address.serialize())
-        validating_if_field_is_numeric(['number', 'zip_code'], **address.serialize())
-        validating_if_field_is_alpha(['city', 'state'], **address.serialize())
-        validating_size_of_fields(**address.serialize())
+        changes = extracting_changes(UPDATE_FIELDS, data, partial, list_of_fields_not_mandatory=['active'])
+        UPDATE_SCHEMA.validate(changes)
+        if not update_fields(address, changes):
+            return address
         commit()
         return address
     except AttributeError:
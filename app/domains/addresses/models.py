@@ -2,6 +2,7 @@ from uuid import uuid4
 
 from database import db
 from app.validations.validations import *
+from app.validations.schemas import *
 
 MAX_ZIP_CODE_LENGTH: int = 8
 MAX_NUMBER_LENGTH: int = 10
@@ -11,6 +12,9 @@ MAX_LENGTH_OF_STREET_CITY_STATE: int = 50
 
 class Address(db.Model):
     __tablename__ = "addresses"
+    __table_args__ = (
+        db.Index('ix_addresses_on_create_id', 'on_create', 'id'),
+    )
 
     id = db.Column(db.String(36), default=lambda: str(uuid4()), primary_key=True)
     active = db.Column(db.Boolean(), default=True)
@@ -39,13 +43,21 @@ class Address(db.Model):
 
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
-        validating_empty_fields(['complement'], **kwargs)
-        validating_if_field_is_not_str(['active', 'on_create', 'on_update'], **kwargs)
-        validating_if_field_is_bool(['active'], **kwargs)
-        validating_if_field_is_alpha_numeric(['street'], **kwargs)
-        validating_if_field_is_numeric(['number', 'zip_code'], **kwargs)
-        validating_if_field_is_alpha(['city', 'state'], **kwargs)
-        validating_size_of_fields(**kwargs)
+        ADDRESS_SCHEMA.validate(kwargs)
+
+
+ADDRESS_SCHEMA = Schema(
+    empty_fields(['complement']),
+    str_fields(['active', 'on_create', 'on_update']),
+    bool_fields(['active']),
+    alpha_numeric_fields(['street']),
+    numeric_fields(['number', 'zip_code']),
+    alpha_fields(['city', 'state']),
+    maximum_size_fields({'zip_code': MAX_ZIP_CODE_LENGTH, 'number': MAX_NUMBER_LENGTH,
+                         'complement': MAX_COMPLEMENT_LENGTH, 'street': MAX_LENGTH_OF_STREET_CITY_STATE,
+                         'city': MAX_LENGTH_OF_STREET_CITY_STATE, 'state': MAX_LENGTH_OF_STREET_CITY_STATE}),
+    fields=Address.__table__.columns.keys()
+)
 
 
 def validating_size_of_fields(**data: Dict[str, Union[bool, str]]) -> NoReturn:
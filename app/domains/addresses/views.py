@@ -1,12 +1,19 @@
-from flask import Blueprint, jsonify, request
-from typing import Tuple, Any
+from flask import Blueprint, Response, jsonify, request
+from typing import Tuple, Any, Dict
 
 from app.domains.addresses.actions import \
-    get as get_addresses, \
+    get_page as get_address_page, \
+    get_page_version as get_address_page_version, \
+    get_version as get_address_version, \
+    create_many as create_addresses_batch, \
+    PAGE_FIELDS as ADDRESS_PAGE_FIELDS, \
     create as create_address, \
     update as update_address, \
     get_by_id as get_address_by_id, \
     validating_if_json_is_correct
+from app.conditional import conditional_response
+from database.batch import batch_status
+from database.pagination import parse_page_arguments, next_page_headers
 
 
 app_addresses = Blueprint('app.addresses', __name__)
@@ -22,6 +29,12 @@ def post() -> Tuple[Any, int]:
         validating_if_json_is_correct(['street', 'number', 'zip_code', 'city', 'state'])
 
 
+@app_addresses.route('/addresses:batch', methods=['POST'])
+def batch() -> Tuple[Any, int]:
+    report = create_addresses_batch(request.get_json(), atomic=request.args.get('atomic', 'true').lower() != 'false')
+    return jsonify(report), batch_status(report)
+
+
 @app_addresses.route('/addresses/<id>', methods=['PUT'])
 def put(id: str) -> Tuple[Any, int]:
     payload = request.get_json()
@@ -29,12 +42,24 @@ def put(id: str) -> Tuple[Any, int]:
     return jsonify(address.serialize()), 200
 
 
+@app_addresses.route('/addresses/<id>', methods=['PATCH'])
+def patch(id: str) -> Tuple[Any, int]:
+    payload = request.get_json()
+    address = update_address(id, payload, partial=True)
+    return jsonify(address.serialize()), 200
+
+
 @app_addresses.route('/addresses', methods=['GET'])
-def get() -> Tuple[Any, int]:
-    return jsonify([address.serialize() for address in get_addresses()]), 200
+def get() -> Response:
+    arguments = parse_page_arguments(request.args, ADDRESS_PAGE_FIELDS)
+
+    def build() -> Tuple[Any, int, Dict[str, str]]:
+        addresses, next_cursor = get_address_page(**arguments)
+        return jsonify(addresses), 200, next_page_headers(next_cursor)
+
+    return conditional_response(get_address_page_version(), build)
 
 
 @app_addresses.route('/addresses/<id>', methods=['GET'])
-def get_by_id(id: str) -> Tuple[Any, int]:
-    address = get_address_by_id(id)
-    return jsonify(address.serialize()), 200
+def get_by_id(id: str) -> Response:
+    return conditional_response(get_address_version(id), lambda: (jsonify(get_address_by_id(id).serialize()), 200))
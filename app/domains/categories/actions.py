@@ -1,23 +1,72 @@
-from io import StringIO
+import time
+from typing import Any, Callable, Iterator, Optional, TextIO, Tuple
+from sqlalchemy import func
 from sqlalchemy.exc import SQLAlchemyError
 
 from app.domains.categories.models import *
 from app.exceptions.exceptions_of_import import *
-from database.repository import save, commit
-from app.domains.import_csv.actions import import_csv_file
+from app.cache import response_cache
+from app.domains.products.pricing import reprice_category
+from app.validations.schemas import *
+from app.conditional import collection_version, item_version, Version
+from database.batch import insert_batch
+from database.repository import save, commit, update_fields, unit_of_work, chunked
+from database.pagination import paginate, columns_of
+from app.domains.import_csv.actions import iter_csv_file, import_report, dry_run_report, IMPORT_CHUNK_SIZE, \
+    DRY_RUN_SAMPLE_SIZE
+from app.domains.export_csv.actions import EXPORT_BATCH_SIZE
+
+
+PAGE_FIELDS: List[str] = ['id', 'active', 'name', 'profit_percentage', 'on_create', 'on_update']
+CREATE_FIELDS: List[str] = ['name', 'profit_percentage']
+UPDATE_FIELDS: List[str] = ['active', 'name', 'profit_percentage']
+UPDATE_SCHEMA = Schema(
+    empty_fields(['active']),
+    str_fields(['active', 'on_create', 'on_update', 'profit_percentage']),
+    bool_fields(['active']),
+    alpha_fields(['name']),
+    maximum_size_fields({'name': MAX_NAME_LENGTH}),
+    float_fields(['profit_percentage']),
+    fields=UPDATE_FIELDS
+)
 
 
 def create(data: Dict[str, str]) -> Category:
     try:
-        return save(Category(name=data['name'],profit_percentage=data['profit_percentage']))
+        category = save(Category(name=data['name'],profit_percentage=data['profit_percentage']))
     except SQLAlchemyError:
         raise RepeatedValueError([data['name']])
+    response_cache.invalidate('categories')
+    return category
+
+
+def create_many(data: List[Dict[str, Any]], atomic: bool = True) -> Dict[str, Any]:
+    report = insert_batch(Category, data, CREATE_FIELDS, CATEGORY_SCHEMA.validate, unique_field='name', atomic=atomic)
+    if report['created']:
+        response_cache.invalidate('categories')
+    return report
 
 
 def get() -> List[Category]:
     return Category.query.all()
 
 
+def get_in_batches(batch_size: int = EXPORT_BATCH_SIZE) -> Iterator[Category]:
+    return Category.query.yield_per(batch_size)
+
+
+def get_page(fields: List[str], limit: int, after: Optional[str]) -> Tuple[List[Dict[str, Any]], Optional[str]]:
+    return paginate(Category.query, columns_of(Category, PAGE_FIELDS), fields, limit, after)
+
+
+def get_page_version() -> Version:
+    return collection_version(Category.query, Category)
+
+
+def get_version(id: str) -> Optional[Version]:
+    return item_version(Category, id)
+
+
 def get_by_id(id: str) -> Category:
     category = Category.query.get(id)
     if not category:
@@ -25,21 +74,20 @@ def get_by_id(id: str) -> Category:
     return category
 
 
-def update(id: str, data: Dict[str, str]) -> Category:
+def update(id: str, data: Dict[str, str], partial: bool = False) -> Category:
     try:
         category = get_by_id(id)
         if not category:
             raise IdNotExistError()
-        category.active = data.get('active')
-        category.name = data.get('name')
-
-        validating_empty_fields([], **category.serialize())
-        validating_if_field_is_not_str(['active', 'on_create', 'on_update'], **category.serialize())
-        validating_if_field_is_bool(['active'], **category.serialize())
-        validating_if_field_is_alpha(['name'], **category.serialize())
-        validating_size_of_fields(**category.serialize())
-        validating_if_field_is_float(['profit_percentage'], **category.serialize())
+        changes = extracting_changes(UPDATE_FIELDS, data, partial, list_of_fields_not_mandatory=['active', 'profit_percentage'])
+        UPDATE_SCHEMA.validate(changes)
+        changed_fields = update_fields(category, changes)
+        if not changed_fields:
+            return category
+        if 'profit_percentage' in changed_fields:
+            reprice_category(id)
         commit()
+        response_cache.invalidate('categories', id)
         return category
 
     except AttributeError:
@@ -48,24 +96,71 @@ def update(id: str, data: Dict[str, str]) -> Category:
         raise RepeatedValueError([data['name']])
 
 
-def inserting_categories_names_from_the_csv_file_in_db(csv_file: StringIO, field: str) -> List[Category]:
+def reprice(id: str, data: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+    category = get_by_id(id)
+    try:
+        changes = extracting_changes(['profit_percentage'], data or {}, partial=True)
+    except AttributeError:
+        validating_if_json_is_correct(['profit_percentage'])
+    UPDATE_SCHEMA.validate(changes)
+    update_fields(category, changes)
+    report = reprice_category(id)
+    commit()
+    response_cache.invalidate('categories', id)
+    return report
+
+
+def import_categories(csv_file: TextIO, progress: Callable[[int], Any] = lambda rows: None,
+                      dry_run: bool = False) -> Dict[str, Any]:
+    started_at = time.perf_counter()
+    if dry_run:
+        return dry_run_import(csv_file, 'name', started_at)
+    categories = inserting_categories_names_from_the_csv_file_in_db(csv_file, 'name')
+    progress(len(categories))
+    return import_report(started_at, inserted=len(categories))
+
+
+def dry_run_import(csv_file: TextIO, field: str, started_at: float,
+                   chunk_size: int = IMPORT_CHUNK_SIZE) -> Dict[str, Any]:
+    names_in_file = set()
+    new_names = []
+    rows = 0
+    for categories_csv in chunked(iter_csv_file(csv_file, field), chunk_size):
+        rows += len(categories_csv)
+        names = {category_csv[field] for category_csv in categories_csv} - names_in_file
+        names_in_file |= names
+        saved_name = func.lower(func.trim(Category.name))
+        saved_names = {name for name, in db.session.query(saved_name).filter(saved_name.in_(names))}
+        new_names += sorted(names - saved_names)
+    report = import_report(started_at, inserted=len(new_names), skipped=rows - len(new_names))
+    return dry_run_report(report, [{'action': 'insert', 'name': name} for name in new_names[:DRY_RUN_SAMPLE_SIZE]])
+
+
+def inserting_categories_names_from_the_csv_file_in_db(csv_file: TextIO, field: str) -> List[Category]:
     new_categories_list = []
-    list_of_names_saved_in_db = []
+    list_of_names_saved_in_db = set()
     get_categories = get()
     for category in get_categories:
-        list_of_names_saved_in_db.append(category.name.strip().lower())
+        list_of_names_saved_in_db.add(category.name.strip().lower())
     validating_if_the_category_name_already_exists_in_the_db(csv_file, field, list_of_names_saved_in_db, new_categories_list)
     if not new_categories_list:
         raise DataAlreadyExistsError()
+    response_cache.invalidate('categories')
     return new_categories_list
 
 
-def validating_if_the_category_name_already_exists_in_the_db(csv_file: StringIO, field: str,
-                                                             list_of_names_saved_in_db: list,
+def validating_if_the_category_name_already_exists_in_the_db(csv_file: TextIO, field: str,
+                                                             list_of_names_saved_in_db: set,
                                                              new_categories_list: list) -> NoReturn:
-    for category_csv in import_csv_file(csv_file, field):
-        if category_csv[field] not in list_of_names_saved_in_db:
-            try:
-                new_categories_list.append(save(Category(name=category_csv[field])))
-            except SQLAlchemyError:
-                raise RepeatedDataError([category_csv[field]])
+    try:
+        with unit_of_work() as work:
+            for category_csv in iter_csv_file(csv_file, field):
+                if category_csv[field] not in list_of_names_saved_in_db:
+                    try:
+                        new_categories_list.append(save(Category(name=category_csv[field])))
+                        work.flush()
+                    except SQLAlchemyError:
+                        raise RepeatedDataError([category_csv[field]])
+                    list_of_names_saved_in_db.add(category_csv[field])
+    except SQLAlchemyError:
+        raise RepeatedDataError([category.name for category in new_categories_list])
@@ -0,0 +1,19 @@
+import click
+from flask.cli import with_appcontext
+from werkzeug.exceptions import HTTPException
+
+from app.domains.categories.actions import reprice
+
+
+@click.command('reprice-category')
+@click.argument('category_id')
+@click.option('--profit-percentage', type=float, help='New profit percentage of the category.')
+@with_appcontext
+def reprice_category_command(category_id: str, profit_percentage: float) -> None:
+    data = {} if profit_percentage is None else {'profit_percentage': profit_percentage}
+    try:
+        report = reprice(category_id, data)
+    except HTTPException as error:
+        raise click.ClickException(error.description)
+    click.echo(f"Repriced {report['repriced_products']} products of the category {category_id} "
+               f"in {report['seconds']} seconds")
@@ -2,12 +2,16 @@ from uuid import uuid4
 
 from database import db
 from app.validations.validations import *
+from app.validations.schemas import *
 
 MAX_NAME_LENGTH: int = 80
 
 
 class Category(db.Model):
     __tablename__ = 'categories'
+    __table_args__ = (
+        db.Index('ix_categories_on_create_id', 'on_create', 'id'),
+    )
 
     id = db.Column(db.String(36), default=lambda: str(uuid4()), primary_key=True)
     active = db.Column(db.Boolean(), default=True)
@@ -28,12 +32,18 @@ class Category(db.Model):
 
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
-        validating_empty_fields([], **kwargs)
-        validating_if_field_is_not_str(['active', 'on_create', 'on_update','profit_percentage'], **kwargs)
-        validating_if_field_is_bool(['active'], **kwargs)
-        validating_if_field_is_alpha(['name'], **kwargs)
-        validating_if_field_is_float(['profit_percentage'], **kwargs)
-        validating_size_of_fields(**kwargs)
+        CATEGORY_SCHEMA.validate(kwargs)
+
+
+CATEGORY_SCHEMA = Schema(
+    empty_fields([]),
+    str_fields(['active', 'on_create', 'on_update', 'profit_percentage']),
+    bool_fields(['active']),
+    alpha_fields(['name']),
+    float_fields(['profit_percentage']),
+    maximum_size_fields({'name': MAX_NAME_LENGTH}),
+    fields=Category.__table__.columns.keys()
+)
 
 
 def validating_size_of_fields(**data: Dict[str, Union[bool, str]]) -> NoReturn:
@@ -1,13 +1,25 @@
-from flask import Blueprint, jsonify, request
-from typing import Tuple, Any
-import io
+from flask import Blueprint, Response, jsonify, request
+from typing import Tuple, Any, Dict
 
-from app.domains.export_csv.actions import create_csv_file, send_csv_file
+from app.domains.export_csv.actions import stream_csv_file
 from app.exceptions.exceptions_of_import import NoFileError
+from app.domains.import_csv.actions import open_csv_stream
+from app.domains.import_csv.views import submitted_job
+from app.conditional import conditional_response
+from database.batch import batch_status
+from database.pagination import parse_page_arguments, next_page_headers
 from app.domains.categories.actions import get as get_category, \
     create as create_category, update as update_category, \
     get_by_id as get_category_by_id, \
+    get_in_batches as get_categories_in_batches, \
+    get_page as get_category_page, \
+    get_page_version as get_category_page_version, \
+    get_version as get_category_version, \
+    create_many as create_categories_batch, \
+    reprice as reprice_category, \
+    PAGE_FIELDS as CATEGORY_PAGE_FIELDS, \
     inserting_categories_names_from_the_csv_file_in_db as insert_data, \
+    import_categories, \
     validating_if_json_is_correct
 
 
@@ -24,6 +36,12 @@ def post() -> Tuple[Any, int]:
         validating_if_json_is_correct(['name'])
 
 
+@app_categories.route('/categories:batch', methods=['POST'])
+def batch() -> Tuple[Any, int]:
+    report = create_categories_batch(request.get_json(), atomic=request.args.get('atomic', 'true').lower() != 'false')
+    return jsonify(report), batch_status(report)
+
+
 @app_categories.route('/categories/<id>', methods=['PUT'])
 def put(id: str) -> Tuple[Any, int]:
     payload = request.get_json()
@@ -31,22 +49,38 @@ def put(id: str) -> Tuple[Any, int]:
     return jsonify(category.serialize()), 200
 
 
+@app_categories.route('/categories/<id>', methods=['PATCH'])
+def patch(id: str) -> Tuple[Any, int]:
+    payload = request.get_json()
+    category = update_category(id, payload, partial=True)
+    return jsonify(category.serialize()), 200
+
+
+@app_categories.route('/categories/<id>:reprice', methods=['POST'])
+def reprice(id: str) -> Tuple[Any, int]:
+    payload = request.get_json(silent=True)
+    return jsonify(reprice_category(id, payload)), 200
+
+
 @app_categories.route('/categories', methods=['GET'])
-def get() -> Tuple[Any, int]:
-    return jsonify([category.serialize() for category in get_category()]), 200
+def get() -> Response:
+    arguments = parse_page_arguments(request.args, CATEGORY_PAGE_FIELDS)
+
+    def build() -> Tuple[Any, int, Dict[str, str]]:
+        categories, next_cursor = get_category_page(**arguments)
+        return jsonify(categories), 200, next_page_headers(next_cursor)
+
+    return conditional_response(get_category_page_version(), build)
 
 
 @app_categories.route('/categories/<id>', methods=['GET'])
-def get_by_id(id: str) -> Tuple[Any, int]:
-    category = get_category_by_id(id)
-    return jsonify(category.serialize()), 200
+def get_by_id(id: str) -> Response:
+    return conditional_response(get_category_version(id), lambda: (jsonify(get_category_by_id(id).serialize()), 200))
 
 
 @app_categories.route('/categories:export', methods=['GET'])
 def export() -> Tuple[Any, int]:
-    category_list = get_category()
-    csv_file = create_csv_file([category.serialize() for category in category_list])
-    return send_csv_file(csv_file, 'Categories')
+    return stream_csv_file((category.serialize() for category in get_categories_in_batches()), 'Categories')
 
 
 @app_categories.route('/categories:import', methods=['POST'])
@@ -55,6 +89,11 @@ def import_route():
         file = request.files['data_file']
     except:
         raise NoFileError()
-    stream = io.StringIO(file.stream.read().decode("utf-8"))
+    dry_run = request.args.get('dry_run', 'false').lower() == 'true'
+    if request.args.get('async', 'false').lower() == 'true':
+        return submitted_job('categories', file.stream, {'dry_run': dry_run})
+    stream = open_csv_stream(file.stream)
+    if dry_run:
+        return jsonify(import_categories(stream, dry_run=True)), 200
     insert_data(stream, 'name')
     return jsonify([category.serialize() for category in get_category()]), 200
@@ -1,20 +1,64 @@
+from typing import Any, Optional, Tuple
 from sqlalchemy.exc import SQLAlchemyError
 
 from app.domains.category_lines.models import *
-from database.repository import save, commit
-from app.domains.categories.actions import get_by_id as get_category_by_id
+from app.cache import response_cache
+from app.domains.products.models import Product
+from app.domains.products.pricing import refresh_final_costs
+from app.validations.schemas import *
+from app.conditional import collection_version, item_version, Version
+from database.batch import insert_batch
+from database.repository import save, commit, update_fields
+from database.pagination import paginate, columns_of
+
+
+PAGE_FIELDS: List[str] = ['id', 'active', 'profit_percentage', 'category_line', 'category_id', 'on_create',
+                          'on_update']
+CREATE_FIELDS: List[str] = ['category_line', 'category_id', 'profit_percentage']
+UPDATE_FIELDS: List[str] = ['category_line', 'category_id', 'profit_percentage']
+UPDATE_SCHEMA = Schema(
+    empty_fields([]),
+    str_fields(['active', 'on_create', 'on_update', 'profit_percentage']),
+    bool_fields(['active']),
+    maximum_size_fields({'category_line': MAX_CATEGORY_LINE_LENGTH, 'category_id': MAX_CATEGORY_ID_LENGTH}),
+    float_fields(['profit_percentage']),
+    fields=UPDATE_FIELDS
+)
+
 
 def create(data: Dict[str, str]) -> CategoryLine:
     try:
-        return save(CategoryLine(category_line=data['category_line'], category_id=data['category_id'],profit_percentage=data['profit_percentage']))
+        category_line = save(CategoryLine(category_line=data['category_line'], category_id=data['category_id'],profit_percentage=data['profit_percentage']))
     except SQLAlchemyError:
         raise InvalidValueError(['category_line'])
+    response_cache.invalidate('category_lines')
+    return category_line
+
+
+def create_many(data: List[Dict[str, Any]], atomic: bool = True) -> Dict[str, Any]:
+    report = insert_batch(CategoryLine, data, CREATE_FIELDS, CATEGORY_LINE_SCHEMA.validate,
+                          unique_field='category_line', atomic=atomic)
+    if report['created']:
+        response_cache.invalidate('category_lines')
+    return report
 
 
 def get() -> List[CategoryLine]:
     return CategoryLine.query.all()
 
 
+def get_page(fields: List[str], limit: int, after: Optional[str]) -> Tuple[List[Dict[str, Any]], Optional[str]]:
+    return paginate(CategoryLine.query, columns_of(CategoryLine, PAGE_FIELDS), fields, limit, after)
+
+
+def get_page_version() -> Version:
+    return collection_version(CategoryLine.query, CategoryLine)
+
+
+def get_version(id: str) -> Optional[Version]:
+    return item_version(CategoryLine, id)
+
+
 def get_by_id(id: str) -> CategoryLine:
     category_line = CategoryLine.query.get(id)
     if not category_line:
@@ -22,28 +66,20 @@ def get_by_id(id: str) -> CategoryLine:
     return category_line
 
 
-def get_category_percentage(id: str) -> float:
-    category_line = get_by_id(id)
-    category = get_category_by_id(category_line.category_id)
-    percentage = category.profit_percentage
-    return percentage
-
-
-def update(id: str, data: Dict[str, str]) -> CategoryLine:
+def update(id: str, data: Dict[str, str], partial: bool = False) -> CategoryLine:
     try:
         category_line = get_by_id(id)
         if not category_line:
             raise IdNotExistError()
-        category_line.category_line = data.get("category_line")
-        category_line.category_id = data.get("category_id")
-        category_line.profit_percentage = data.get("profit_percentage")
-
-        validating_empty_fields([], **category_line.serialize())
-        validating_if_field_is_not_str(['active', 'on_create', 'on_update', 'profit_percentage'], **category_line.serialize())
-        validating_if_field_is_bool(['active'], **category_line.serialize())
-        validating_size_of_fields(**category_line.serialize())
-        validating_if_field_is_float(['profit_percentage'], **category_line.serialize())
+        changes = extracting_changes(UPDATE_FIELDS, data, partial, list_of_fields_not_mandatory=['profit_percentage'])
+        UPDATE_SCHEMA.validate(changes)
+        changed_fields = update_fields(category_line, changes)
+        if not changed_fields:
+            return category_line
+        if changed_fields.keys() & {'profit_percentage', 'category_id'}:
+            refresh_final_costs(Product.category_line_id == id)
         commit()
+        response_cache.invalidate('category_lines', id)
         return category_line
 
     except AttributeError:
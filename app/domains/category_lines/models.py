@@ -3,6 +3,7 @@ from uuid import uuid4
 from database import db
 from app.domains.categories.models import Category
 from app.validations.validations import *
+from app.validations.schemas import *
 
 MAX_CATEGORY_LINE_LENGTH: int = 100
 MAX_CATEGORY_ID_LENGTH: int = 36
@@ -10,13 +11,16 @@ MAX_CATEGORY_ID_LENGTH: int = 36
 
 class CategoryLine(db.Model):
     __tablename__ = 'category_lines'
+    __table_args__ = (
+        db.Index('ix_category_lines_on_create_id', 'on_create', 'id'),
+    )
 
     id = db.Column(db.String(36), default=lambda: str(uuid4()), primary_key=True)
     active = db.Column(db.Boolean(), default=True)
     category_line = db.Column(db.String(100), unique=True, nullable=False)
     category = db.relationship(Category)
     profit_percentage = db.Column(db.Float(), nullable=False)
-    category_id = db.Column(db.String(36), db.ForeignKey(Category.id), nullable=False)
+    category_id = db.Column(db.String(36), db.ForeignKey(Category.id), nullable=False, index=True)
     on_create = db.Column(db.DateTime, default=datetime.datetime.now)
     on_update = db.Column(db.DateTime, default=datetime.datetime.now, onupdate=datetime.datetime.now)
 
@@ -33,11 +37,17 @@ class CategoryLine(db.Model):
 
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
-        validating_empty_fields([], **kwargs)
-        validating_if_field_is_not_str(['active', 'on_create', 'on_update','profit_percentage'], **kwargs)
-        validating_if_field_is_bool(['active'], **kwargs)
-        validating_if_field_is_float(['profit_percentage'], **kwargs)
-        validating_size_of_fields(**kwargs)
+        CATEGORY_LINE_SCHEMA.validate(kwargs)
+
+
+CATEGORY_LINE_SCHEMA = Schema(
+    empty_fields([]),
+    str_fields(['active', 'on_create', 'on_update', 'profit_percentage']),
+    bool_fields(['active']),
+    float_fields(['profit_percentage']),
+    maximum_size_fields({'category_line': MAX_CATEGORY_LINE_LENGTH, 'category_id': MAX_CATEGORY_ID_LENGTH}),
+    fields=CategoryLine.__table__.columns.keys()
+)
 
 
 def validating_size_of_fields(**data: Dict[str, Union[bool, str]]) -> NoReturn:
@@ -1,11 +1,18 @@
-from flask import Blueprint, request, jsonify
-from typing import Tuple, Any
+from flask import Blueprint, Response, request, jsonify
+from typing import Tuple, Any, Dict
 
 from app.domains.category_lines.actions import get_by_id as get_by_id_category_line, \
-    get as get_category_line, \
     create as create_category_line, \
     update as update_category_line, \
+    get_page as get_category_line_page, \
+    get_page_version as get_category_line_page_version, \
+    get_version as get_category_line_version, \
+    create_many as create_category_lines_batch, \
+    PAGE_FIELDS as CATEGORY_LINE_PAGE_FIELDS, \
     validating_if_json_is_correct
+from app.conditional import conditional_response
+from database.batch import batch_status
+from database.pagination import parse_page_arguments, next_page_headers
 
 
 app_categories_line = Blueprint('app.categories_line', __name__)
@@ -21,6 +28,13 @@ def post() -> Tuple[Any, int]:
         validating_if_json_is_correct(['category_line'])
 
 
+@app_categories_line.route('/category_line:batch', methods=['POST'])
+def batch() -> Tuple[Any, int]:
+    report = create_category_lines_batch(request.get_json(),
+                                         atomic=request.args.get('atomic', 'true').lower() != 'false')
+    return jsonify(report), batch_status(report)
+
+
 @app_categories_line.route('/category_line/<id>', methods=['PUT'])
 def put(id: str) -> Tuple[Any, int]:
     payload = request.get_json()
@@ -28,12 +42,25 @@ def put(id: str) -> Tuple[Any, int]:
     return jsonify(category_line.serialize()), 200
 
 
+@app_categories_line.route('/category_line/<id>', methods=['PATCH'])
+def patch(id: str) -> Tuple[Any, int]:
+    payload = request.get_json()
+    category_line = update_category_line(id, payload, partial=True)
+    return jsonify(category_line.serialize()), 200
+
+
 @app_categories_line.route('/category_line', methods=['GET'])
-def get() -> Tuple[Any, int]:
-    return jsonify([category_line.serialize() for category_line in get_category_line()]), 200
+def get() -> Response:
+    arguments = parse_page_arguments(request.args, CATEGORY_LINE_PAGE_FIELDS)
+
+    def build() -> Tuple[Any, int, Dict[str, str]]:
+        category_lines, next_cursor = get_category_line_page(**arguments)
+        return jsonify(category_lines), 200, next_page_headers(next_cursor)
+
+    return conditional_response(get_category_line_page_version(), build)
 
 
 @app_categories_line.route('/category_line/<id>', methods=['GET'])
-def get_by_id(id: str) -> Tuple[Any, int]:
-    category_line = get_by_id_category_line(id)
-    return jsonify(category_line.serialize()), 200
+def get_by_id(id: str) -> Response:
+    return conditional_response(get_category_line_version(id),
+                                lambda: (jsonify(get_by_id_category_line(id).serialize()), 200))
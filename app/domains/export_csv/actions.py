@@ -1,25 +1,34 @@
 import csv
 import io
-from typing import Dict, List, Any
-from flask import make_response
+from typing import Dict, Any, Iterable, Iterator
+from flask import Response, stream_with_context
 
 from app.exceptions.exceptions_of_export import InvalidExportError
 
+EXPORT_BATCH_SIZE: int = 1000
+EXPORT_BUFFER_SIZE: int = 64 * 1024
 
-def create_csv_file(list_of_registries: List[Dict[str, Any]]):
-    if not list_of_registries:
-        raise InvalidExportError()
-    csv_file = io.StringIO()
-    fieldnames = [key for key in list_of_registries[0].keys()]
-    writer = csv.DictWriter(csv_file, fieldnames=fieldnames)
-    writer.writeheader()
-    for row in list_of_registries:
-        writer.writerow(row)
-    return csv_file
 
-
-def send_csv_file(csv_file: io.StringIO, filename: str):
-    output = make_response(csv_file.getvalue())
+def stream_csv_file(registries: Iterable[Dict[str, Any]], filename: str) -> Response:
+    registries = iter(registries)
+    first_registry = next(registries, None)
+    if first_registry is None:
+        raise InvalidExportError()
+    output = Response(stream_with_context(_generate_csv_rows(first_registry, registries)))
     output.headers["Content-Disposition"] = f"attachment; filename={filename}.csv"
     output.headers["Content-type"] = "text/csv"
     return output
+
+
+def _generate_csv_rows(first_registry: Dict[str, Any], registries: Iterator[Dict[str, Any]]) -> Iterator[str]:
+    buffer = io.StringIO()
+    writer = csv.DictWriter(buffer, fieldnames=[key for key in first_registry.keys()])
+    writer.writeheader()
+    writer.writerow(first_registry)
+    for registry in registries:
+        writer.writerow(registry)
+        if buffer.tell() >= EXPORT_BUFFER_SIZE:
+            yield buffer.getvalue()
+            buffer.seek(0)
+            buffer.truncate()
+    yield buffer.getvalue()
@@ -0,0 +1,30 @@
+import time
+from typing import Any, Dict
+
+from sqlalchemy import text
+from sqlalchemy.exc import SQLAlchemyError
+
+from database import db
+
+POOL_COUNTERS = ('size', 'checkedin', 'checkedout', 'overflow')
+
+
+def get_database_health() -> Dict[str, Any]:
+    started_at = time.perf_counter()
+    try:
+        db.session.execute(text('SELECT 1'))
+        status = 'ok'
+    except SQLAlchemyError:
+        status = 'unavailable'
+    finally:
+        db.session.rollback()
+    latency_ms = round((time.perf_counter() - started_at) * 1000, 3)
+    return {'status': status, 'latency_ms': latency_ms, 'pool': pool_status(db.engine.pool)}
+
+
+def pool_status(pool) -> Dict[str, Any]:
+    status = {'type': type(pool).__name__}
+    for counter in POOL_COUNTERS:
+        if callable(getattr(pool, counter, None)):
+            status[counter] = getattr(pool, counter)()
+    return status
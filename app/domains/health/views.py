@@ -0,0 +1,12 @@
+from flask import Blueprint, jsonify
+from typing import Tuple, Any
+
+from app.domains.health.actions import get_database_health
+
+app_health = Blueprint('app.health', __name__)
+
+
+@app_health.route('/health/db', methods=['GET'])
+def get_db() -> Tuple[Any, int, dict]:
+    health = get_database_health()
+    return jsonify(health), 200 if health['status'] == 'ok' else 503, {'Cache-Control': 'no-store'}
@@ -1,40 +1,118 @@
 import csv
-from io import StringIO
-from typing import Dict
+import io
+import time
+from typing import Any, BinaryIO, Callable, Dict, Iterator, TextIO, Tuple, Union
 
 from app.exceptions.exceptions_of_import import *
 
+IMPORT_CHUNK_SIZE: int = 1000
+DRY_RUN_SAMPLE_SIZE: int = 10
+PRODUCT_CONVERTERS: Dict[str, Callable[[str], Any]] = {
+    'name': lambda value: value.strip().lower(), 'cost_values': float, 'unit_box': int, 'weight_unit': float,
+    'validity': str, 'sku': str, 'description': str, 'category_line_id': lambda value: value.strip().lower(),
+    'supplier_id': str
+}
+PRODUCT_COLUMNS: List[str] = list(PRODUCT_CONVERTERS)
 
-def import_csv_file(csv_file: StringIO, field: str) -> List[Dict[str, str]]:
+
+class _ReadableStream(io.RawIOBase):
+    def __init__(self, stream: BinaryIO):
+        super().__init__()
+        self._stream = stream
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, buffer) -> int:
+        data = self._stream.read(len(buffer))
+        buffer[:len(data)] = data
+        return len(data)
+
+
+def open_csv_stream(stream: BinaryIO, encoding: str = 'utf-8') -> TextIO:
+    if not hasattr(stream, 'readable'):
+        stream = io.BufferedReader(_ReadableStream(stream))
+    return io.TextIOWrapper(stream, encoding=encoding, newline='')
+
+
+def import_csv_file(csv_file: TextIO, field: str) -> List[Dict[str, str]]:
+    return list(iter_csv_file(csv_file, field))
+
+
+def iter_csv_file(csv_file: TextIO, field: str) -> Iterator[Dict[str, str]]:
     try:
-        csv_list = []
-        ordered_dict = csv.DictReader(csv_file, delimiter=',')
-        for column in ordered_dict:
-            csv_dictionary = {field: column[field].strip().lower()}
-            csv_list.append(csv_dictionary)
-        if not csv_list:
+        is_empty = True
+        for column in csv.DictReader(csv_file, delimiter=','):
+            is_empty = False
+            yield {field: column[field].strip().lower()}
+        if is_empty:
             raise DataAlreadyExistsError()
-        return csv_list
     except KeyError:
         raise ColumnsError()
 
 
-def import_product_csv_file(csv_file: StringIO) -> List[Dict[str, str]]:
+def import_product_csv_file(csv_file: TextIO) -> List[Dict[str, Union[float, int, str]]]:
+    return list(iter_product_csv_file(csv_file))
+
+
+def iter_product_csv_file(csv_file: TextIO) -> Iterator[Dict[str, Union[float, int, str]]]:
     try:
-        csv_list = []
-        ordered_dict = csv.DictReader(csv_file, delimiter=',')
-        for column in ordered_dict:
-            csv_dictionary = {'name': column['name'].strip().lower(), 'cost_values': float(column['cost_values']),
-                              'unit_box': int(column['unit_box']),
-                              'weight_unit': float(column['weight_unit']), 'validity': column['validity'],
-                              'sku': column['sku'], 'description': column['description'],
-                              'category_line_id': column['category_line_id'].strip().lower(),
-                              'supplier_id': column['supplier_id']}
-            csv_list.append(csv_dictionary)
-        if not csv_list:
+        is_empty = True
+        for column in csv.DictReader(csv_file, delimiter=','):
+            is_empty = False
+            yield product_row(column)
+        if is_empty:
             raise DataAlreadyExistsError()
-        return csv_list
     except KeyError:
         raise ColumnsError()
     except ValueError:
         raise ConversionError()
+
+
+def product_row(column: Dict[str, str]) -> Dict[str, Union[float, int, str]]:
+    try:
+        return {field: convert(column[field]) for field, convert in PRODUCT_CONVERTERS.items()}
+    except KeyError:
+        raise ColumnsError()
+    except ValueError:
+        raise ConversionError()
+
+
+def product_row_errors(column: Dict[str, str]) -> List[Tuple[str, Exception]]:
+    errors = []
+    for field, convert in PRODUCT_CONVERTERS.items():
+        if field not in column:
+            errors.append((field, ColumnsError()))
+            continue
+        try:
+            convert(column[field])
+        except ValueError:
+            errors.append((field, ConversionError()))
+    return errors
+
+
+def iter_numbered_csv_rows(csv_file: TextIO, columns: List[str]) -> Iterator[Tuple[int, Dict[str, str]]]:
+    reader = csv.reader(csv_file, delimiter=',')
+    header = next(reader, None)
+    if header is None:
+        raise DataAlreadyExistsError()
+    if set(columns) - set(header):
+        raise ColumnsError()
+    is_empty = True
+    line = reader.line_num
+    for row in reader:
+        if row:
+            is_empty = False
+            yield line + 1, dict(zip(header, row))
+        line = reader.line_num
+    if is_empty:
+        raise DataAlreadyExistsError()
+
+
+def import_report(started_at: float, **rows: int) -> Dict[str, Union[int, float]]:
+    seconds = max(time.perf_counter() - started_at, 1e-9)
+    return {**rows, 'seconds': round(seconds, 3), 'rows_per_second': round(sum(rows.values()) / seconds, 2)}
+
+
+def dry_run_report(report: Dict[str, Any], sample: List[Dict[str, Any]]) -> Dict[str, Any]:
+    return {**report, 'dry_run': True, 'sample': sample}
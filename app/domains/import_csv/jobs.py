@@ -0,0 +1,181 @@
+import datetime
+import importlib
+import json
+import os
+import re
+import shutil
+import tempfile
+import time
+from concurrent.futures import Executor, Future, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Any, BinaryIO, Callable, Dict, Optional
+
+from werkzeug.exceptions import HTTPException
+
+from app.cache import response_cache
+from app.domains.import_csv.actions import open_csv_stream
+from app.exceptions.exceptions_of_import import JobNotExistError, ImportKindError
+from database import db
+
+DEFAULT_SPOOL_DIR: str = os.path.join(tempfile.gettempdir(), 'flask-api-imports')
+DEFAULT_WORKERS: int = 2
+DEFAULT_JOB_TTL: int = 86400
+FINISHED_STATUSES = ('finished', 'failed')
+JOB_ID_PATTERN = re.compile(r'^[0-9a-f]{32}$')
+IMPORTERS: Dict[str, str] = {
+    'products': 'app.domains.products.actions.import_products',
+    'products_by_supplier': 'app.domains.products.actions.import_products_by_supplier',
+    'categories': 'app.domains.categories.actions.import_categories',
+}
+CACHED_COLLECTIONS: Dict[str, str] = {
+    'categories': 'categories',
+}
+
+_worker_app = None
+
+
+class ImportJobs:
+    def __init__(self):
+        self._app = None
+        self._spool_dir = DEFAULT_SPOOL_DIR
+        self._job_ttl = DEFAULT_JOB_TTL
+        self._executor: Optional[Executor] = None
+        self._futures: Dict[str, Future] = {}
+
+    def init_app(self, app) -> None:
+        self._app = app
+        self._spool_dir = app.config.get('IMPORT_SPOOL_DIR') or DEFAULT_SPOOL_DIR
+        os.makedirs(self._spool_dir, exist_ok=True)
+        self._job_ttl = int(app.config.get('IMPORT_JOB_TTL', DEFAULT_JOB_TTL))
+        remove_expired_jobs(self._spool_dir, self._job_ttl)
+        if self._executor is None:
+            self._executor = _create_executor(app.config)
+        app.extensions['import_jobs'] = self
+
+    def submit(self, kind: str, stream: BinaryIO, **options: Any) -> Dict[str, Any]:
+        if kind not in IMPORTERS:
+            raise ImportKindError(list(IMPORTERS))
+        remove_expired_jobs(self._spool_dir, self._job_ttl)
+        job_id = os.urandom(16).hex()
+        with open(_spool_path(self._spool_dir, job_id), 'wb') as spool_file:
+            shutil.copyfileobj(stream, spool_file)
+        status = {'id': job_id, 'kind': kind, 'status': 'queued', 'rows': 0, 'rows_per_second': 0.0, 'errors': [],
+                  'report': None, 'created_at': _now()}
+        write_status(self._spool_dir, status)
+        if isinstance(self._executor, ProcessPoolExecutor):
+            future = self._executor.submit(run_job, self._spool_dir, job_id, kind, options)
+            if kind in CACHED_COLLECTIONS:
+                future.add_done_callback(lambda _: response_cache.invalidate(CACHED_COLLECTIONS[kind]))
+        else:
+            future = self._executor.submit(self._run_in_context, job_id, kind, options)
+        self._futures[job_id] = future
+        future.add_done_callback(lambda _: self._futures.pop(job_id, None))
+        return status
+
+    def get(self, job_id: str) -> Dict[str, Any]:
+        return read_status(self._spool_dir, job_id)
+
+    def wait(self, job_id: str, timeout: Optional[float] = None) -> Dict[str, Any]:
+        future = self._futures.get(job_id)
+        if future:
+            future.result(timeout)
+        return self.get(job_id)
+
+    def _run_in_context(self, job_id: str, kind: str, options: Dict[str, Any]) -> None:
+        with self._app.app_context():
+            _run(self._spool_dir, job_id, kind, options)
+
+
+def _create_executor(config: Dict[str, Any]) -> Executor:
+    workers = int(config.get('IMPORT_WORKERS', DEFAULT_WORKERS))
+    if config.get('IMPORT_EXECUTOR', 'thread') == 'process':
+        return ProcessPoolExecutor(max_workers=workers)
+    return ThreadPoolExecutor(max_workers=workers, thread_name_prefix='import')
+
+
+def run_job(spool_dir: str, job_id: str, kind: str, options: Dict[str, Any]) -> None:
+    global _worker_app
+    if _worker_app is None:
+        from app import create_app
+        _worker_app = create_app()
+    with _worker_app.app_context():
+        _run(spool_dir, job_id, kind, options)
+
+
+def _run(spool_dir: str, job_id: str, kind: str, options: Dict[str, Any]) -> None:
+    status = read_status(spool_dir, job_id)
+    started_at = time.perf_counter()
+
+    def progress(rows: int) -> None:
+        seconds = max(time.perf_counter() - started_at, 1e-9)
+        status.update({'rows': rows, 'rows_per_second': round(rows / seconds, 2)})
+        write_status(spool_dir, status)
+
+    status.update({'status': 'running', 'started_at': _now()})
+    write_status(spool_dir, status)
+    importer = _importer(kind)
+    try:
+        with open(_spool_path(spool_dir, job_id), 'rb') as spool_file:
+            report = importer(open_csv_stream(spool_file), progress=progress, **options)
+        status.update({'status': 'finished', 'report': report,
+                       'rows_per_second': report.get('rows_per_second', status['rows_per_second'])})
+    except HTTPException as error:
+        status.update({'status': 'failed', 'errors': [error.description]})
+    except Exception as error:
+        status.update({'status': 'failed', 'errors': [f'{type(error).__name__}: {error}']})
+    finally:
+        db.session.remove()
+        os.remove(_spool_path(spool_dir, job_id))
+    status['finished_at'] = _now()
+    write_status(spool_dir, status)
+
+
+def _importer(kind: str) -> Callable[..., Dict[str, Any]]:
+    module, function = IMPORTERS[kind].rsplit('.', 1)
+    return getattr(importlib.import_module(module), function)
+
+
+def read_status(spool_dir: str, job_id: str) -> Dict[str, Any]:
+    if not JOB_ID_PATTERN.match(job_id or ''):
+        raise JobNotExistError()
+    try:
+        with open(_status_path(spool_dir, job_id), encoding='utf-8') as status_file:
+            return json.load(status_file)
+    except (FileNotFoundError, ValueError):
+        raise JobNotExistError()
+
+
+def write_status(spool_dir: str, status: Dict[str, Any]) -> None:
+    path = _status_path(spool_dir, status['id'])
+    with open(f'{path}.tmp', 'w', encoding='utf-8') as status_file:
+        json.dump(status, status_file)
+    os.replace(f'{path}.tmp', path)
+
+
+def remove_expired_jobs(spool_dir: str, ttl: int) -> None:
+    expires_before = time.time() - ttl
+    for name in os.listdir(spool_dir):
+        path = os.path.join(spool_dir, name)
+        try:
+            if not name.endswith('.json') or os.path.getmtime(path) >= expires_before:
+                continue
+            with open(path, encoding='utf-8') as status_file:
+                if json.load(status_file).get('status') not in FINISHED_STATUSES:
+                    continue
+            os.remove(path)
+        except (OSError, ValueError):
+            continue
+
+
+def _spool_path(spool_dir: str, job_id: str) -> str:
+    return os.path.join(spool_dir, f'{job_id}.csv')
+
+
+def _status_path(spool_dir: str, job_id: str) -> str:
+    return os.path.join(spool_dir, f'{job_id}.json')
+
+
+def _now() -> str:
+    return datetime.datetime.now().isoformat()
+
+
+import_jobs = ImportJobs()
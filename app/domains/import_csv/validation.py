@@ -0,0 +1,25 @@
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from typing import Callable, Iterable, Iterator, List, TypeVar
+
+from database.repository import chunked
+
+Row = TypeVar('Row')
+Result = TypeVar('Result')
+
+
+def validate_in_processes(rows: Iterable[Row], validate_chunk: Callable[[List[Row]], Result], chunk_size: int,
+                          workers: int) -> Iterator[Result]:
+    executor = ProcessPoolExecutor(max_workers=workers)
+    pending = deque()
+    try:
+        for chunk in chunked(rows, chunk_size):
+            pending.append(executor.submit(validate_chunk, chunk))
+            if len(pending) >= workers * 2:
+                yield pending.popleft().result()
+        while pending:
+            yield pending.popleft().result()
+    finally:
+        for future in pending:
+            future.cancel()
+        executor.shutdown(wait=True)
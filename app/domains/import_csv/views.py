@@ -1,4 +1,43 @@
-from flask import Blueprint
+import csv
+import io
+
+from flask import Blueprint, Response, jsonify, request
+from typing import Tuple, Any, BinaryIO, Dict
+
+from app.domains.import_csv.jobs import import_jobs
 
 
 app_import_csv = Blueprint('app.import_csv', __name__)
+
+
+@app_import_csv.route('/imports/<job_id>', methods=['GET'])
+def get_job(job_id: str) -> Tuple[Any, int]:
+    job = import_jobs.get(job_id)
+    if job['report'] is not None and _wants_csv_report(job['report']):
+        return import_response(job['report'])
+    return jsonify(job), 200
+
+
+def import_response(report: Dict[str, Any]) -> Tuple[Any, int]:
+    if not _wants_csv_report(report):
+        return jsonify(report), 200
+    csv_file = io.StringIO()
+    writer = csv.DictWriter(csv_file, fieldnames=['line', 'column', 'error'])
+    writer.writeheader()
+    writer.writerows(report['errors'])
+    output = Response(csv_file.getvalue())
+    output.headers["Content-Disposition"] = "attachment; filename=ImportErrors.csv"
+    output.headers["Content-type"] = "text/csv"
+    for key, value in report.items():
+        if isinstance(value, (bool, int, float)):
+            output.headers[f"X-Import-{key.replace('_', '-').title()}"] = str(value)
+    return output, 200
+
+
+def submitted_job(kind: str, stream: BinaryIO, options: Dict[str, Any]) -> Tuple[Any, int, Dict[str, str]]:
+    job = import_jobs.submit(kind, stream, **options)
+    return jsonify(job), 202, {'Location': f"/imports/{job['id']}"}
+
+
+def _wants_csv_report(report: Dict[str, Any]) -> bool:
+    return request.args.get('report', 'json').lower() == 'csv' and 'errors' in report
@@ -1,36 +1,80 @@
-from io import StringIO
-from typing import Callable
+import time
+from typing import Any, Callable, Iterable, Iterator, Optional, TextIO, Tuple
+from sqlalchemy import not_
 from sqlalchemy.exc import SQLAlchemyError
 
-from app.domains.import_csv.actions import import_product_csv_file
+from app.domains.import_csv.actions import iter_product_csv_file, iter_numbered_csv_rows, product_row, import_report, \
+    product_row_errors, dry_run_report, PRODUCT_COLUMNS, IMPORT_CHUNK_SIZE, DRY_RUN_SAMPLE_SIZE
+from app.domains.import_csv.validation import validate_in_processes
+from app.domains.export_csv.actions import EXPORT_BATCH_SIZE
 from app.domains.products.models import *
-from app.exceptions.exceptions_of_import import RepeatedDataError, DataAlreadyExistsError
-from database.repository import save, commit
+from app.domains.products.pricing import final_cost_of, refresh_final_costs
+from app.exceptions import BadRequestException
+from app.exceptions.exceptions_of_import import DataAlreadyExistsError, InvalidRowsError
+from app.conditional import collection_version, item_version, Version
+from database.batch import insert_batch
+from database.repository import save, commit, rollback, insert_many, chunked, update_fields, diff_many, save_diff
+from database.pagination import paginate, columns_of, to_bool, to_date, DEFAULT_PAGE_KEYS
 
-from app.domains.category_lines.actions import get_by_id as get_category_line_by_id
 
-from app.domains.categories.actions import get_by_id as get_category_by_id
+UPDATE_FIELDS: List[str] = ['name', 'cost_values', 'unit_box', 'weight_unit', 'validity', 'sku', 'description',
+                            'category_line_id', 'supplier_id']
+UPSERT_FIELDS: List[str] = ['name', 'cost_values', 'unit_box', 'weight_unit', 'validity', 'description',
+                            'category_line_id', 'supplier_id']
+PAGE_FIELDS: List[str] = ['id', 'active', 'name', 'cost_values', 'category_line_id', 'supplier_id', 'unit_box',
+                          'weight_unit', 'validity', 'sku', 'description', 'on_create', 'on_update']
+SORT_FIELDS: List[str] = ['on_create', 'name', 'cost_values', 'validity', 'sku']
+FILTERS: Dict[str, Callable[[str], Any]] = {'supplier_id': str, 'category_line_id': str, 'validity_before': to_date,
+                                            'validity_after': to_date, 'min_cost': float, 'max_cost': float,
+                                            'active': to_bool}
 
 
 def create(data: Dict[str, Union[bool, str]]) -> Product:
     try:
-        return save(Product(name=data['name'],
-                            cost_values=data['cost_values'],
-                            unit_box=data['unit_box'],
-                            weight_unit=data['weight_unit'],
-                            validity=data['validity'],
-                            sku=data['sku'],
-                            description=data['description'],
-                            category_line_id=data['category_line_id'],
-                            supplier_id=data['supplier_id']))
+        product = Product(name=data['name'],
+                          cost_values=data['cost_values'],
+                          unit_box=data['unit_box'],
+                          weight_unit=data['weight_unit'],
+                          validity=data['validity'],
+                          sku=data['sku'],
+                          description=data['description'],
+                          category_line_id=data['category_line_id'],
+                          supplier_id=data['supplier_id'])
+        product.final_cost = final_cost_of(data['cost_values'], data['category_line_id'])
+        return save(product)
     except SQLAlchemyError:
         raise InvalidValueError(['sku'])
 
 
+def create_many(data: List[Dict[str, Any]], atomic: bool = True) -> Dict[str, Any]:
+    return insert_batch(Product, data, UPDATE_FIELDS, lambda product: validating_product(**product),
+                        optional_fields=['description'], unique_field='sku', convert=_with_validity_date,
+                        after_insert=lambda ids: refresh_final_costs(Product.id.in_(ids)), atomic=atomic)
+
+
 def get() -> List[Product]:
     return Product.query.all()
 
 
+def get_in_batches(batch_size: int = EXPORT_BATCH_SIZE) -> Iterator[Product]:
+    return Product.query.yield_per(batch_size)
+
+
+def get_ids_by_sku(skus: Iterable[str]) -> Dict[str, str]:
+    skus = set(skus)
+    if not skus:
+        return {}
+    return dict(db.session.query(Product.sku, Product.id).filter(Product.sku.in_(skus)))
+
+
+def get_page_version(filters: Dict[str, Any] = None) -> Version:
+    return collection_version(Product.query.filter(*_filter_clauses(filters or {})), Product)
+
+
+def get_version(id: str) -> Optional[Version]:
+    return item_version(Product, id)
+
+
 def get_by_id(id: str) -> Product:
     product = Product.query.get(id)
     if not product:
@@ -38,30 +82,20 @@ def get_by_id(id: str) -> Product:
     return product
 
 
-def update(id: str, data: Dict[str, Union[bool, str]]) -> Product:
+def update(id: str, data: Dict[str, Union[bool, str]], partial: bool = False) -> Product:
     try:
         product = get_by_id(id)
         if not product:
             raise IdNotExistError()
-        product.name = data.get('name')
-        product.cost_values = data.get('cost_values')
-        product.unit_box = data.get('unit_box')
-        product.weight_unit = data.get('weight_unit')
-        product.validity = data.get('validity')
-        product.sku = data.get('sku')
-        product.description = data.get('description')
-        product.category_line_id = data.get('category_line_id')
-        product.supplier_id = data.get('supplier_id')
-
-        validating_empty_fields(['active', 'description'], **product.serialize())
-        validating_if_field_is_not_str(['active', 'on_create', 'on_update', 'cost_values', 'unit_box', 'weight_unit',
-                                        'validity'], **product.serialize())
-        validating_if_field_is_bool(['active'], **product.serialize())
-        validating_if_field_is_alpha(['name'], **product.serialize())
-        validating_validity(['validity'], **product.serialize())
-        validating_if_field_is_int(['unit_box'], **product.serialize())
-        validating_if_field_is_float(['cost_values', 'weight_unit'], **product.serialize())
-        validating_size_of_fields(**product.serialize())
+        changes = extracting_changes(UPDATE_FIELDS, data, partial)
+        validating_product(**changes)
+        if 'validity' in changes:
+            changes['validity'] = datetime.datetime.strptime(changes['validity'], '%Y-%m-%d')
+        changed_fields = update_fields(product, changes)
+        if not changed_fields:
+            return product
+        if changed_fields.keys() & {'cost_values', 'category_line_id'}:
+            product.final_cost = final_cost_of(product.cost_values, product.category_line_id)
         commit()
         return product
 
@@ -72,50 +106,185 @@ def update(id: str, data: Dict[str, Union[bool, str]]) -> Product:
         raise InvalidValueError(['sku'])
 
 
-def get_percentages(category_line_id: str) -> float:
-    category_line = get_category_line_by_id(category_line_id)
-    category_id = category_line.category_id
-    category_line_percentage = category_line.profit_percentage
-    category = get_category_by_id(category_id)
-    category_percentage = category.profit_percentage
-    sum_of_percentages = category_percentage + category_line_percentage
-    return sum_of_percentages
-
-
-def inserting_products_from_the_csv_file_in_db(csv_file: StringIO, field: str, validate: Callable, new_products_list: List,
-                                               list_of_sku_saved_in_db: List, product_id_list: List) -> List[Product]:
-    get_products = get()
-    for product in get_products:
-        list_of_sku_saved_in_db.append(product.sku.strip())
-        product_id_list.append(product.id)
-    validate(csv_file, field, list_of_sku_saved_in_db, new_products_list, product_id_list)
-    if not new_products_list:
+def get_by_id_with_final_cost(id: str) -> Dict[str, Union[bool, str]]:
+    product = get_by_id(id)
+    return {**product.serialize(), 'cost_values': product.final_cost}
+
+
+def get_page_with_final_cost(fields: List[str], limit: int, after: Optional[str], filters: Dict[str, Any] = None,
+                             keys: Tuple[str, ...] = DEFAULT_PAGE_KEYS,
+                             descending: bool = False) -> Tuple[List[Dict[str, Any]], Optional[str]]:
+    columns = columns_of(Product, PAGE_FIELDS)
+    columns['cost_values'] = Product.final_cost
+    query = Product.query.filter(*_filter_clauses(filters or {}))
+    return paginate(query, columns, fields, limit, after, keys, descending)
+
+
+def _filter_clauses(filters: Dict[str, Any]) -> List[Any]:
+    clauses = {
+        'supplier_id': lambda value: Product.supplier_id == value,
+        'category_line_id': lambda value: Product.category_line_id == value,
+        'validity_before': lambda value: Product.validity < value,
+        'validity_after': lambda value: Product.validity >= value,
+        'min_cost': lambda value: Product.final_cost >= value,
+        'max_cost': lambda value: Product.final_cost <= value,
+        'active': lambda value: Product.active if value else not_(Product.active)
+    }
+    return [clauses[field](value) for field, value in filters.items()]
+
+
+def import_products(csv_file: TextIO, chunk_size: int = IMPORT_CHUNK_SIZE, atomic: bool = True,
+                    progress: Callable[[int], Any] = lambda rows: None, validation_workers: int = 0,
+                    collect_errors: bool = False, dry_run: bool = False) -> Dict[str, Any]:
+    started_at = time.perf_counter()
+    inserted_rows = 0
+    skipped_rows = 0
+    processed_rows = 0
+    errors = []
+    sample = []
+    row_by_row = validation_workers > 1 or collect_errors
+    fail_on_errors = atomic and not collect_errors
+    chunks, prepare = _product_chunks(csv_file, chunk_size, validation_workers, row_by_row)
+    try:
+        for products_csv, chunk_errors in chunks:
+            errors += chunk_errors
+            processed_rows += len(products_csv) + len(chunk_errors)
+            if fail_on_errors and errors:
+                progress(processed_rows)
+                continue
+            product_ids_by_sku = get_ids_by_sku(product_csv['sku'] for product_csv in products_csv)
+            new_products = [prepare(product_csv) for product_csv in products_csv
+                            if product_csv['sku'] not in product_ids_by_sku]
+            skipped_rows += len(products_csv) - len(new_products)
+            if dry_run:
+                inserted_rows += len(new_products)
+                sample += [{'action': 'insert', 'sku': product['sku']}
+                           for product in new_products[:DRY_RUN_SAMPLE_SIZE - len(sample)]]
+                progress(processed_rows)
+                continue
+            inserted_rows += insert_many(Product, new_products)
+            if new_products:
+                refresh_final_costs(Product.sku.in_([product['sku'] for product in new_products]))
+            if not atomic:
+                commit()
+            progress(processed_rows)
+        if fail_on_errors and errors:
+            raise InvalidRowsError(errors)
+        if dry_run:
+            rollback()
+        else:
+            commit()
+    except SQLAlchemyError:
+        rollback()
+        raise InvalidValueError(['sku'])
+    except BadRequestException:
+        rollback()
+        raise
+    if dry_run:
+        report = dry_run_report(import_report(started_at, inserted=inserted_rows, skipped=skipped_rows), sample)
+        return _with_errors(report, errors, row_by_row)
+    if not inserted_rows and not errors:
         raise DataAlreadyExistsError()
-    return new_products_list
+    return _with_errors(import_report(started_at, inserted=inserted_rows), errors, row_by_row)
 
 
-def validating_if_the_product_sku_already_exists_in_the_db(csv_file: StringIO, field: str,
-                                                           list_of_sku_saved_in_db: List,
-                                                           new_products_list: List, product_id_list: List) -> NoReturn:
-    for product_csv in import_product_csv_file(csv_file):
-        if product_csv[field] not in list_of_sku_saved_in_db:
-            try:
-                new_products_list.append(save(Product(**product_csv)))
-            except SQLAlchemyError:
-                raise InvalidValueError(['sku'])
+def import_products_by_supplier(csv_file: TextIO, chunk_size: int = IMPORT_CHUNK_SIZE, atomic: bool = True,
+                                progress: Callable[[int], Any] = lambda rows: None, validation_workers: int = 0,
+                                collect_errors: bool = False, dry_run: bool = False) -> Dict[str, Any]:
+    started_at = time.perf_counter()
+    rows = {'insert': 0, 'update': 0, 'unchanged': 0}
+    errors = []
+    sample = []
+    row_by_row = validation_workers > 1 or collect_errors
+    fail_on_errors = atomic and not collect_errors
+    chunks, prepare = _product_chunks(csv_file, chunk_size, validation_workers, row_by_row)
+    try:
+        for products_csv, chunk_errors in chunks:
+            errors += chunk_errors
+            if fail_on_errors and errors:
+                continue
+            diff = diff_many(Product, [prepare(product_csv) for product_csv in products_csv], 'sku', UPSERT_FIELDS)
+            for action in rows:
+                rows[action] += len(diff[action])
+            if dry_run:
+                sample += _diff_sample(diff)[:DRY_RUN_SAMPLE_SIZE - len(sample)]
+                progress(sum(rows.values()))
+                continue
+            save_diff(Product, diff, 'sku', UPSERT_FIELDS)
+            changed_skus = [product['sku'] for product in diff['insert'] + diff['update']]
+            if changed_skus:
+                refresh_final_costs(Product.sku.in_(changed_skus))
+            if not atomic:
+                commit()
+            progress(sum(rows.values()))
+        if fail_on_errors and errors:
+            raise InvalidRowsError(errors)
+        if dry_run:
+            rollback()
+        else:
+            commit()
+    except SQLAlchemyError:
+        rollback()
+        raise IdNotExistError()
+    except BadRequestException:
+        rollback()
+        raise
+    if dry_run:
+        report = dry_run_report(import_report(started_at, inserted=rows['insert'], updated=rows['update'],
+                                               unchanged=rows['unchanged']), sample)
+        return _with_errors(report, errors, row_by_row)
+    report = import_report(started_at, imported=rows['insert'] + rows['update'], unchanged=rows['unchanged'])
+    return _with_errors(report, errors, row_by_row)
 
 
-def validating_and_updating_if_the_product_sku_already_exists_in_the_db(csv_file: StringIO, field: str,
-                                                                        list_of_sku_saved_in_db: List,
-                                                                        new_products_list: List,
-                                                                        product_id_list: List) -> NoReturn:
-    for product_csv in import_product_csv_file(csv_file):
+def validate_product_rows(rows: List[Tuple[int, Dict[str, str]]]) -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]]]:
+    products = []
+    errors = []
+    for line, row in rows:
         try:
-            if product_csv[field] not in list_of_sku_saved_in_db:
-                new_products_list.append(save(Product(**product_csv)))
-            else:
-                position = list_of_sku_saved_in_db.index(product_csv[field].strip())
-                id = product_id_list[position]
-                new_products_list.append(update(id, product_csv))
-        except SQLAlchemyError:
-            raise IdNotExistError()
\ No newline at end of file
+            products.append(_product_mapping(product_row(row)))
+        except BadRequestException:
+            errors += product_row_errors_of(line, row)
+    return products, errors
+
+
+def product_row_errors_of(line: int, row: Dict[str, str]) -> List[Dict[str, Any]]:
+    field_errors = product_row_errors(row)
+    if not field_errors:
+        field_errors = [(field, error) for fields, error in PRODUCT_SCHEMA.field_errors(product_row(row))
+                        for field in fields]
+    return [{'line': line, 'column': field, 'error': error.description} for field, error in field_errors]
+
+
+def _product_chunks(csv_file: TextIO, chunk_size: int, validation_workers: int,
+                    row_by_row: bool) -> Tuple[Iterator[Tuple[List[Dict[str, Any]], List[Dict[str, Any]]]],
+                                               Callable[[Dict[str, Any]], Dict[str, Any]]]:
+    if row_by_row:
+        rows = iter_numbered_csv_rows(csv_file, PRODUCT_COLUMNS)
+        if validation_workers > 1:
+            chunks = validate_in_processes(rows, validate_product_rows, chunk_size, validation_workers)
+        else:
+            chunks = (validate_product_rows(rows_chunk) for rows_chunk in chunked(rows, chunk_size))
+        return chunks, lambda product: product
+    chunks = ((products_csv, []) for products_csv in chunked(iter_product_csv_file(csv_file), chunk_size))
+    return chunks, _product_mapping
+
+
+def _diff_sample(diff: Dict[str, List[Dict[str, Any]]]) -> List[Dict[str, Any]]:
+    return [{'action': 'insert', 'sku': product['sku']} for product in diff['insert'][:DRY_RUN_SAMPLE_SIZE]] + \
+           [{'action': 'update', **changes} for changes in diff['changes'][:DRY_RUN_SAMPLE_SIZE]]
+
+
+def _with_errors(report: Dict[str, Any], errors: List[Dict[str, Any]], row_by_row: bool) -> Dict[str, Any]:
+    return {**report, 'errors': errors} if row_by_row else report
+
+
+def _product_mapping(product_csv: Dict[str, Union[float, int, str]]) -> Dict[str, Any]:
+    validating_product(**product_csv)
+    return _with_validity_date(product_csv)
+
+
+def _with_validity_date(product: Dict[str, Any]) -> Dict[str, Any]:
+    return {**product, 'validity': datetime.datetime.strptime(product['validity'], '%Y-%m-%d')}
+
+
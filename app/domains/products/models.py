@@ -3,6 +3,7 @@ from uuid import uuid4
 from app.domains.category_lines.models import CategoryLine
 from app.domains.suppliers.models import Supplier
 from app.validations.validations import *
+from app.validations.schemas import *
 from database import db
 
 MAX_NAME_LENGTH: int = 80
@@ -14,11 +15,21 @@ MAX_WEIGHT_UNIT_DECIMAL_PLACES: int = 3
 
 class Product(db.Model):
     __tablename__ = 'products'
+    __table_args__ = (
+        db.Index('ix_products_on_create_id', 'on_create', 'id'),
+        db.Index('ix_products_supplier_id_on_create_id', 'supplier_id', 'on_create', 'id'),
+        db.Index('ix_products_category_line_id_on_create_id', 'category_line_id', 'on_create', 'id'),
+        db.Index('ix_products_validity_id', 'validity', 'id'),
+        db.Index('ix_products_final_cost_id', 'final_cost', 'id'),
+        db.Index('ix_products_active_on_create_id', 'on_create', 'id',
+                 postgresql_where=db.text('active'), sqlite_where=db.text('active')),
+    )
 
     id = db.Column(db.String(36), default=lambda: str(uuid4()), primary_key=True)
     active = db.Column(db.Boolean(), default=True)
     name = db.Column(db.String(80), nullable=False)
     cost_values = db.Column(db.Float(), nullable=False)
+    final_cost = db.Column(db.Float())
     category_line = db.relationship(CategoryLine)
     category_line_id = db.Column(db.String(36), db.ForeignKey(CategoryLine.id), nullable=False)
     supplier = db.relationship(Supplier)
@@ -33,15 +44,7 @@ class Product(db.Model):
 
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
-        validating_empty_fields(['active', 'description'], **kwargs)
-        validating_if_field_is_not_str(['active', 'on_create', 'on_update', 'cost_values', 'unit_box', 'weight_unit',
-                                        'validity'], **kwargs)
-        validating_if_field_is_bool(['active'], **kwargs)
-        validating_if_field_is_alpha(['name'], **kwargs)
-        validating_validity(['validity'], **kwargs)
-        validating_if_field_is_int(['unit_box'], **kwargs)
-        validating_if_field_is_float(['cost_values', 'weight_unit'], **kwargs)
-        validating_size_of_fields(**kwargs)
+        validating_product(**kwargs)
 
     def serialize(self) -> Dict[str, Union[bool, str]]:
         return {
@@ -60,22 +63,25 @@ class Product(db.Model):
             'on_update': self.on_update
         }
 
-    def serialize_final_cost(self, sum_of_percentages) -> Dict[str, Union[bool, str]]:
-        return {
-            'id': self.id,
-            'active': self.active,
-            'name': self.name,
-            'cost_values': self.cost_values + sum_of_percentages,
-            'category_line_id': self.category_line_id,
-            'supplier_id': self.supplier_id,
-            'unit_box': self.unit_box,
-            'weight_unit': self.weight_unit,
-            'validity': self.validity,
-            'sku': self.sku,
-            'description': self.description,
-            'on_create': self.on_create,
-            'on_update': self.on_update
-        }
+
+PRODUCT_SCHEMA = Schema(
+    empty_fields(['active', 'description']),
+    str_fields(['active', 'on_create', 'on_update', 'cost_values', 'unit_box', 'weight_unit', 'validity']),
+    bool_fields(['active']),
+    alpha_fields(['name']),
+    validity_fields(['validity']),
+    int_fields(['unit_box']),
+    float_fields(['cost_values', 'weight_unit']),
+    maximum_size_fields({'name': MAX_NAME_LENGTH, 'description': MAX_DESCRIPTION_LENGTH,
+                         'category_line_id': MAX_CATEGORY_LINE_ID_LENGTH, 'supplier_id': MAX_CATEGORY_LINE_ID_LENGTH},
+                        decimal_places={'cost_values': MAX_COST_VALUES_DECIMAL_PLACES,
+                                        'weight_unit': MAX_WEIGHT_UNIT_DECIMAL_PLACES}),
+    fields=Product.__table__.columns.keys()
+)
+
+
+def validating_product(**data: Dict[str, Union[bool, str]]) -> NoReturn:
+    PRODUCT_SCHEMA.validate(data)
 
 
 def validating_size_of_fields(**data: Dict[str, Union[bool, str]]) -> NoReturn:
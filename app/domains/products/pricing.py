@@ -0,0 +1,51 @@
+import time
+from typing import Any, Dict
+
+from sqlalchemy import and_, select
+
+from app.domains.categories.models import Category
+from app.domains.category_lines.models import CategoryLine
+from app.domains.products.models import Product
+from database import db
+
+
+def sum_of_percentages(category_line_id: Any):
+    return select([Category.profit_percentage + CategoryLine.profit_percentage]) \
+        .where(CategoryLine.category_id == Category.id) \
+        .where(CategoryLine.id == category_line_id) \
+        .as_scalar()
+
+
+def final_cost_of(cost_values: Any, category_line_id: Any):
+    return cost_values + sum_of_percentages(category_line_id)
+
+
+def refresh_final_costs(*criteria: Any) -> int:
+    db.session.flush()
+    statement = Product.__table__.update() \
+        .where(and_(*criteria)) \
+        .values(final_cost=final_cost_of(Product.cost_values, Product.category_line_id))
+    return db.session.execute(statement).rowcount
+
+
+def category_line_ids_of(category_id: str):
+    return select([CategoryLine.id]).where(CategoryLine.category_id == category_id)
+
+
+def reprice_category_statement(category_id: str):
+    return Product.__table__.update() \
+        .where(Product.category_line_id == CategoryLine.id) \
+        .where(CategoryLine.category_id == Category.id) \
+        .where(Category.id == category_id) \
+        .values(final_cost=Product.cost_values + Category.profit_percentage + CategoryLine.profit_percentage)
+
+
+def reprice_category(category_id: str) -> Dict[str, Any]:
+    started_at = time.perf_counter()
+    if db.session.get_bind().dialect.name == 'postgresql':
+        db.session.flush()
+        repriced_products = db.session.execute(reprice_category_statement(category_id)).rowcount
+    else:
+        repriced_products = refresh_final_costs(Product.category_line_id.in_(category_line_ids_of(category_id)))
+    return {'category_id': category_id, 'repriced_products': repriced_products,
+            'seconds': round(time.perf_counter() - started_at, 3)}
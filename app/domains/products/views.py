@@ -1,18 +1,29 @@
-from flask import Blueprint, jsonify, request
-from typing import Tuple, Any
-import io
+from flask import Blueprint, Response, jsonify, request, current_app
+from typing import Tuple, Any, Dict
 
 from app.domains.products.models import *
 from app.exceptions.exceptions_of_import import NoFileError
-from app.domains.export_csv.actions import create_csv_file, send_csv_file
-from app.domains.products.actions import get as get_products, \
+from app.domains.import_csv.actions import open_csv_stream
+from app.domains.import_csv.views import submitted_job, import_response
+from app.domains.export_csv.actions import stream_csv_file
+from database.batch import batch_status
+from app.conditional import conditional_response
+from app.serialization import stream_json_array
+from database.pagination import parse_page_arguments, parse_sort_argument, parse_filter_arguments, next_page_headers
+from app.domains.products.actions import get_in_batches as get_products_in_batches, \
     create as create_products, \
+    create_many as create_products_batch, \
     update as update_products, \
-    get_by_id as get_products_by_id, \
-    inserting_products_from_the_csv_file_in_db as insert_data, \
-    validating_if_the_product_sku_already_exists_in_the_db as validate, \
-    validating_and_updating_if_the_product_sku_already_exists_in_the_db as validate_by_supplier, \
-    validating_if_json_is_correct, get_percentages
+    import_products, \
+    import_products_by_supplier, \
+    get_page_with_final_cost as get_product_page_with_final_cost, \
+    get_page_version as get_product_page_version, \
+    get_version as get_product_version, \
+    PAGE_FIELDS as PRODUCT_PAGE_FIELDS, \
+    SORT_FIELDS as PRODUCT_SORT_FIELDS, \
+    FILTERS as PRODUCT_FILTERS, \
+    get_by_id_with_final_cost as get_product_by_id_with_final_cost, \
+    validating_if_json_is_correct
 
 app_products = Blueprint('app.products', __name__)
 
@@ -28,6 +39,12 @@ def post() -> Tuple[Any, int]:
                                        'category_line_id', 'supplier_id'])
 
 
+@app_products.route('/products:batch', methods=['POST'])
+def batch() -> Tuple[Any, int]:
+    report = create_products_batch(request.get_json(), atomic=request.args.get('atomic', 'true').lower() != 'false')
+    return jsonify(report), batch_status(report)
+
+
 @app_products.route('/products/<id>', methods=['PUT'])
 def put(id: str) -> Tuple[Any, int]:
     payload = request.get_json()
@@ -35,23 +52,35 @@ def put(id: str) -> Tuple[Any, int]:
     return jsonify(products.serialize()), 200
 
 
+@app_products.route('/products/<id>', methods=['PATCH'])
+def patch(id: str) -> Tuple[Any, int]:
+    payload = request.get_json()
+    products = update_products(id, payload, partial=True)
+    return jsonify(products.serialize()), 200
+
+
 @app_products.route('/products', methods=['GET'])
-def get() -> Tuple[Any, int]:
-    return jsonify([products.serialize_final_cost(get_percentages(products.category_line_id))
-                    for products in get_products()]), 200
+def get() -> Response:
+    arguments = {**parse_page_arguments(request.args, PRODUCT_PAGE_FIELDS),
+                 **parse_sort_argument(request.args, PRODUCT_SORT_FIELDS),
+                 'filters': parse_filter_arguments(request.args, PRODUCT_FILTERS)}
+
+    def build() -> Response:
+        products, next_cursor = get_product_page_with_final_cost(**arguments)
+        return stream_json_array(products, 200, next_page_headers(next_cursor))
+
+    return conditional_response(get_product_page_version(arguments['filters']), build)
 
 
 @app_products.route('/products/<id>', methods=['GET'])
-def get_by_id(id: str) -> Tuple[Any, int]:
-    products = get_products_by_id(id)
-    return jsonify([products.serialize_final_cost(get_percentages(products.category_line_id))]), 200
+def get_by_id(id: str) -> Response:
+    return conditional_response(get_product_version(id),
+                                lambda: (jsonify([get_product_by_id_with_final_cost(id)]), 200))
 
 
 @app_products.route('/products:export', methods=['GET'])
 def export():
-    products_list = get_products()
-    csv_file = create_csv_file([product.serialize() for product in products_list])
-    return send_csv_file(csv_file, 'Products')
+    return stream_csv_file((product.serialize() for product in get_products_in_batches()), 'Products')
 
 
 @app_products.route('/products:import', methods=['POST'])
@@ -60,9 +89,10 @@ def import_route():
         file = request.files['data_file']
     except:
         raise NoFileError()
-    stream = io.StringIO(file.stream.read().decode("utf-8"))
-    insert_data(stream, 'sku', validate, [], [], [])
-    return jsonify([product.serialize() for product in get_products()]), 200
+    options = _import_options()
+    if request.args.get('async', 'false').lower() == 'true':
+        return submitted_job('products', file.stream, options)
+    return import_response(import_products(open_csv_stream(file.stream), **options))
 
 
 @app_products.route('/products:import-by-supplier', methods=['POST'])
@@ -71,6 +101,19 @@ def import_route_by_supplier():
         file = request.files['data_file']
     except:
         raise NoFileError()
-    stream = io.StringIO(file.stream.read().decode("utf-8"))
-    insert_data(stream, 'sku', validate_by_supplier, [], [], [])
-    return jsonify([product.serialize() for product in get_products()]), 200
+    options = _import_options()
+    if request.args.get('async', 'false').lower() == 'true':
+        return submitted_job('products_by_supplier', file.stream, options)
+    return import_response(import_products_by_supplier(open_csv_stream(file.stream), **options))
+
+
+def _import_options() -> Dict[str, Any]:
+    options = {'chunk_size': current_app.config['IMPORT_CHUNK_SIZE'],
+               'atomic': request.args.get('atomic', 'true').lower() != 'false'}
+    if request.args.get('parallel', 'false').lower() == 'true':
+        options['validation_workers'] = current_app.config['IMPORT_VALIDATION_WORKERS']
+    if request.args.get('collect_errors', 'false').lower() == 'true':
+        options['collect_errors'] = True
+    if request.args.get('dry_run', 'false').lower() == 'true':
+        options['dry_run'] = True
+    return options
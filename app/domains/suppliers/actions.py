@@ -1,26 +1,78 @@
+from typing import Any, Optional, Tuple
 from sqlalchemy.exc import SQLAlchemyError
 
 from app.domains.suppliers.models import *
-from database.repository import save, commit
+from app.cache import response_cache
+from app.validations.schemas import *
+from app.conditional import collection_version, item_version, Version
+from database.batch import insert_batch
+from database.repository import save, commit, update_fields
+from database.pagination import paginate, columns_of
+
+
+PAGE_FIELDS: List[str] = ['id', 'active', 'company_name', 'cnpj', 'trading_name', 'phone', 'email', 'address_id',
+                          'category_id', 'on_create', 'on_update']
+SUMMED_PAGE_FIELDS: List[str] = ['id', 'trading_name', 'on_create', 'on_update']
+CREATE_FIELDS: List[str] = ['company_name', 'cnpj', 'trading_name', 'phone', 'email', 'address_id', 'category_id']
+UPDATE_FIELDS: List[str] = ['active', 'company_name', 'cnpj', 'trading_name', 'phone', 'email', 'address_id',
+                            'category_id']
+UPDATE_SCHEMA = Schema(
+    empty_fields(['active']),
+    str_fields(['active', 'on_create', 'on_update']),
+    bool_fields(['active']),
+    numeric_fields(['phone', 'cnpj']),
+    alpha_fields(['company_name', 'trading_name']),
+    email_field(),
+    maximum_size_fields({'company_name': MAX_COMPANY_TRADING_EMAIL_LENGTH,
+                         'trading_name': MAX_COMPANY_TRADING_EMAIL_LENGTH,
+                         'email': MAX_COMPANY_TRADING_EMAIL_LENGTH,
+                         'address_id': MAX_ADDRESS_ID_CATEGORY_ID_LENGTH,
+                         'category_id': MAX_ADDRESS_ID_CATEGORY_ID_LENGTH,
+                         'phone': MAX_PHONE_LENGTH}),
+    minimum_size_fields({'phone': MIN_PHONE_LENGTH}),
+    equal_size_fields({'cnpj': CNPJ_LENGTH}),
+    fields=UPDATE_FIELDS
+)
 
 
 def create(data: Dict[str, Union[bool, str]]) -> Supplier:
     try:
-        return save(Supplier(company_name=data["company_name"],
-                             cnpj=data["cnpj"],
-                             trading_name=data["trading_name"],
-                             phone=data["phone"],
-                             email=data["email"],
-                             address_id=data["address_id"],
-                             category_id=data["category_id"]))
+        supplier = save(Supplier(company_name=data["company_name"],
+                                 cnpj=data["cnpj"],
+                                 trading_name=data["trading_name"],
+                                 phone=data["phone"],
+                                 email=data["email"],
+                                 address_id=data["address_id"],
+                                 category_id=data["category_id"]))
     except SQLAlchemyError:
         raise InvalidValueError(['cnpj'])
+    response_cache.invalidate('suppliers')
+    return supplier
+
+
+def create_many(data: List[Dict[str, Any]], atomic: bool = True) -> Dict[str, Any]:
+    report = insert_batch(Supplier, data, CREATE_FIELDS, SUPPLIER_SCHEMA.validate, unique_field='cnpj', atomic=atomic)
+    if report['created']:
+        response_cache.invalidate('suppliers')
+    return report
 
 
 def get() -> List[Supplier]:
     return Supplier.query.all()
 
 
+def get_page(fields: List[str], limit: int, after: Optional[str]) -> Tuple[List[Dict[str, Any]], Optional[str]]:
+    return paginate(Supplier.query, columns_of(Supplier, PAGE_FIELDS), fields, limit, after)
+
+
+def get_page_version() -> Version:
+    return collection_version(Supplier.query, Supplier)
+
+
+def get_version(id: str) -> Optional[Version]:
+    return item_version(Supplier, id)
+
+
 def get_by_id(id: str) -> Supplier:
     supplier = Supplier.query.get(id)
     if not supplier:
@@ -28,29 +80,17 @@ def get_by_id(id: str) -> Supplier:
     return supplier
 
 
-def update(id: str, data: Dict[str, Union[bool, str]]) -> Supplier:
+def update(id: str, data: Dict[str, Union[bool, str]], partial: bool = False) -> Supplier:
     try:
         supplier = get_by_id(id)
         if not supplier:
             raise IdNotExistError()
-        supplier.active = data.get("active")
-        supplier.company_name = data.get("company_name")
-        supplier.cnpj = data.get("cnpj")
-        supplier.trading_name = data.get("trading_name")
-        supplier.phone = data.get("phone")
-        supplier.email = data.get("email")
-        supplier.address_id = data.get("address_id")
-        supplier.category_id = data.get("category_id")
-
-        validating_empty_fields([], **supplier.serialize())
-        validating_if_field_is_not_str(['active', 'on_create', 'on_update'], **supplier.serialize())
-        validating_if_field_is_bool(['active'], **supplier.serialize())
-        validating_if_field_is_numeric(['phone', 'cnpj'], **supplier.serialize())
-        validating_if_field_is_alpha(['company_name', 'trading_name'], **supplier.serialize())
-        validating_maximum_size_of_fields(**supplier.serialize())
-        validating_minimum_size_of_fields(**supplier.serialize())
-        validating_equal_size_of_fields(**supplier.serialize())
+        changes = extracting_changes(UPDATE_FIELDS, data, partial, list_of_fields_not_mandatory=['active'])
+        UPDATE_SCHEMA.validate(changes)
+        if not update_fields(supplier, changes):
+            return supplier
         commit()
+        response_cache.invalidate('suppliers', id)
         return supplier
     except AttributeError:
         validating_if_json_is_correct(['company_name', 'cnpj', 'trading_name', 'phone', 'email', 'address_id',
@@ -1,6 +1,7 @@
 from uuid import uuid4
 
 from app.validations.validations import *
+from app.validations.schemas import *
 from database import db
 from app.domains.addresses.models import Address
 from app.domains.categories.models import Category
@@ -15,6 +16,11 @@ CNPJ_LENGTH: int = 14
 
 class Supplier(db.Model):
     __tablename__ = 'suppliers'
+    __table_args__ = (
+        db.Index('ix_suppliers_on_create_id', 'on_create', 'id'),
+        db.Index('ix_suppliers_active_on_create_id', 'on_create', 'id',
+                 postgresql_where=db.text('active'), sqlite_where=db.text('active')),
+    )
 
     id = db.Column(db.String(36), default=lambda: str(uuid4()), primary_key=True)
     active = db.Column(db.Boolean(), default=True)
@@ -24,9 +30,9 @@ class Supplier(db.Model):
     phone = db.Column(db.String(11), nullable=False)
     email = db.Column(db.String(100), nullable=False)
     address = db.relationship(Address)
-    address_id = db.Column(db.String(36), db.ForeignKey(Address.id), nullable=False)
+    address_id = db.Column(db.String(36), db.ForeignKey(Address.id), nullable=False, index=True)
     category = db.relationship(Category)
-    category_id = db.Column(db.String(36), db.ForeignKey(Category.id), nullable=False)
+    category_id = db.Column(db.String(36), db.ForeignKey(Category.id), nullable=False, index=True)
     on_create = db.Column(db.DateTime, default=datetime.datetime.now)
     on_update = db.Column(db.DateTime, default=datetime.datetime.now, onupdate=datetime.datetime.now)
 
@@ -55,15 +61,26 @@ class Supplier(db.Model):
 
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
-        validating_empty_fields(['description'], **kwargs)
-        validating_if_field_is_not_str(['active', 'on_create', 'on_update'], **kwargs)
-        validating_if_field_is_bool(['active'], **kwargs)
-        validating_if_field_is_numeric(['phone', 'cnpj'], **kwargs)
-        validating_if_field_is_alpha(['company_name', 'trading_name'], **kwargs)
-        validating_email(**kwargs)
-        validating_maximum_size_of_fields(**kwargs)
-        validating_minimum_size_of_fields(**kwargs)
-        validating_equal_size_of_fields(**kwargs)
+        SUPPLIER_SCHEMA.validate(kwargs)
+
+
+SUPPLIER_SCHEMA = Schema(
+    empty_fields(['description']),
+    str_fields(['active', 'on_create', 'on_update']),
+    bool_fields(['active']),
+    numeric_fields(['phone', 'cnpj']),
+    alpha_fields(['company_name', 'trading_name']),
+    email_field(),
+    maximum_size_fields({'company_name': MAX_COMPANY_TRADING_EMAIL_LENGTH,
+                         'trading_name': MAX_COMPANY_TRADING_EMAIL_LENGTH,
+                         'email': MAX_COMPANY_TRADING_EMAIL_LENGTH,
+                         'address_id': MAX_ADDRESS_ID_CATEGORY_ID_LENGTH,
+                         'category_id': MAX_ADDRESS_ID_CATEGORY_ID_LENGTH,
+                         'phone': MAX_PHONE_LENGTH}),
+    minimum_size_fields({'phone': MIN_PHONE_LENGTH}),
+    equal_size_fields({'cnpj': CNPJ_LENGTH}),
+    fields=Supplier.__table__.columns.keys()
+)
 
 
 def validating_maximum_size_of_fields(**data: Dict[str, Union[bool, str]]) -> NoReturn:
@@ -1,11 +1,19 @@
-from flask import Blueprint, jsonify, request
-from typing import Tuple, Any
+from flask import Blueprint, Response, jsonify, request
+from typing import Tuple, Any, Dict
 
-from app.domains.suppliers.actions import get as get_suppliers, \
+from app.domains.suppliers.actions import get_page as get_supplier_page, \
+    PAGE_FIELDS as SUPPLIER_PAGE_FIELDS, \
+    SUMMED_PAGE_FIELDS as SUPPLIER_SUMMED_PAGE_FIELDS, \
     create as create_supplier,\
+    get_page_version as get_supplier_page_version, \
+    get_version as get_supplier_version, \
+    create_many as create_suppliers_batch, \
     update as update_supplier,\
     get_by_id as get_supplier_by_id, \
     validating_if_json_is_correct
+from app.conditional import conditional_response
+from database.batch import batch_status
+from database.pagination import parse_page_arguments, next_page_headers
 
 
 app_suppliers = Blueprint('app.suppliers', __name__)
@@ -22,6 +30,12 @@ def post() -> Tuple[Any, int]:
                                        'category_id'])
 
 
+@app_suppliers.route('/suppliers:batch', methods=['POST'])
+def batch() -> Tuple[Any, int]:
+    report = create_suppliers_batch(request.get_json(), atomic=request.args.get('atomic', 'true').lower() != 'false')
+    return jsonify(report), batch_status(report)
+
+
 @app_suppliers.route('/suppliers/<id>', methods=['PUT'])
 def put(id: str) -> Tuple[Any, int]:
     payload = request.get_json()
@@ -29,12 +43,24 @@ def put(id: str) -> Tuple[Any, int]:
     return jsonify(supplier.serialize()), 200
 
 
+@app_suppliers.route('/suppliers/<id>', methods=['PATCH'])
+def patch(id: str) -> Tuple[Any, int]:
+    payload = request.get_json()
+    supplier = update_supplier(id, payload, partial=True)
+    return jsonify(supplier.serialize()), 200
+
+
 @app_suppliers.route('/suppliers', methods=['GET'])
-def get() -> Tuple[Any, int]:
-    return jsonify([supplier.serialize_summed_version() for supplier in get_suppliers()]), 200
+def get() -> Response:
+    arguments = parse_page_arguments(request.args, SUPPLIER_PAGE_FIELDS, SUPPLIER_SUMMED_PAGE_FIELDS)
+
+    def build() -> Tuple[Any, int, Dict[str, str]]:
+        suppliers, next_cursor = get_supplier_page(**arguments)
+        return jsonify(suppliers), 200, next_page_headers(next_cursor)
+
+    return conditional_response(get_supplier_page_version(), build)
 
 
 @app_suppliers.route('/suppliers/<id>', methods=['GET'])
-def get_by_id(id: str) -> Tuple[Any, int]:
-    supplier = get_supplier_by_id(id)
-    return jsonify(supplier.serialize()), 200
+def get_by_id(id: str) -> Response:
+    return conditional_response(get_supplier_version(id), lambda: (jsonify(get_supplier_by_id(id).serialize()), 200))
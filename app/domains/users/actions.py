@@ -1,16 +1,23 @@
 from app.domains.users.models import User
 from database.repository import save, commit
+from database.pagination import paginate, columns_of
 from uuid import uuid4
 
 
 def create(data):
     return save(User(id=str(uuid4()), name=data['name'], email=data['email']))
 
+PAGE_FIELDS = ['id', 'name']
+
 
 def get():
     return User.query.all()
 
 
+def get_page(fields, limit, after):
+    return paginate(User.query, columns_of(User, PAGE_FIELDS), fields, limit, after, keys=('id',))
+
+
 def get_by_id(id):
     return User.query.get(id)
 
@@ -1,10 +1,12 @@
 from flask import Blueprint, jsonify, request
 
 from app.domains.users.actions import \
-    get as get_users, \
+    get_page as get_user_page, \
+    PAGE_FIELDS as USER_PAGE_FIELDS, \
     create as create_user, \
     update as update_user, \
     get_by_id as get_user_by_id
+from database.pagination import parse_page_arguments, next_page_headers
 
 app_users = Blueprint('app.users', __name__)
 
@@ -25,7 +27,8 @@ def put(id):
 
 @app_users.route('/users', methods=['GET'])
 def get() -> tuple:
-    return jsonify([user.serialize() for user in get_users()]), 200
+    users, next_cursor = get_user_page(**parse_page_arguments(request.args, USER_PAGE_FIELDS))
+    return jsonify(users), 200, next_page_headers(next_cursor)
 
 
 @app_users.route('/users/<id>', methods=['GET'])
@@ -0,0 +1,13 @@
+from app.exceptions import BadRequestException
+
+
+class BatchError(BadRequestException):
+    def __init__(self):
+        message = f"The JSON data must be a non-empty list of objects"
+        super().__init__(message)
+
+
+class BatchSizeError(BadRequestException):
+    def __init__(self, maximum: int):
+        message = f"The batch must contain at most {maximum} items"
+        super().__init__(message)
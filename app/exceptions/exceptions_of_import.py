@@ -1,6 +1,6 @@
 from typing import List, Any
 
-from app.exceptions import BadRequestException
+from app.exceptions import BadRequestException, NotFoundException
 
 
 class NoFileError(BadRequestException):
@@ -31,3 +31,22 @@ class RepeatedDataError(BadRequestException):
     def __init__(self, fields: List[Any]):
         message = f"""The following values are repeated in the file, but will be added only once: {str(fields)[1:-1].replace("'", "")}"""
         super().__init__(message)
+
+
+class JobNotExistError(NotFoundException):
+    def __init__(self):
+        message = f"The import job does not exist"
+        super().__init__(message)
+
+
+class ImportKindError(BadRequestException):
+    def __init__(self, kinds: List[Any]):
+        message = f"""The import must be one of the following kind(s): {str(kinds)[1:-1].replace("'", "")}"""
+        super().__init__(message)
+
+
+class InvalidRowsError(BadRequestException):
+    def __init__(self, errors: List[Any]):
+        lines = '; '.join(f"line {error['line']}, column {error['column']}: {error['error']}" for error in errors)
+        message = f"The following line(s) of the file have invalid values: {lines}"
+        super().__init__(message)
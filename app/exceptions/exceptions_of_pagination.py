@@ -0,0 +1,33 @@
+from typing import List, Any
+
+from app.exceptions import BadRequestException
+
+
+class LimitError(BadRequestException):
+    def __init__(self, maximum: int):
+        message = f"The limit must be an integer between 1 and {maximum}"
+        super().__init__(message)
+
+
+class FieldsError(BadRequestException):
+    def __init__(self, fields: List[Any]):
+        message = f"""The following field(s) cannot be selected: {str(fields)[1:-1].replace("'", "")}"""
+        super().__init__(message)
+
+
+class CursorError(BadRequestException):
+    def __init__(self):
+        message = f"The cursor informed in 'after' is invalid"
+        super().__init__(message)
+
+
+class FilterError(BadRequestException):
+    def __init__(self, fields: List[Any]):
+        message = f"""The following filter(s) have an invalid value: {str(fields)[1:-1].replace("'", "")}"""
+        super().__init__(message)
+
+
+class SortError(BadRequestException):
+    def __init__(self, fields: List[Any]):
+        message = f"""The sort must be one of the following field(s), optionally prefixed with '-': {str(fields)[1:-1].replace("'", "")}"""
+        super().__init__(message)
@@ -0,0 +1,65 @@
+import datetime
+import decimal
+import json
+import uuid
+from typing import Any, Dict, Iterable, Optional
+
+from flask import Response, stream_with_context, json as flask_json
+
+from database.repository import chunked
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+STREAM_BATCH_SIZE: int = 500
+
+
+def default(value: Any) -> Any:
+    if isinstance(value, (datetime.date, datetime.time)):
+        return value.isoformat()
+    if isinstance(value, (decimal.Decimal, uuid.UUID)):
+        return str(value)
+    if hasattr(value, '__html__'):
+        return str(value.__html__())
+    raise TypeError(f'Object of type {type(value).__name__} is not JSON serializable')
+
+
+class StdlibJSONEncoder(json.JSONEncoder):
+    def default(self, value: Any) -> Any:
+        return default(value)
+
+
+class _OrjsonJSONEncoder(StdlibJSONEncoder):
+    def encode(self, value: Any) -> str:
+        option = orjson.OPT_NON_STR_KEYS
+        if self.indent:
+            option |= orjson.OPT_INDENT_2
+        if self.sort_keys:
+            option |= orjson.OPT_SORT_KEYS
+        return orjson.dumps(value, default=default, option=option).decode()
+
+    def iterencode(self, value: Any, _one_shot: bool = False):
+        yield self.encode(value)
+
+
+def json_encoder_for(config: Dict[str, Any]) -> type:
+    if config.get('JSON_ENCODER', 'orjson') == 'orjson' and orjson is not None:
+        return _OrjsonJSONEncoder
+    return StdlibJSONEncoder
+
+
+def init_app(app) -> None:
+    app.json_encoder = json_encoder_for(app.config)
+
+
+def stream_json_array(items: Iterable[Any], status: int = 200, headers: Optional[Dict[str, str]] = None,
+                      batch_size: int = STREAM_BATCH_SIZE) -> Response:
+    def generate():
+        yield '['
+        for position, batch in enumerate(chunked(items, batch_size)):
+            yield (',' if position else '') + flask_json.dumps(batch)[1:-1]
+        yield ']'
+
+    return Response(stream_with_context(generate()), status, headers, mimetype='application/json')
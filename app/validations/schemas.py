@@ -0,0 +1,206 @@
+import builtins
+import datetime
+import re
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple, NoReturn
+
+from app.exceptions.exceptions import *
+
+Check = Callable[[Any], Any]
+Failure = Tuple[str, Any]
+
+EMAIL_PATTERN = re.compile(r'^[a-z0-9]+[\._]?[a-z0-9]+[@]\w+[.]\w{2,3}$')
+
+
+class Rule:
+    def __init__(self, compile_field: Callable[[str], Optional[Check]],
+                 build_error: Callable[[List[Failure]], Exception]):
+        self.compile_field = compile_field
+        self.build_error = build_error
+
+
+class Schema:
+    def __init__(self, *rules: Rule, fields: Iterable[str] = ()):
+        self._rules = rules
+        self._checks_by_field = {}
+        for field in fields:
+            self._compile(field)
+
+    def validate(self, data: Dict[str, Any]) -> NoReturn:
+        error = self.first_error(data)
+        if error:
+            raise error
+
+    def first_error(self, data: Dict[str, Any]) -> Optional[Exception]:
+        failures = self._failures(data)
+        for rule, rule_failures in zip(self._rules, failures or ()):
+            if rule_failures:
+                return rule.build_error(rule_failures)
+        return None
+
+    def field_errors(self, data: Dict[str, Any]) -> List[Tuple[List[str], Exception]]:
+        failures = self._failures(data)
+        return [([field for field, _ in rule_failures], rule.build_error(rule_failures))
+                for rule, rule_failures in zip(self._rules, failures or ()) if rule_failures]
+
+    def _failures(self, data: Dict[str, Any]) -> Optional[List[List[Failure]]]:
+        failures = None
+        for field, value in data.items():
+            checks = self._checks_by_field.get(field) or self._compile(field)
+            for position, check in checks:
+                detail = check(value)
+                if detail is not None:
+                    if failures is None:
+                        failures = [[] for _ in self._rules]
+                    failures[position].append((field, detail))
+        return failures
+
+    def _compile(self, field: str) -> List[Tuple[int, Check]]:
+        checks = [(position, check) for position, rule in enumerate(self._rules)
+                  if (check := rule.compile_field(field)) is not None]
+        self._checks_by_field[field] = checks
+        return checks
+
+
+def _fields_error(error: Callable[[List[str]], Exception]) -> Callable[[List[Failure]], Exception]:
+    return lambda failures: error([field for field, _ in failures])
+
+
+def _first_error(failures: List[Failure]) -> Exception:
+    return failures[0][1]
+
+
+def _without_spaces(value: Any) -> str:
+    return ''.join(str(value).split())
+
+
+def empty_fields(fields_not_mandatory: List[str]) -> Rule:
+    fields_not_mandatory = frozenset(fields_not_mandatory)
+
+    def compile_field(field: str) -> Optional[Check]:
+        if field in fields_not_mandatory:
+            return None
+        return lambda value: True if not value or str(value).strip() == '' else None
+
+    return Rule(compile_field, _fields_error(EmptyFieldsError))
+
+
+def str_fields(fields_not_str: List[str]) -> Rule:
+    fields_not_str = frozenset(fields_not_str)
+
+    def compile_field(field: str) -> Optional[Check]:
+        if field in fields_not_str:
+            return None
+        return lambda value: True if value and not isinstance(value, str) else None
+
+    return Rule(compile_field, _fields_error(lambda fields: TypeError(fields, 'str')))
+
+
+def bool_fields(fields_bool: List[str]) -> Rule:
+    fields_bool = frozenset(fields_bool)
+
+    def compile_field(field: str) -> Optional[Check]:
+        if field not in fields_bool:
+            return None
+        return lambda value: True if value and not isinstance(value, bool) else None
+
+    return Rule(compile_field, _fields_error(lambda fields: TypeError(fields, 'bool')))
+
+
+def positive_fields(fields: List[str], kind: type, description: str) -> Rule:
+    fields = frozenset(fields)
+
+    def compile_field(field: str) -> Optional[Check]:
+        if field in fields:
+            return lambda value: True if (value and not isinstance(value, kind)) or \
+                                         (isinstance(value, kind) and value < 0) else None
+        return lambda value: True if isinstance(value, kind) and value < 0 else None
+
+    return Rule(compile_field, _fields_error(lambda failed_fields: TypeError(failed_fields, description)))
+
+
+def int_fields(fields_int: List[str]) -> Rule:
+    return positive_fields(fields_int, int, 'int positive')
+
+
+def float_fields(fields_float: List[str]) -> Rule:
+    return positive_fields(fields_float, float, 'float positive')
+
+
+def text_fields(fields: List[str], is_valid: Callable[[str], bool], text: str) -> Rule:
+    fields = frozenset(fields)
+
+    def compile_field(field: str) -> Optional[Check]:
+        if field not in fields:
+            return None
+        return lambda value: None if is_valid(_without_spaces(value)) else True
+
+    return Rule(compile_field, _fields_error(lambda failed_fields: TextError(failed_fields, text)))
+
+
+def alpha_fields(fields_alpha: List[str]) -> Rule:
+    return text_fields(fields_alpha, str.isalpha, 'letters')
+
+
+def numeric_fields(fields_numeric: List[str]) -> Rule:
+    return text_fields(fields_numeric, str.isnumeric, 'numbers')
+
+
+def alpha_numeric_fields(fields_alpha_numeric: List[str]) -> Rule:
+    return text_fields(fields_alpha_numeric, lambda value: value.isalpha() or value.isnumeric() or value.isalnum(),
+                       'letters or / and numbers')
+
+
+def validity_fields(fields_of_validity: List[str]) -> Rule:
+    fields_of_validity = frozenset(fields_of_validity)
+
+    def check(value: Any) -> Optional[Exception]:
+        try:
+            date = datetime.datetime.strptime(value, '%Y-%m-%d')
+        except ValueError:
+            return ValidityError('incorrect')
+        except builtins.TypeError as error:
+            return error
+        return ValidityError('expired') if date < datetime.datetime.now() else None
+
+    return Rule(lambda field: check if field in fields_of_validity else None, _first_error)
+
+
+def email_field() -> Rule:
+    def check(value: Any) -> Optional[Exception]:
+        try:
+            return None if EMAIL_PATTERN.search(value) else EmailError()
+        except builtins.TypeError as error:
+            return error
+
+    return Rule(lambda field: check if field == 'email' else None, _first_error)
+
+
+def size_fields(max_or_min_or_exactly: str, is_invalid: Callable[[int, int], bool], sizes: Dict[str, int],
+                decimal_places: Dict[str, int] = None) -> Rule:
+    decimal_places = decimal_places or {}
+
+    def compile_field(field: str) -> Optional[Check]:
+        if field in sizes:
+            size = sizes[field]
+            return lambda value: size if is_invalid(len(str(value)), size) else None
+        if field in decimal_places:
+            places = decimal_places[field]
+            return lambda value: f'{places} decimal places' if len(str(value).rsplit('.')[-1]) > places else None
+        return None
+
+    def build_error(failures: List[Failure]) -> Exception:
+        return SizeError([size for _, size in failures], [field for field, _ in failures], max_or_min_or_exactly)
+
+    return Rule(compile_field, build_error)
+
+
+def maximum_size_fields(sizes: Dict[str, int], decimal_places: Dict[str, int] = None) -> Rule:
+    return size_fields('maximum', lambda length, size: length > size, sizes, decimal_places)
+
+
+def minimum_size_fields(sizes: Dict[str, int]) -> Rule:
+    return size_fields('minimum', lambda length, size: length < size, sizes)
+
+
+def equal_size_fields(sizes: Dict[str, int]) -> Rule:
+    return size_fields('exactly', lambda length, size: length != size, sizes)
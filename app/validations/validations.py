@@ -14,6 +14,13 @@ def validating_if_json_is_correct(list_of_allowed_fields: List[str], **data: Dic
         raise JsonError(list_of_allowed_fields)
 
 
+def extracting_changes(list_of_fields: List[str], data: Dict[str, Union[bool, str]], partial: bool = False,
+                       list_of_fields_not_mandatory: List[str] = ()) -> Dict[str, Union[bool, str]]:
+    if partial:
+        return {key: value for key, value in data.items() if key in list_of_fields}
+    return {key: data.get(key) for key in list_of_fields if key not in list_of_fields_not_mandatory or key in data.keys()}
+
+
 def validating_empty_fields(list_of_fields_not_mandatory: List[str], **data: Dict[str, Union[bool, str]]) -> NoReturn:
     fields_list = []
     for key, value in data.items():
@@ -0,0 +1,41 @@
+"""Compares the serial and the multi-process validation of product CSV rows.
+
+Usage: python -m benchmarks.import_validation_benchmark [rows] [workers]
+"""
+import os
+import sys
+import time
+from typing import Dict, List, Tuple
+
+from app.domains.import_csv.validation import validate_in_processes
+from app.domains.products.actions import validate_product_rows
+
+ROWS: int = 50000
+CHUNK_SIZE: int = 1000
+
+
+def product_rows(size: int) -> List[Tuple[int, Dict[str, str]]]:
+    return [(index + 2, {'name': 'leite', 'cost_values': '10.5', 'unit_box': '12', 'weight_unit': '1.0',
+                         'validity': '2099-12-31', 'sku': f'sku{index}', 'description': 'Leite integral',
+                         'category_line_id': 'category-line-id', 'supplier_id': 'supplier-id'})
+            for index in range(size)]
+
+
+def run(size: int, workers: int) -> None:
+    rows = product_rows(size)
+    print(f'rows: {size}, workers: {workers}')
+    started_at = time.perf_counter()
+    validate_product_rows(rows)
+    serial = time.perf_counter() - started_at
+    print(f'serial: {serial:.4f}s')
+    started_at = time.perf_counter()
+    for _ in validate_in_processes(rows, validate_product_rows, CHUNK_SIZE, workers):
+        pass
+    parallel = time.perf_counter() - started_at
+    print(f'processes: {parallel:.4f}s')
+    print(f'speedup: {serial / parallel:.2f}x')
+
+
+if __name__ == '__main__':
+    run(int(sys.argv[1]) if len(sys.argv) > 1 else ROWS,
+        int(sys.argv[2]) if len(sys.argv) > 2 else os.cpu_count() or 2)
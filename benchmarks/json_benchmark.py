@@ -0,0 +1,51 @@
+"""Compares the stdlib and orjson encoders on a GET /products payload.
+
+Usage: python -m benchmarks.json_benchmark [products]
+"""
+import datetime
+import sys
+import timeit
+from typing import Any, Dict, List
+
+from flask import Flask, jsonify
+
+from app.serialization import StdlibJSONEncoder, json_encoder_for, stream_json_array
+
+PRODUCTS: int = 10000
+REPEAT: int = 5
+
+
+def product_payload(size: int) -> List[Dict[str, Any]]:
+    now = datetime.datetime.now()
+    return [{'id': f'{index:036d}', 'active': True, 'name': 'leite', 'cost_values': 45.5,
+             'category_line_id': 'category-line-id', 'supplier_id': 'supplier-id', 'unit_box': 12,
+             'weight_unit': 1.0, 'validity': datetime.datetime(2099, 12, 31), 'sku': f'sku{index}',
+             'description': 'Leite integral', 'on_create': now, 'on_update': now} for index in range(size)]
+
+
+def measure(app: Flask, encoder: type, payload: List[Dict[str, Any]]) -> Dict[str, float]:
+    app.json_encoder = encoder
+    with app.test_request_context():
+        buffered = min(timeit.repeat(lambda: jsonify(payload).get_data(), number=1, repeat=REPEAT))
+        streamed = min(timeit.repeat(lambda: b''.join(stream_json_array(payload).iter_encoded()), number=1,
+                                     repeat=REPEAT))
+    return {'buffered': buffered, 'streamed': streamed}
+
+
+def run(size: int) -> None:
+    app = Flask(__name__)
+    payload = product_payload(size)
+    print(f'products: {size}')
+    stdlib = measure(app, StdlibJSONEncoder, payload)
+    print(f"stdlib: {stdlib['buffered']:.4f}s buffered, {stdlib['streamed']:.4f}s streamed")
+    encoder = json_encoder_for({'JSON_ENCODER': 'orjson'})
+    if encoder is StdlibJSONEncoder:
+        print('orjson is not installed')
+        return
+    fast = measure(app, encoder, payload)
+    print(f"orjson: {fast['buffered']:.4f}s buffered, {fast['streamed']:.4f}s streamed")
+    print(f"speedup: {stdlib['buffered'] / fast['buffered']:.2f}x")
+
+
+if __name__ == '__main__':
+    run(int(sys.argv[1]) if len(sys.argv) > 1 else PRODUCTS)
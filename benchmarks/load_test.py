@@ -0,0 +1,71 @@
+"""Sends concurrent requests to a running API and reports latency, throughput and the pool usage.
+
+Usage: python -m benchmarks.load_test [url] [requests] [concurrency]
+
+Run it against every worker count and pool size of a deployment, e.g.
+`python -m benchmarks.load_test http://localhost:5000/products?limit=100 5000 64`, and read the `checkedout` and
+`overflow` counters of `/health/db` printed at the end.
+"""
+import json
+import statistics
+import sys
+import time
+import urllib.error
+import urllib.request
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List, Tuple
+from urllib.parse import urlsplit
+
+URL: str = 'http://localhost:5000/categories'
+REQUESTS: int = 1000
+CONCURRENCY: int = 16
+TIMEOUT: int = 30
+
+
+def request(url: str) -> Tuple[int, float]:
+    started_at = time.perf_counter()
+    try:
+        with urllib.request.urlopen(url, timeout=TIMEOUT) as response:
+            response.read()
+            status = response.status
+    except urllib.error.HTTPError as error:
+        status = error.code
+    except (urllib.error.URLError, OSError):
+        status = 0
+    return status, time.perf_counter() - started_at
+
+
+def percentile(latencies: List[float], percent: int) -> float:
+    return latencies[min(len(latencies) - 1, int(len(latencies) * percent / 100))]
+
+
+def database_health(url: str) -> Dict[str, Any]:
+    parts = urlsplit(url)
+    try:
+        with urllib.request.urlopen(f'{parts.scheme}://{parts.netloc}/health/db', timeout=TIMEOUT) as response:
+            return json.loads(response.read())
+    except (urllib.error.URLError, OSError, ValueError) as error:
+        return {'status': f'unreachable ({error})'}
+
+
+def run(url: str, requests: int, concurrency: int) -> None:
+    started_at = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        results = list(executor.map(request, [url] * requests))
+    seconds = time.perf_counter() - started_at
+    latencies = sorted(latency * 1000 for _, latency in results)
+    statuses = Counter(status for status, _ in results)
+    print(f'url: {url}')
+    print(f'requests: {requests}, concurrency: {concurrency}, seconds: {seconds:.2f}')
+    print(f'throughput: {requests / seconds:,.1f} requests/s')
+    print(f'latency ms: mean {statistics.mean(latencies):.1f}, p50 {percentile(latencies, 50):.1f}, '
+          f'p95 {percentile(latencies, 95):.1f}, p99 {percentile(latencies, 99):.1f}, max {latencies[-1]:.1f}')
+    print('statuses: ' + ', '.join(f'{status or "error"}={count}' for status, count in sorted(statuses.items())))
+    print(f'database health: {json.dumps(database_health(url))}')
+
+
+if __name__ == '__main__':
+    run(sys.argv[1] if len(sys.argv) > 1 else URL,
+        int(sys.argv[2]) if len(sys.argv) > 2 else REQUESTS,
+        int(sys.argv[3]) if len(sys.argv) > 3 else CONCURRENCY)
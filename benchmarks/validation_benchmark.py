@@ -0,0 +1,44 @@
+"""Compares the per-field validator chain with the compiled product schema.
+
+Usage: python -m benchmarks.validation_benchmark [rows]
+"""
+import sys
+import timeit
+
+from app.domains.products.models import PRODUCT_SCHEMA, validating_size_of_fields
+from app.validations.validations import *
+
+ROWS: int = 10000
+REPEAT: int = 5
+
+
+def validating_product_chain(**data):
+    validating_empty_fields(['active', 'description'], **data)
+    validating_if_field_is_not_str(['active', 'on_create', 'on_update', 'cost_values', 'unit_box', 'weight_unit',
+                                    'validity'], **data)
+    validating_if_field_is_bool(['active'], **data)
+    validating_if_field_is_alpha(['name'], **data)
+    validating_validity(['validity'], **data)
+    validating_if_field_is_int(['unit_box'], **data)
+    validating_if_field_is_float(['cost_values', 'weight_unit'], **data)
+    validating_size_of_fields(**data)
+
+
+def product_rows(size: int) -> List[Dict[str, Union[float, int, str]]]:
+    return [{'name': 'Leite', 'cost_values': 10.5, 'unit_box': 12, 'weight_unit': 1.0, 'validity': '2099-12-31',
+             'sku': f'sku{index}', 'description': 'Leite integral', 'category_line_id': 'category-line-id',
+             'supplier_id': 'supplier-id'} for index in range(size)]
+
+
+def run(size: int) -> None:
+    rows = product_rows(size)
+    chain = min(timeit.repeat(lambda: [validating_product_chain(**row) for row in rows], number=1, repeat=REPEAT))
+    schema = min(timeit.repeat(lambda: [PRODUCT_SCHEMA.validate(row) for row in rows], number=1, repeat=REPEAT))
+    print(f'rows: {size}')
+    print(f'validator chain: {chain:.4f}s ({size / chain:,.0f} rows/s)')
+    print(f'compiled schema: {schema:.4f}s ({size / schema:,.0f} rows/s)')
+    print(f'speedup: {chain / schema:.2f}x')
+
+
+if __name__ == '__main__':
+    run(int(sys.argv[1]) if len(sys.argv) > 1 else ROWS)
@@ -0,0 +1,89 @@
+from typing import Any, Callable, Dict, Iterable, List, Optional
+from uuid import uuid4
+
+from sqlalchemy import select
+from sqlalchemy.exc import SQLAlchemyError
+from werkzeug.exceptions import HTTPException
+
+from app.exceptions.exceptions import JsonError, IdNotExistError, InvalidValueError
+from app.exceptions.exceptions_of_batch import BatchError, BatchSizeError
+from app.exceptions.exceptions_of_import import RepeatedDataError
+from database import db
+from database.repository import unit_of_work
+
+MAX_BATCH_SIZE: int = 1000
+
+Mapping = Dict[str, Any]
+
+
+def insert_batch(model: db.Model, items: Any, fields: List[str], validate: Callable[[Mapping], Any],
+                 optional_fields: Iterable[str] = (), unique_field: Optional[str] = None,
+                 convert: Callable[[Mapping], Mapping] = lambda mapping: mapping,
+                 after_insert: Callable[[List[str]], Any] = lambda ids: None, atomic: bool = True,
+                 max_size: int = MAX_BATCH_SIZE) -> Dict[str, Any]:
+    if not isinstance(items, list) or not items:
+        raise BatchError()
+    if len(items) > max_size:
+        raise BatchSizeError(max_size)
+    mappings, results = validate_batch(model, items, fields, validate, optional_fields, unique_field, convert)
+    failed = sum(1 for result in results if 'error' in result)
+    if failed and atomic:
+        return _batch_report(0, failed, [result for result in results if 'error' in result])
+    try:
+        with unit_of_work() as work:
+            work.insert_many(model, mappings)
+            after_insert([mapping['id'] for mapping in mappings])
+    except SQLAlchemyError:
+        raise IdNotExistError()
+    return _batch_report(len(mappings), failed, results)
+
+
+def validate_batch(model: db.Model, items: List[Any], fields: List[str], validate: Callable[[Mapping], Any],
+                   optional_fields: Iterable[str] = (), unique_field: Optional[str] = None,
+                   convert: Callable[[Mapping], Mapping] = lambda mapping: mapping) -> tuple:
+    required_fields = [field for field in fields if field not in optional_fields]
+    mappings, results, seen_values = [], [], set()
+    saved_values = _saved_values(model, unique_field, items)
+    for index, item in enumerate(items):
+        try:
+            if not isinstance(item, dict) or any(field not in item for field in required_fields):
+                raise JsonError(required_fields)
+            mapping = {field: item[field] for field in fields if field in item}
+            validate(mapping)
+            if unique_field:
+                if mapping[unique_field] in saved_values:
+                    raise InvalidValueError([unique_field])
+                if mapping[unique_field] in seen_values:
+                    raise RepeatedDataError([mapping[unique_field]])
+                seen_values.add(mapping[unique_field])
+            mapping = {**convert(mapping), 'id': str(uuid4())}
+        except HTTPException as error:
+            results.append({'index': index, 'error': error.description})
+            continue
+        except (TypeError, ValueError, KeyError):
+            results.append({'index': index, 'error': JsonError(required_fields).description})
+            continue
+        mappings.append(mapping)
+        results.append({'index': index, 'id': mapping['id']})
+    return mappings, results
+
+
+def _saved_values(model: db.Model, unique_field: Optional[str], items: List[Any]) -> set:
+    if not unique_field:
+        return set()
+    values = {item[unique_field] for item in items
+              if isinstance(item, dict) and isinstance(item.get(unique_field), str)}
+    if not values:
+        return set()
+    column = model.__table__.c[unique_field]
+    return {row[0] for row in db.session.execute(select([column]).where(column.in_(values)))}
+
+
+def _batch_report(created: int, failed: int, results: List[Mapping]) -> Dict[str, Any]:
+    return {'created': created, 'failed': failed, 'results': results}
+
+
+def batch_status(report: Dict[str, Any]) -> int:
+    if not report['failed']:
+        return 201
+    return 207 if report['created'] else 422
@@ -0,0 +1,136 @@
+import base64
+import binascii
+import datetime
+import json
+from typing import Any, Callable, Dict, List, Optional, Tuple, Mapping
+
+from sqlalchemy import and_, or_
+
+from app.exceptions.exceptions_of_pagination import LimitError, FieldsError, CursorError, FilterError, SortError
+from database import db
+
+DEFAULT_PAGE_LIMIT: int = 500
+MAX_PAGE_LIMIT: int = 500
+DEFAULT_PAGE_KEYS: Tuple[str, ...] = ('on_create', 'id')
+NEXT_CURSOR_HEADER: str = 'X-Next-Cursor'
+DEFAULT_SORT: str = 'on_create'
+
+
+def columns_of(model: db.Model, fields: List[str]) -> Dict[str, Any]:
+    return {field: getattr(model, field) for field in fields}
+
+
+def parse_page_arguments(args: Mapping[str, str], allowed_fields: List[str],
+                         default_fields: List[str] = None) -> Dict[str, Any]:
+    fields = default_fields or allowed_fields
+    if args.get('fields'):
+        fields = [field.strip() for field in args['fields'].split(',') if field.strip()]
+        not_allowed_fields = [field for field in fields if field not in allowed_fields]
+        if not fields or not_allowed_fields:
+            raise FieldsError(not_allowed_fields)
+    try:
+        limit = int(args.get('limit', DEFAULT_PAGE_LIMIT))
+    except ValueError:
+        raise LimitError(MAX_PAGE_LIMIT)
+    if not 1 <= limit <= MAX_PAGE_LIMIT:
+        raise LimitError(MAX_PAGE_LIMIT)
+    return {'fields': fields, 'limit': limit, 'after': args.get('after') or None}
+
+
+def parse_sort_argument(args: Mapping[str, str], allowed_fields: List[str],
+                        default_sort: str = DEFAULT_SORT) -> Dict[str, Any]:
+    sort = (args.get('sort') or default_sort).strip()
+    field = sort[1:] if sort.startswith('-') else sort
+    if field not in allowed_fields:
+        raise SortError(allowed_fields)
+    return {'keys': tuple(dict.fromkeys([field, 'id'])), 'descending': sort.startswith('-')}
+
+
+def parse_filter_arguments(args: Mapping[str, str], converters: Dict[str, Callable[[str], Any]]) -> Dict[str, Any]:
+    filters = {}
+    invalid_filters = []
+    for field, convert in converters.items():
+        if args.get(field):
+            try:
+                filters[field] = convert(args[field])
+            except ValueError:
+                invalid_filters.append(field)
+    if invalid_filters:
+        raise FilterError(invalid_filters)
+    return filters
+
+
+def to_bool(value: str) -> bool:
+    if value.lower() not in ('true', 'false'):
+        raise ValueError(value)
+    return value.lower() == 'true'
+
+
+def to_date(value: str) -> datetime.datetime:
+    return datetime.datetime.strptime(value, '%Y-%m-%d')
+
+
+def paginate(query, columns: Dict[str, Any], fields: List[str], limit: int, after: Optional[str],
+             keys: Tuple[str, ...] = DEFAULT_PAGE_KEYS,
+             descending: bool = False) -> Tuple[List[Dict[str, Any]], Optional[str]]:
+    selected_fields = list(dict.fromkeys([*fields, *keys]))
+    key_columns = [columns[key] for key in keys]
+    query = query.with_entities(*[columns[field].label(field) for field in selected_fields])
+    if after:
+        cursor_columns = {key: columns[key] for key in keys}
+        query = query.filter(_after(key_columns, decode_cursor(after, cursor_columns, descending), descending))
+    rows = query.order_by(*[column.desc() if descending else column for column in key_columns]).limit(limit + 1).all()
+    next_cursor = None
+    if len(rows) > limit:
+        rows = rows[:limit]
+        next_cursor = encode_cursor([getattr(rows[-1], key) for key in keys], keys, descending)
+    return [{field: getattr(row, field) for field in fields} for row in rows], next_cursor
+
+
+def next_page_headers(next_cursor: Optional[str]) -> Dict[str, str]:
+    return {NEXT_CURSOR_HEADER: next_cursor} if next_cursor else {}
+
+
+def encode_cursor(values: List[Any], keys: Tuple[str, ...] = DEFAULT_PAGE_KEYS, descending: bool = False) -> str:
+    encoded_values = [['datetime', value.isoformat()] if isinstance(value, datetime.datetime) else ['value', value]
+                      for value in values]
+    payload = {'keys': list(keys), 'descending': descending, 'values': encoded_values}
+    return base64.urlsafe_b64encode(json.dumps(payload).encode('utf-8')).decode('ascii')
+
+
+def decode_cursor(cursor: str, key_columns: Dict[str, Any], descending: bool = False) -> List[Any]:
+    try:
+        payload = json.loads(base64.urlsafe_b64decode(cursor.encode('ascii')))
+        values = [datetime.datetime.fromisoformat(value) if kind == 'datetime' else value
+                  for kind, value in payload['values']]
+        keys, cursor_descending = payload['keys'], payload['descending']
+    except (binascii.Error, UnicodeError, ValueError, TypeError, KeyError):
+        raise CursorError()
+    if keys != list(key_columns) or cursor_descending is not descending or len(values) != len(keys):
+        raise CursorError()
+    return [_checked_value(column, value) for column, value in zip(key_columns.values(), values)]
+
+
+def _checked_value(column: Any, value: Any) -> Any:
+    try:
+        python_type = column.type.python_type
+    except NotImplementedError:
+        return value
+    if python_type is datetime.datetime and isinstance(value, str):
+        try:
+            value = datetime.datetime.fromisoformat(value)
+        except ValueError:
+            raise CursorError()
+    if python_type is float and isinstance(value, int) and not isinstance(value, bool):
+        value = float(value)
+    if not isinstance(value, python_type) or (isinstance(value, bool) and python_type is not bool):
+        raise CursorError()
+    return value
+
+
+def _after(key_columns: List[Any], values: List[Any], descending: bool = False):
+    column, value = key_columns[0], values[0]
+    beyond = column < value if descending else column > value
+    if len(key_columns) == 1:
+        return beyond
+    return or_(beyond, and_(column == value, _after(key_columns[1:], values[1:], descending)))
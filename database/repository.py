@@ -1,14 +1,169 @@
+import datetime
+from contextlib import contextmanager
+from itertools import islice
+from typing import Any, Dict, Iterable, Iterator, List, Optional
+
+from sqlalchemy import bindparam, or_, select
+from sqlalchemy.dialects import postgresql
+
 from database import db
 
 _session = db.session
 
+UNIT_OF_WORK_DEPTH: str = 'unit_of_work_depth'
+
+
+class UnitOfWork:
+    def __init__(self, session: Optional[Any] = None):
+        self._session = session or _session
+
+    def __enter__(self) -> 'UnitOfWork':
+        self._session.info[UNIT_OF_WORK_DEPTH] = self._session.info.get(UNIT_OF_WORK_DEPTH, 0) + 1
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        depth = self._session.info[UNIT_OF_WORK_DEPTH] = self._session.info[UNIT_OF_WORK_DEPTH] - 1
+        if depth:
+            return
+        if exc_type is not None:
+            self._session.rollback()
+            return
+        try:
+            self._session.commit()
+        except Exception:
+            self._session.rollback()
+            raise
+
+    def add(self, model: db.Model) -> db.Model:
+        self._session.add(model)
+        return model
+
+    def add_all(self, models: Iterable[db.Model]) -> List[db.Model]:
+        models = list(models)
+        self._session.add_all(models)
+        return models
+
+    def flush(self) -> None:
+        self._session.flush()
+
+    def insert_many(self, model: db.Model, mappings: List[Dict[str, Any]]) -> int:
+        return insert_many(model, mappings)
+
+    def upsert_many(self, model: db.Model, mappings: List[Dict[str, Any]], key: str, update_fields: List[str]) -> int:
+        return upsert_many(model, mappings, key, update_fields)
+
+    @contextmanager
+    def savepoint(self) -> Iterator['UnitOfWork']:
+        transaction = self._session.begin_nested()
+        try:
+            yield self
+        except Exception:
+            transaction.rollback()
+            raise
+        transaction.commit()
+
+
+def unit_of_work() -> UnitOfWork:
+    return UnitOfWork()
+
+
+def in_unit_of_work() -> bool:
+    return _session.info.get(UNIT_OF_WORK_DEPTH, 0) > 0
+
 
 def save(model: db.Model):
     _session.add(model)
-    commit()
+    if not in_unit_of_work():
+        commit()
     return model
 
 
+def update_fields(model: db.Model, changes: Dict[str, Any]) -> Dict[str, Any]:
+    changed_fields = {field: value for field, value in changes.items() if getattr(model, field) != value}
+    for field, value in changed_fields.items():
+        setattr(model, field, value)
+    return changed_fields
+
+
+def insert_many(model: db.Model, mappings: List[Dict[str, Any]]) -> int:
+    if mappings:
+        _session.execute(model.__table__.insert(), mappings)
+    return len(mappings)
+
+
+def upsert_many(model: db.Model, mappings: List[Dict[str, Any]], key: str, update_fields: List[str]) -> int:
+    if not mappings:
+        return 0
+    if _session.get_bind().dialect.name == 'postgresql':
+        _session.execute(on_conflict_do_update(model, key, update_fields), mappings)
+        return len(mappings)
+    diff = diff_many(model, mappings, key, update_fields)
+    insert_many(model, diff['insert'])
+    update_many(model, diff['update'], key, update_fields)
+    return len(mappings)
+
+
+def diff_many(model: db.Model, mappings: List[Dict[str, Any]], key: str,
+              fields: List[str]) -> Dict[str, List[Dict[str, Any]]]:
+    diff = {'insert': [], 'update': [], 'unchanged': [], 'changes': []}
+    if not mappings:
+        return diff
+    table = model.__table__
+    saved_rows = {row[0]: row[1:] for row in _session.execute(
+        select([table.c[key], *[table.c[field] for field in fields]]).where(
+            table.c[key].in_({mapping[key] for mapping in mappings})))}
+    for mapping in mappings:
+        saved_values = saved_rows.get(mapping[key])
+        if saved_values is None:
+            diff['insert'].append(mapping)
+            continue
+        changes = {field: [saved_value, mapping[field]] for field, saved_value in zip(fields, saved_values)
+                   if mapping[field] != saved_value}
+        if changes:
+            diff['update'].append(mapping)
+            diff['changes'].append({key: mapping[key], 'changes': changes})
+        else:
+            diff['unchanged'].append(mapping)
+    return diff
+
+
+def save_diff(model: db.Model, diff: Dict[str, List[Dict[str, Any]]], key: str, update_fields: List[str]) -> int:
+    if _session.get_bind().dialect.name == 'postgresql':
+        return upsert_many(model, diff['insert'] + diff['update'], key, update_fields)
+    return insert_many(model, diff['insert']) + update_many(model, diff['update'], key, update_fields)
+
+
+def on_conflict_do_update(model: db.Model, key: str, update_fields: List[str]):
+    statement = postgresql.insert(model.__table__)
+    set_ = {field: statement.excluded[field] for field in update_fields}
+    if 'on_update' in model.__table__.c:
+        set_['on_update'] = datetime.datetime.now()
+    changed = or_(*[model.__table__.c[field].is_distinct_from(statement.excluded[field]) for field in update_fields])
+    return statement.on_conflict_do_update(index_elements=[key], set_=set_, where=changed)
+
+
+def update_many(model: db.Model, mappings: List[Dict[str, Any]], key: str, update_fields: List[str]) -> int:
+    if mappings:
+        table = model.__table__
+        statement = table.update().where(table.c[key] == bindparam(f'_{key}')) \
+            .values({field: bindparam(f'_{field}') for field in update_fields})
+        _session.execute(statement, [{f'_{field}': mapping[field] for field in {key, *update_fields}}
+                                     for mapping in mappings])
+    return len(mappings)
+
+
 def commit():
-    _session.commit()
+    if in_unit_of_work():
+        _session.flush()
+    else:
+        _session.commit()
+
+
+def rollback():
+    _session.rollback()
+
 
+def chunked(iterable: Iterable[Any], size: int) -> Iterator[List[Any]]:
+    iterator = iter(iterable)
+    while chunk := list(islice(iterator, size)):
+        yield chunk
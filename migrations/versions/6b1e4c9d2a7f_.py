@@ -0,0 +1,52 @@
+"""add indexes to the foreign keys and to the listing columns
+
+Revision ID: 6b1e4c9d2a7f
+Revises: dd7448450531
+Create Date: 2026-10-18 09:12:41.503218
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '6b1e4c9d2a7f'
+down_revision = 'dd7448450531'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_index('ix_category_lines_category_id', 'category_lines', ['category_id'], unique=False)
+    op.create_index('ix_suppliers_address_id', 'suppliers', ['address_id'], unique=False)
+    op.create_index('ix_suppliers_category_id', 'suppliers', ['category_id'], unique=False)
+    op.create_index('ix_products_category_line_id', 'products', ['category_line_id'], unique=False)
+    op.create_index('ix_products_supplier_id', 'products', ['supplier_id'], unique=False)
+
+    op.create_index('ix_addresses_on_create_id', 'addresses', ['on_create', 'id'], unique=False)
+    op.create_index('ix_categories_on_create_id', 'categories', ['on_create', 'id'], unique=False)
+    op.create_index('ix_category_lines_on_create_id', 'category_lines', ['on_create', 'id'], unique=False)
+    op.create_index('ix_suppliers_on_create_id', 'suppliers', ['on_create', 'id'], unique=False)
+    op.create_index('ix_products_on_create_id', 'products', ['on_create', 'id'], unique=False)
+
+    op.create_index('ix_suppliers_active_on_create_id', 'suppliers', ['on_create', 'id'], unique=False,
+                    postgresql_where=sa.text('active'), sqlite_where=sa.text('active'))
+    op.create_index('ix_products_active_on_create_id', 'products', ['on_create', 'id'], unique=False,
+                    postgresql_where=sa.text('active'), sqlite_where=sa.text('active'))
+
+
+def downgrade():
+    op.drop_index('ix_products_active_on_create_id', table_name='products')
+    op.drop_index('ix_suppliers_active_on_create_id', table_name='suppliers')
+
+    op.drop_index('ix_products_on_create_id', table_name='products')
+    op.drop_index('ix_suppliers_on_create_id', table_name='suppliers')
+    op.drop_index('ix_category_lines_on_create_id', table_name='category_lines')
+    op.drop_index('ix_categories_on_create_id', table_name='categories')
+    op.drop_index('ix_addresses_on_create_id', table_name='addresses')
+
+    op.drop_index('ix_products_supplier_id', table_name='products')
+    op.drop_index('ix_products_category_line_id', table_name='products')
+    op.drop_index('ix_suppliers_category_id', table_name='suppliers')
+    op.drop_index('ix_suppliers_address_id', table_name='suppliers')
+    op.drop_index('ix_category_lines_category_id', table_name='category_lines')
@@ -0,0 +1,34 @@
+"""materialize the final cost of the products
+
+Revision ID: 8e27b5d0c913
+Revises: c4d83a1f5e20
+Create Date: 2026-10-18 16:02:19.734581
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '8e27b5d0c913'
+down_revision = 'c4d83a1f5e20'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.add_column('products', sa.Column('final_cost', sa.Float(), nullable=True))
+    op.execute("""
+        UPDATE products SET final_cost = products.cost_values + (
+            SELECT categories.profit_percentage + category_lines.profit_percentage
+            FROM category_lines JOIN categories ON categories.id = category_lines.category_id
+            WHERE category_lines.id = products.category_line_id
+        )
+    """)
+    op.create_index('ix_products_final_cost_id', 'products', ['final_cost', 'id'], unique=False)
+
+
+def downgrade():
+    op.drop_index('ix_products_final_cost_id', table_name='products')
+    with op.batch_alter_table('products') as batch_op:
+        batch_op.drop_column('final_cost')
@@ -0,0 +1,33 @@
+"""index the product filters together with the listing order
+
+Revision ID: c4d83a1f5e20
+Revises: 6b1e4c9d2a7f
+Create Date: 2026-10-18 14:37:05.118462
+
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = 'c4d83a1f5e20'
+down_revision = '6b1e4c9d2a7f'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_index('ix_products_supplier_id_on_create_id', 'products', ['supplier_id', 'on_create', 'id'],
+                    unique=False)
+    op.create_index('ix_products_category_line_id_on_create_id', 'products', ['category_line_id', 'on_create', 'id'],
+                    unique=False)
+    op.create_index('ix_products_validity_id', 'products', ['validity', 'id'], unique=False)
+    op.drop_index('ix_products_supplier_id', table_name='products')
+    op.drop_index('ix_products_category_line_id', table_name='products')
+
+
+def downgrade():
+    op.create_index('ix_products_category_line_id', 'products', ['category_line_id'], unique=False)
+    op.create_index('ix_products_supplier_id', 'products', ['supplier_id'], unique=False)
+    op.drop_index('ix_products_validity_id', table_name='products')
+    op.drop_index('ix_products_category_line_id_on_create_id', table_name='products')
+    op.drop_index('ix_products_supplier_id_on_create_id', table_name='products')
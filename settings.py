@@ -18,3 +18,39 @@ SQLALCHEMY_DATABASE_URI = os.getenv('SQLALCHEMY_DATABASE_URI')
 SQLALCHEMY_TRACK_MODIFICATIONS = os.getenv('SQLALCHEMY_TRACK_MODIFICATIONS', True)
 HOST = os.getenv('HOST')
 PORT = os.getenv('PORT')
+DB_POOL_SIZE = int(os.getenv('DB_POOL_SIZE', 5))
+DB_MAX_OVERFLOW = int(os.getenv('DB_MAX_OVERFLOW', 10))
+DB_POOL_TIMEOUT = int(os.getenv('DB_POOL_TIMEOUT', 30))
+DB_POOL_RECYCLE = int(os.getenv('DB_POOL_RECYCLE', 1800))
+DB_POOL_PRE_PING = str(os.getenv('DB_POOL_PRE_PING', True)).lower() == 'true'
+DB_STATEMENT_TIMEOUT = int(os.getenv('DB_STATEMENT_TIMEOUT', 0))
+
+
+def engine_options(database_uri):
+    database_uri = database_uri or ''
+    if not database_uri or database_uri.startswith('sqlite'):
+        return {}
+    options = {'pool_size': DB_POOL_SIZE, 'max_overflow': DB_MAX_OVERFLOW, 'pool_timeout': DB_POOL_TIMEOUT,
+               'pool_recycle': DB_POOL_RECYCLE, 'pool_pre_ping': DB_POOL_PRE_PING}
+    if database_uri.startswith('postgresql'):
+        if database_uri.startswith('postgresql+psycopg2'):
+            options['executemany_mode'] = 'values'
+        if DB_STATEMENT_TIMEOUT:
+            options['connect_args'] = {'options': f'-c statement_timeout={DB_STATEMENT_TIMEOUT}'}
+    return options
+
+
+SQLALCHEMY_ENGINE_OPTIONS = engine_options(SQLALCHEMY_DATABASE_URI)
+IMPORT_CHUNK_SIZE = int(os.getenv('IMPORT_CHUNK_SIZE', 1000))
+IMPORT_SPOOL_DIR = os.getenv('IMPORT_SPOOL_DIR')
+IMPORT_WORKERS = int(os.getenv('IMPORT_WORKERS', 2))
+IMPORT_EXECUTOR = os.getenv('IMPORT_EXECUTOR', 'thread')
+IMPORT_JOB_TTL = int(os.getenv('IMPORT_JOB_TTL', 86400))
+IMPORT_VALIDATION_WORKERS = int(os.getenv('IMPORT_VALIDATION_WORKERS') or os.cpu_count() or 2)
+# Without CACHE_REDIS_URL every gunicorn worker keeps its own cache, and a write only invalidates the responses cached
+# by the worker that served it: the others may answer with stale data for up to CACHE_TTL seconds. Set it whenever
+# more than one worker serves the API.
+CACHE_TTL = int(os.getenv('CACHE_TTL', 300))
+CACHE_MAX_SIZE = int(os.getenv('CACHE_MAX_SIZE', 1024))
+CACHE_REDIS_URL = os.getenv('CACHE_REDIS_URL')
+JSON_ENCODER = os.getenv('JSON_ENCODER', 'orjson')
@@ -1,10 +1,19 @@
+import csv
+import datetime
+import io
 import unittest
+from contextlib import contextmanager
+from uuid import uuid4
+
+from sqlalchemy import event
 
 from app import create_app, db
 from app.domains.users.models import User
 from app.domains.suppliers.models import Supplier
 from app.domains.addresses.models import Address
 from app.domains.categories.models import Category
+from app.domains.category_lines.models import CategoryLine
+from app.domains.products.models import Product
 
 
 class AbstractViewUnitTest(unittest.TestCase):
@@ -16,3 +25,69 @@ class AbstractViewUnitTest(unittest.TestCase):
 
     def tearDown(self) -> None:
         db.drop_all(app=self._app)
+
+
+class AbstractDatabaseUnitTest(AbstractViewUnitTest):
+
+    def setUp(self) -> None:
+        super().setUp()
+        self._context = self._app.app_context()
+        self._context.push()
+
+    def tearDown(self) -> None:
+        db.session.remove()
+        super().tearDown()
+        self._context.pop()
+
+    def _insert(self, model: db.Model, **data) -> str:
+        data.setdefault('id', str(uuid4()))
+        db.session.execute(model.__table__.insert(), [data])
+        db.session.commit()
+        return data['id']
+
+    def _insert_catalogue(self, size: int, category_percentage: float = 20.0,
+                          category_line_percentage: float = 15.0) -> dict:
+        category_id = self._insert(Category, name=f'category{uuid4().hex}', profit_percentage=category_percentage)
+        category_line_id = self._insert(CategoryLine, category_line=f'line{uuid4().hex}', category_id=category_id,
+                                        profit_percentage=category_line_percentage)
+        address_id = self._insert(Address, street='Rua XV', number='10', zip_code='89000000', city='Blumenau',
+                                  state='SC')
+        supplier_id = self._insert(Supplier, company_name='Nestle', cnpj=str(uuid4().int)[:14],
+                                   trading_name='Nestle', phone='4733333333', email='nestle@nestle.com',
+                                   address_id=address_id, category_id=category_id)
+        products = [{'id': str(uuid4()), 'name': 'product', 'cost_values': 10.0 + index,
+                     'final_cost': 10.0 + index + category_percentage + category_line_percentage, 'unit_box': 5,
+                     'weight_unit': 0.5, 'validity': datetime.datetime(2099, 12, 31), 'sku': f'sku{uuid4().hex}',
+                     'description': 'Descrição...', 'category_line_id': category_line_id,
+                     'supplier_id': supplier_id} for index in range(size)]
+        if products:
+            db.session.execute(Product.__table__.insert(), products)
+            db.session.commit()
+        return {'category_id': category_id, 'category_line_id': category_line_id, 'address_id': address_id,
+                'supplier_id': supplier_id, 'product_ids': [product['id'] for product in products]}
+
+    def _product_row(self, catalogue: dict, sku: str, **data) -> dict:
+        return {'name': 'produto', 'cost_values': '10.5', 'unit_box': '5', 'weight_unit': '0.5',
+                'validity': '2099-12-31', 'sku': sku, 'description': 'Descrição...',
+                'category_line_id': catalogue['category_line_id'], 'supplier_id': catalogue['supplier_id'], **data}
+
+    def _csv_file(self, rows: list) -> io.StringIO:
+        csv_file = io.StringIO()
+        writer = csv.DictWriter(csv_file, fieldnames=rows[0].keys())
+        writer.writeheader()
+        writer.writerows(rows)
+        csv_file.seek(0)
+        return csv_file
+
+    @contextmanager
+    def _count_statements(self):
+        statements = []
+
+        def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+            statements.append(statement)
+
+        event.listen(db.engine, 'before_cursor_execute', _before_cursor_execute)
+        try:
+            yield statements
+        finally:
+            event.remove(db.engine, 'before_cursor_execute', _before_cursor_execute)
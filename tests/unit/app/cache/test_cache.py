@@ -0,0 +1,149 @@
+import time
+import unittest
+from fnmatch import fnmatchcase
+from typing import Any, Callable, Dict, Optional
+from unittest.mock import MagicMock
+
+from app.cache import MemoryCache, RedisCache, Cache, MISSING, create_backend
+
+
+class FakeRedis:
+    def __init__(self, clock: Callable[[], float] = time.monotonic):
+        self._clock = clock
+        self._values: Dict[str, Any] = {}
+
+    def get(self, name: str) -> Optional[bytes]:
+        value, expires_at = self._values.get(name, (None, None))
+        if expires_at is not None and expires_at <= self._clock():
+            del self._values[name]
+            return None
+        return value
+
+    def set(self, name: str, value: str, ex: Optional[int] = None) -> bool:
+        self._values[name] = (value.encode('utf-8'), self._clock() + ex if ex else None)
+        return True
+
+    def delete(self, *names: str) -> int:
+        return len([self._values.pop(name) for name in names if name in self._values])
+
+    def scan_iter(self, match: str = '*'):
+        return iter([name for name in list(self._values) if fnmatchcase(name, match)])
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class TestMemoryCache(unittest.TestCase):
+
+    def test_get_should_return_missing_after_the_ttl(self):
+        # Arrange
+        clock = FakeClock()
+        cache = MemoryCache(max_size=10, ttl=60, clock=clock)
+        cache.set('sum:1', 35.0)
+
+        # Action
+        before_ttl = cache.get('sum:1')
+        clock.now = 60.0
+        after_ttl = cache.get('sum:1')
+
+        # Assertions
+        self.assertEqual(35.0, before_ttl)
+        self.assertIs(MISSING, after_ttl)
+        self.assertEqual(0, len(cache))
+
+    def test_set_should_evict_the_least_recently_used_key(self):
+        # Arrange
+        cache = MemoryCache(max_size=2, ttl=60)
+        cache.set('sum:1', 1.0)
+        cache.set('sum:2', 2.0)
+        cache.get('sum:1')
+
+        # Action
+        cache.set('sum:3', 3.0)
+
+        # Assertions
+        self.assertEqual(1.0, cache.get('sum:1'))
+        self.assertIs(MISSING, cache.get('sum:2'))
+        self.assertEqual(3.0, cache.get('sum:3'))
+
+
+class TestRedisCache(unittest.TestCase):
+
+    def test_redis_cache_should_share_the_values_between_instances(self):
+        # Arrange
+        client = FakeRedis()
+        worker = RedisCache(client, 'percentages', ttl=60)
+        other_worker = RedisCache(client, 'percentages', ttl=60)
+
+        # Action
+        worker.set('sum:1', 35.0)
+
+        # Assertions
+        self.assertEqual(35.0, other_worker.get('sum:1'))
+
+    def test_redis_cache_should_expire_the_values(self):
+        # Arrange
+        clock = FakeClock()
+        cache = RedisCache(FakeRedis(clock), 'percentages', ttl=60)
+        cache.set('sum:1', 35.0)
+
+        # Action
+        clock.now = 61.0
+
+        # Assertions
+        self.assertIs(MISSING, cache.get('sum:1'))
+
+    def test_clear_should_delete_only_the_keys_of_the_namespace(self):
+        # Arrange
+        client = FakeRedis()
+        cache = RedisCache(client, 'percentages', ttl=60)
+        other_cache = RedisCache(client, 'pages', ttl=60)
+        cache.set('sum:1', 35.0)
+        cache.set('category:1', 20.0)
+        other_cache.set('sum:1', 1.0)
+
+        # Action
+        cache.clear()
+
+        # Assertions
+        self.assertIs(MISSING, cache.get('sum:1'))
+        self.assertIs(MISSING, cache.get('category:1'))
+        self.assertEqual(1.0, other_cache.get('sum:1'))
+
+
+class TestCache(unittest.TestCase):
+
+    def test_get_or_load_should_load_the_value_only_once(self):
+        # Arrange
+        cache = Cache('percentages')
+        load = MagicMock(return_value=35.0)
+
+        # Action
+        values = [cache.get_or_load('sum:1', load) for _ in range(3)]
+
+        # Assertions
+        self.assertEqual([35.0] * 3, values)
+        load.assert_called_once_with()
+
+    def test_delete_should_load_the_value_again(self):
+        # Arrange
+        cache = Cache('percentages')
+        cache.get_or_load('sum:1', lambda: 35.0)
+
+        # Action
+        cache.delete('sum:1')
+
+        # Assertions
+        self.assertEqual(40.0, cache.get_or_load('sum:1', lambda: 40.0))
+
+    def test_create_backend_should_be_a_memory_cache_without_redis_url(self):
+        # Action
+        backend = create_backend({'CACHE_TTL': 10, 'CACHE_MAX_SIZE': 5, 'CACHE_REDIS_URL': None}, 'percentages')
+
+        # Assertions
+        self.assertIsInstance(backend, MemoryCache)
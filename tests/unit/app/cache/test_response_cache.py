@@ -0,0 +1,146 @@
+import itertools
+import unittest
+from unittest.mock import patch
+
+from flask import Flask
+
+from app.cache import ResponseCache
+from app.domains.categories.actions import create as create_category, update as update_category
+from tests.unit import AbstractDatabaseUnitTest
+from tests.unit.app.cache.test_cache import FakeRedis
+
+
+class TestResponseCacheKeys(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self._cache = ResponseCache('responses', {'categories': '/categories'})
+
+    def test_key_of_should_only_cache_reads_of_the_collections_and_their_items(self):
+        # Action
+        list_key = self._cache.key_of('GET', '/categories', 'limit=10')
+        item_key = self._cache.key_of('GET', '/categories/1', '')
+
+        # Assertions
+        self.assertTrue(list_key.startswith('categories:list:'))
+        self.assertTrue(list_key.endswith(':limit=10'))
+        self.assertTrue(item_key.startswith('categories:item:1:'))
+        self.assertIsNone(self._cache.key_of('POST', '/categories', ''))
+        self.assertIsNone(self._cache.key_of('GET', '/categories:export', ''))
+        self.assertIsNone(self._cache.key_of('GET', '/products', ''))
+
+    def test_invalidate_should_change_the_keys_of_the_lists(self):
+        # Arrange
+        list_key = self._cache.key_of('GET', '/categories', '')
+
+        # Action
+        self._cache.invalidate('categories')
+
+        # Assertions
+        self.assertNotEqual(list_key, self._cache.key_of('GET', '/categories', ''))
+
+    def test_invalidate_should_change_the_key_of_the_item_only(self):
+        # Arrange
+        item_key = self._cache.key_of('GET', '/categories/1', '')
+        other_item_key = self._cache.key_of('GET', '/categories/2', '')
+
+        # Action
+        self._cache.invalidate('categories', '1')
+
+        # Assertions
+        self.assertNotEqual(item_key, self._cache.key_of('GET', '/categories/1', ''))
+        self.assertEqual(other_item_key, self._cache.key_of('GET', '/categories/2', ''))
+
+    def test_read_that_loaded_the_item_before_an_invalidation_should_not_be_served_after_it(self):
+        # Arrange
+        app = Flask(__name__)
+        self._cache.init_app(app)
+        calls = itertools.count(1)
+
+        def read(id):
+            body = {'id': id, 'calls': next(calls)}
+            if body['calls'] == 1:
+                self._cache.invalidate('categories', id)
+            return body
+
+        app.route('/categories/<id>')(read)
+        client = app.test_client()
+
+        # Action
+        stale = client.get('/categories/1')
+        fresh = client.get('/categories/1')
+
+        # Assertions
+        self.assertEqual({'id': '1', 'calls': 1}, stale.get_json())
+        self.assertEqual({'id': '1', 'calls': 2}, fresh.get_json())
+
+    def test_invalidate_should_work_on_the_shared_storage(self):
+        # Arrange
+        app = Flask(__name__)
+        app.config['CACHE_REDIS_URL'] = 'redis://localhost:6379/0'
+        with patch('app.cache.redis') as redis_mock:
+            redis_mock.Redis.from_url.return_value = FakeRedis()
+            self._cache.init_app(app)
+        calls = itertools.count(1)
+        app.route('/categories/<id>')(lambda id: {'id': id, 'calls': next(calls)})
+        client = app.test_client()
+        client.get('/categories/1')
+
+        # Action
+        cached = client.get('/categories/1')
+        self._cache.invalidate('categories', '1')
+        invalidated = client.get('/categories/1')
+
+        # Assertions
+        self.assertEqual({'id': '1', 'calls': 1}, cached.get_json())
+        self.assertEqual({'id': '1', 'calls': 2}, invalidated.get_json())
+
+
+class TestResponseCache(AbstractDatabaseUnitTest):
+
+    def test_read_should_be_served_from_the_cache_until_a_write(self):
+        # Arrange
+        self._insert_catalogue(0)
+        first = self._client.get('/categories')
+
+        # Action
+        with patch('app.domains.categories.views.get_category_page') as get_page_mock:
+            cached = self._client.get('/categories')
+            get_page_mock.assert_not_called()
+        create_category({'name': 'bebidas', 'profit_percentage': 10.0})
+        refreshed = self._client.get('/categories')
+
+        # Assertions
+        self.assertEqual(first.get_json(), cached.get_json())
+        self.assertEqual(first.headers['ETag'], cached.headers['ETag'])
+        self.assertEqual(len(first.get_json()) + 1, len(refreshed.get_json()))
+
+    def test_update_should_invalidate_only_the_updated_item(self):
+        # Arrange
+        catalogue = self._insert_catalogue(0)
+        other_catalogue = self._insert_catalogue(0)
+        self._client.get(f"/categories/{catalogue['category_id']}")
+        self._client.get(f"/categories/{other_catalogue['category_id']}")
+
+        # Action
+        update_category(catalogue['category_id'], {'profit_percentage': 30.0}, partial=True)
+        with patch('app.domains.categories.views.get_category_by_id') as get_by_id_mock:
+            get_by_id_mock.return_value.serialize.return_value = {'profit_percentage': 30.0}
+            updated = self._client.get(f"/categories/{catalogue['category_id']}")
+            other = self._client.get(f"/categories/{other_catalogue['category_id']}")
+
+        # Assertions
+        get_by_id_mock.assert_called_once_with(catalogue['category_id'])
+        self.assertEqual(30.0, updated.get_json()['profit_percentage'])
+        self.assertEqual(20.0, other.get_json()['profit_percentage'])
+
+    def test_cached_read_should_answer_conditional_requests(self):
+        # Arrange
+        self._insert_catalogue(0)
+        etag = self._client.get('/suppliers').headers['ETag']
+        self._client.get('/suppliers')
+
+        # Action
+        response = self._client.get('/suppliers', headers={'If-None-Match': etag})
+
+        # Assertions
+        self.assertEqual(304, response.status_code)
@@ -0,0 +1,85 @@
+from unittest.mock import patch
+
+from werkzeug.http import http_date
+
+from app.domains.suppliers.actions import update as update_supplier
+from tests.unit import AbstractDatabaseUnitTest
+
+
+class TestConditional(AbstractDatabaseUnitTest):
+
+    def test_collection_should_return_304_when_the_etag_matches(self):
+        # Arrange
+        self._insert_catalogue(1)
+        etag = self._client.get('/suppliers').headers['ETag']
+
+        # Action
+        with patch('app.domains.suppliers.views.get_supplier_page') as get_page_mock:
+            response = self._client.get('/suppliers', headers={'If-None-Match': etag})
+
+        # Assertions
+        get_page_mock.assert_not_called()
+        self.assertEqual(304, response.status_code)
+        self.assertEqual(b'', response.data)
+        self.assertEqual(etag, response.headers['ETag'])
+
+    def test_collection_etag_should_change_when_a_row_is_updated(self):
+        # Arrange
+        catalogue = self._insert_catalogue(1)
+        etag = self._client.get('/suppliers').headers['ETag']
+        update_supplier(catalogue['supplier_id'], {'trading_name': 'Nestle Brasil'}, partial=True)
+
+        # Action
+        response = self._client.get('/suppliers', headers={'If-None-Match': etag})
+
+        # Assertions
+        self.assertEqual(200, response.status_code)
+        self.assertNotEqual(etag, response.headers['ETag'])
+        self.assertEqual(1, len(response.get_json()))
+
+    def test_collection_etag_should_change_when_a_row_is_inserted(self):
+        # Arrange
+        self._insert_catalogue(1)
+        etag = self._client.get('/products').headers['ETag']
+        self._insert_catalogue(1)
+
+        # Action
+        response = self._client.get('/products', headers={'If-None-Match': etag})
+
+        # Assertions
+        self.assertEqual(200, response.status_code)
+        self.assertEqual(2, len(response.get_json()))
+
+    def test_item_should_return_304_when_it_was_not_modified_since(self):
+        # Arrange
+        catalogue = self._insert_catalogue(1)
+        product_id = catalogue['product_ids'][0]
+        last_modified = self._client.get(f'/products/{product_id}').headers['Last-Modified']
+
+        # Action
+        with patch('app.domains.products.views.get_product_by_id_with_final_cost') as get_by_id_mock:
+            response = self._client.get(f'/products/{product_id}', headers={'If-Modified-Since': last_modified})
+
+        # Assertions
+        get_by_id_mock.assert_not_called()
+        self.assertEqual(304, response.status_code)
+
+    def test_item_should_return_200_when_it_was_modified_since(self):
+        # Arrange
+        catalogue = self._insert_catalogue(1)
+
+        # Action
+        response = self._client.get(f"/products/{catalogue['product_ids'][0]}",
+                                    headers={'If-Modified-Since': http_date(0)})
+
+        # Assertions
+        self.assertEqual(200, response.status_code)
+        self.assertEqual(catalogue['product_ids'][0], response.get_json()[0]['id'])
+
+    def test_item_should_keep_raising_when_the_id_does_not_exist(self):
+        # Action
+        response = self._client.get('/products/unknown', headers={'If-None-Match': '*'})
+
+        # Assertions
+        self.assertEqual(400, response.status_code)
+        self.assertNotIn('ETag', response.headers)
@@ -68,15 +68,28 @@ class TestCategoriesViews(AbstractViewUnitTest):
                                                          'zip_code': '00000-000', 'city': 'Blumenau',
                                                          'state': 'Santa Catarina'})
 
-    @patch('app.domains.addresses.views.get_addresses')
-    def test_get_addresses_should_be_called_once(self, get_address_mock):
+    @patch('app.domains.addresses.views.update_address')
+    def test_patch_address_should_be_partially_updated(self, update_address_mock):
         # Arrange
         id = str(uuid4())
         obj_view = Mock()
-        obj_view.serialize = MagicMock(return_value={'id': id, 'active': True, 'street': 'Rua dos Testes',
-                                                     'number': '123', 'complement': 'Testando', 'zip_code': '00000-000',
-                                                     'city': 'Blumenau', 'state': 'Santa Catarina'})
-        get_address_mock.return_value = [obj_view]
+        obj_view.serialize = MagicMock(return_value={'id': id, 'active': False})
+        update_address_mock.return_value = obj_view
+
+        # Action
+        response = self._client.patch('/addresses/{}'.format(id), json={'active': False})
+
+        # Assertions
+        self.assertEqual(response.status_code, 200)
+        update_address_mock.assert_called_once_with(id, {'active': False}, partial=True)
+
+    @patch('app.domains.addresses.views.get_address_page')
+    def test_get_addresses_should_be_called_once(self, get_address_mock):
+        # Arrange
+        id = str(uuid4())
+        get_address_mock.return_value = ([{'id': id, 'active': True, 'street': 'Rua dos Testes', 'number': '123',
+                                           'complement': 'Testando', 'zip_code': '00000-000', 'city': 'Blumenau',
+                                           'state': 'Santa Catarina'}], None)
 
         # Action
         response = self._client.get('/addresses')
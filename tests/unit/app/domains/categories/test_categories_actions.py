@@ -9,7 +9,9 @@ from app.domains.categories.actions import get_by_id, \
     update, \
     create, \
     get, \
-    inserting_categories_names_from_the_csv_file_in_db
+    inserting_categories_names_from_the_csv_file_in_db, \
+    import_categories
+from tests.unit import AbstractDatabaseUnitTest
 
 
 class TestCategoriesActions(unittest.TestCase):
@@ -194,15 +196,17 @@ class TestCategoriesActions(unittest.TestCase):
         self.assertEqual('Bad Request', exc.value.name)
         self.assertEqual('The ID(s) inserted does not exist in the database', exc.value.description)
 
+    @patch('app.domains.categories.actions.unit_of_work')
     @patch('app.domains.categories.actions.Category')
     @patch('app.domains.categories.actions.save')
-    @patch('app.domains.categories.actions.import_csv_file')
+    @patch('app.domains.categories.actions.iter_csv_file')
     @patch('app.domains.categories.actions.get')
     def test_action_inserting_categories_names_from_the_csv_file_in_db_should_return_a_list_of_saved_categories(self,
                                                                                                                 get_mock,
                                                                                                                 import_csv_mock,
                                                                                                                 save_mock,
-                                                                                                                category_mock):
+                                                                                                                category_mock,
+                                                                                                                unit_of_work_mock):
         # Arrange
         category = Mock()
         category.name = 'category 1'
@@ -222,15 +226,17 @@ class TestCategoriesActions(unittest.TestCase):
         self.assertEqual([{'name': 'category 2'}], import_csv_mock.return_value)
         self.assertEqual([save_mock()], response)
 
+    @patch('app.domains.categories.actions.unit_of_work')
     @patch('app.domains.categories.actions.Category')
     @patch('app.domains.categories.actions.save')
-    @patch('app.domains.categories.actions.import_csv_file')
+    @patch('app.domains.categories.actions.iter_csv_file')
     @patch('app.domains.categories.actions.get')
     def test_action_inserting_categories_names_from_the_csv_file_in_db_should_raise_a_repeated_data_error(self,
                                                                                                           get_mock,
                                                                                                           import_csv_mock,
                                                                                                           save_mock,
-                                                                                                          category_mock):
+                                                                                                          category_mock,
+                                                                                                          unit_of_work_mock):
         # Arrange
         id = str(uuid4())
         get_mock.return_value = [category_mock]
@@ -247,15 +253,17 @@ class TestCategoriesActions(unittest.TestCase):
         self.assertEqual('The following values are repeated in the file, but will be added only once: category 1',
                          exc.value.description)
 
+    @patch('app.domains.categories.actions.unit_of_work')
     @patch('app.domains.categories.actions.Category')
     @patch('app.domains.categories.actions.save')
-    @patch('app.domains.categories.actions.import_csv_file')
+    @patch('app.domains.categories.actions.iter_csv_file')
     @patch('app.domains.categories.actions.get')
     def test_action_inserting_categories_names_from_the_csv_file_in_db_should_raise_a_data_already_exists_error(self,
                                                                                                                 get_mock,
                                                                                                                 import_csv_mock,
                                                                                                                 save_mock,
-                                                                                                                category_mock):
+                                                                                                                category_mock,
+                                                                                                                unit_of_work_mock):
         # Arrange
         category_mock.side_effect = DataAlreadyExistsError
         with pytest.raises(DataAlreadyExistsError) as exc:
@@ -267,3 +275,47 @@ class TestCategoriesActions(unittest.TestCase):
         self.assertEqual(400, exc.value.code)
         self.assertEqual('Bad Request', exc.value.name)
         self.assertEqual('All the data in the file has already been added', exc.value.description)
+
+
+    @patch('app.domains.categories.actions.unit_of_work')
+    @patch('app.domains.categories.actions.Category')
+    @patch('app.domains.categories.actions.save')
+    @patch('app.domains.categories.actions.iter_csv_file')
+    @patch('app.domains.categories.actions.get')
+    def test_action_inserting_categories_names_from_the_csv_file_in_db_should_report_the_row_that_failed(self,
+                                                                                                         get_mock,
+                                                                                                         import_csv_mock,
+                                                                                                         save_mock,
+                                                                                                         category_mock,
+                                                                                                         unit_of_work_mock):
+        # Arrange
+        get_mock.return_value = []
+        import_csv_mock.return_value = [{'name': 'category 1'}, {'name': 'category 2'}]
+        unit_of_work_mock.return_value.__enter__.return_value.flush.side_effect = [None, SQLAlchemyError]
+        with pytest.raises(RepeatedDataError) as exc:
+
+            # Action
+            inserting_categories_names_from_the_csv_file_in_db(['name', 'category 1', 'category 2'], 'name')
+
+        # Assertions
+        self.assertEqual(2, save_mock.call_count)
+        self.assertEqual('The following values are repeated in the file, but will be added only once: category 2',
+                         exc.value.description)
+
+
+class TestCategoriesImportActions(AbstractDatabaseUnitTest):
+
+    def test_action_import_categories_should_count_the_new_names_without_inserting_if_it_is_a_dry_run(self):
+        # Arrange
+        self._insert(Category, name='Bebidas ', profit_percentage=10.0)
+        csv_file = self._csv_file([{'name': 'bebidas'}, {'name': 'doces'}, {'name': 'Doces'}, {'name': 'carnes'}])
+
+        # Action
+        report = import_categories(csv_file, dry_run=True)
+
+        # Assertions
+        self.assertEqual((2, 2), (report['inserted'], report['skipped']))
+        self.assertEqual([{'action': 'insert', 'name': 'carnes'}, {'action': 'insert', 'name': 'doces'}],
+                         report['sample'])
+        self.assertEqual(['Bebidas '], [category.name for category in get()])
+
@@ -4,18 +4,15 @@ import pytest
 
 from app.exceptions.exceptions import JsonError
 from app.domains.products.views import validating_if_json_is_correct
-from app.domains.export_csv.actions import create_csv_file
 from tests.unit import AbstractViewUnitTest
 
 
 class TestCategoriesViews(AbstractViewUnitTest):
 
-    @patch('app.domains.categories.views.get_category')
+    @patch('app.domains.categories.views.get_category_page')
     def test_get_categories(self, get_category_mock):
         # Arrange
-        obj_view = Mock()
-        obj_view.serialize = MagicMock(return_value={})
-        get_category_mock.return_value = [obj_view]
+        get_category_mock.return_value = ([{}], None)
 
         # Action
         response = self._client.get('/categories')
@@ -87,7 +84,7 @@ class TestCategoriesViews(AbstractViewUnitTest):
         update_category_mock.assert_called_once_with(_id, {'name': 'BBB'})
         self.assertEqual(response.status_code, 200)
 
-    @patch('app.domains.categories.views.get_category')
+    @patch('app.domains.categories.views.get_categories_in_batches')
     def test_if_export_is_sending_file_to_download(self, get_category_mock):
         # Arrange
         obj_view = Mock()
@@ -133,6 +130,22 @@ class TestCategoriesViews(AbstractViewUnitTest):
         self.assertEqual(3, len(data))
         self.assertEqual(json, [{'teste': 'teste'}, {'teste2': 'teste2'}])
 
+    @patch('app.domains.categories.views.insert_data')
+    @patch('app.domains.categories.views.import_categories')
+    def test_import_route_should_only_report_the_diff_if_it_is_a_dry_run(self, import_categories_mock, insert_mock):
+        # Arrange
+        import_categories_mock.return_value = {'inserted': 1, 'skipped': 0, 'dry_run': True, 'sample': []}
+        data = {'data_file': (io.BytesIO(b'name\r\nbebidas\r\n'), 'import.csv')}
+
+        # Action
+        response = self._client.post('/categories:import?dry_run=true', data=data, content_type='multipart/form-data')
+
+        # Assertions
+        self.assertEqual(200, response.status_code)
+        self.assertTrue(response.get_json()['dry_run'])
+        self.assertTrue(import_categories_mock.call_args.kwargs['dry_run'])
+        insert_mock.assert_not_called()
+
     def test_import_route_method_if_has_no_file(self):
         # Arrange
         data = {'id': 'id', 'name': 'name'}
@@ -146,4 +159,44 @@ class TestCategoriesViews(AbstractViewUnitTest):
 
         # Assertions
         self.assertEqual(response.status_code, 400)
-        self.assertEqual(response.data, b'{"code": 400, "message": "No file"}')
+        self.assertEqual({'code': 400, 'message': 'No file'}, response.get_json())
+
+    @patch('app.domains.categories.views.reprice_category')
+    def test_reprice_route_should_return_the_report(self, reprice_mock):
+        # Arrange
+        reprice_mock.return_value = {'category_id': 'id', 'repriced_products': 3, 'seconds': 0.01}
+
+        # Action
+        response = self._client.post('/categories/id:reprice', json={'profit_percentage': 30.0})
+
+        # Assertions
+        reprice_mock.assert_called_once_with('id', {'profit_percentage': 30.0})
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.get_json(), {'category_id': 'id', 'repriced_products': 3, 'seconds': 0.01})
+
+    @patch('app.domains.categories.commands.reprice')
+    def test_reprice_command_should_print_the_report(self, reprice_mock):
+        # Arrange
+        reprice_mock.return_value = {'category_id': 'id', 'repriced_products': 3, 'seconds': 0.01}
+
+        # Action
+        result = self._app.test_cli_runner().invoke(args=['reprice-category', 'id', '--profit-percentage', '30'])
+
+        # Assertions
+        reprice_mock.assert_called_once_with('id', {'profit_percentage': 30.0})
+        self.assertEqual(result.exit_code, 0)
+        self.assertIn('Repriced 3 products of the category id in 0.01 seconds', result.output)
+
+    @patch('app.domains.categories.views.create_categories_batch')
+    def test_batch_route_should_return_207_when_some_items_failed(self, create_many_mock):
+        # Arrange
+        create_many_mock.return_value = {'created': 1, 'failed': 1, 'results': [{'index': 0, 'error': 'error'},
+                                                                                 {'index': 1, 'id': 'id'}]}
+
+        # Action
+        response = self._client.post('/categories:batch?atomic=false', json=[{}, {}])
+
+        # Assertions
+        create_many_mock.assert_called_once_with([{}, {}], atomic=False)
+        self.assertEqual(response.status_code, 207)
+        self.assertEqual(response.get_json()['results'][1], {'index': 1, 'id': 'id'})
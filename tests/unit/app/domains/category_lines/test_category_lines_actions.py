@@ -4,7 +4,7 @@ from sqlalchemy.exc import SQLAlchemyError
 from unittest.mock import patch, MagicMock, Mock
 
 from app.domains.categories.models import *
-from app.domains.category_lines.actions import get_by_id, update, create, get, get_category_percentage
+from app.domains.category_lines.actions import get_by_id, update, create, get
 
 
 class TestSuppliersActions(unittest.TestCase):
@@ -167,9 +167,10 @@ class TestSuppliersActions(unittest.TestCase):
         self.assertEqual('Bad Request', exc.value.name)
         self.assertEqual('The ID(s) inserted does not exist in the database', exc.value.description)
 
+    @patch('app.domains.category_lines.actions.refresh_final_costs')
     @patch('app.domains.category_lines.actions.get_by_id')
     @patch('app.domains.category_lines.actions.commit')
-    def test_category_line_must_raise_a_sql_alchemy_error(self, commit_mock, get_by_id_mock):
+    def test_category_line_must_raise_a_sql_alchemy_error(self, commit_mock, get_by_id_mock, refresh_final_costs_mock):
         # Arrange
         id = str(uuid4())
         commit_mock.side_effect = SQLAlchemyError
@@ -183,29 +184,3 @@ class TestSuppliersActions(unittest.TestCase):
         self.assertEqual('Bad Request', exc.value.name)
         self.assertEqual('Check if the ID field(s) are entered correctly. If so, the following field(s) must be '
                          'unique: category_line', exc.value.description)
-
-    @patch('app.domains.category_lines.actions.get_category_by_id')
-    @patch('app.domains.category_lines.actions.get_by_id')
-    def test_get_category_percentage(self,
-                                     get_by_line_id_mock,
-                                     get_category_by_id_mock):
-        # Arrange
-        id = str(uuid4())
-        _id = str(uuid4())
-
-        category_line = Mock()
-        category_line.id = id
-        category_line.category_id = _id
-        category = Mock()
-        category.profit_percentage = 15.0
-
-        get_by_line_id_mock.return_value = category_line
-        get_category_by_id_mock.return_value = category
-
-        # Action
-        percentage = get_category_percentage(id)
-
-        # Assertions
-        self.assertTrue(get_by_line_id_mock.called)
-        self.assertTrue(get_category_by_id_mock.called)
-        self.assertEqual(percentage, category.profit_percentage)
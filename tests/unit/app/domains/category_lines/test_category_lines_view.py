@@ -8,12 +8,10 @@ from tests.unit import AbstractViewUnitTest
 
 class TestCategoryView(AbstractViewUnitTest):
 
-    @patch('app.domains.category_lines.views.get_category_line')
+    @patch('app.domains.category_lines.views.get_category_line_page')
     def test_get_category_line(self, get_category_line_mock):
         # Arrange
-        object_view = Mock()
-        object_view.serialize = MagicMock(return_value={})
-        get_category_line_mock.return_value = [object_view]
+        get_category_line_mock.return_value = ([{}], None)
 
         # Action
         response = self._client.get('/category_line')
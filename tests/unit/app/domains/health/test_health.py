@@ -0,0 +1,48 @@
+from unittest.mock import patch
+
+from sqlalchemy import create_engine
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.pool import QueuePool
+
+from app.domains.health.actions import pool_status
+from tests.unit import AbstractViewUnitTest
+
+
+class TestHealth(AbstractViewUnitTest):
+
+    def test_health_db_should_report_the_latency_and_the_pool(self):
+        # Action
+        response = self._client.get('/health/db')
+        data = response.get_json()
+
+        # Assertions
+        self.assertEqual(200, response.status_code)
+        self.assertEqual('ok', data['status'])
+        self.assertGreaterEqual(data['latency_ms'], 0)
+        self.assertIn('type', data['pool'])
+        self.assertEqual('no-store', response.headers['Cache-Control'])
+
+    @patch('app.domains.health.actions.db.session.execute')
+    def test_health_db_should_return_503_when_the_database_is_unavailable(self, execute_mock):
+        # Arrange
+        execute_mock.side_effect = OperationalError('SELECT 1', {}, Exception('connection refused'))
+
+        # Action
+        response = self._client.get('/health/db')
+
+        # Assertions
+        self.assertEqual(503, response.status_code)
+        self.assertEqual('unavailable', response.get_json()['status'])
+
+    def test_pool_status_should_report_the_checked_in_and_checked_out_connections(self):
+        # Arrange
+        engine = create_engine('sqlite://', poolclass=QueuePool, pool_size=2, max_overflow=1)
+        connection = engine.connect()
+
+        # Action
+        status = pool_status(engine.pool)
+        connection.close()
+
+        # Assertions
+        self.assertEqual({'type': 'QueuePool', 'size': 2, 'checkedin': 0, 'checkedout': 1, 'overflow': -1}, status)
+        self.assertEqual(1, pool_status(engine.pool)['checkedin'])
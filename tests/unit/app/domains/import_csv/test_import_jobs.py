@@ -0,0 +1,138 @@
+import io
+import os
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import patch
+
+from app.domains.import_csv.jobs import import_jobs, ImportJobs, write_status
+from app.domains.products.models import Product
+from tests.unit import AbstractDatabaseUnitTest
+
+
+class TestImportJobs(AbstractDatabaseUnitTest):
+
+    def setUp(self) -> None:
+        super().setUp()
+        self._spool_dir = tempfile.TemporaryDirectory()
+        self._app.config.update(IMPORT_SPOOL_DIR=self._spool_dir.name, IMPORT_CHUNK_SIZE=1)
+        import_jobs.init_app(self._app)
+
+    def tearDown(self) -> None:
+        super().tearDown()
+        self._spool_dir.cleanup()
+
+    def _post(self, url: str, csv_file: io.StringIO):
+        data = {'data_file': (io.BytesIO(csv_file.getvalue().encode('utf-8')), 'import.csv')}
+        return self._client.post(url, data=data, content_type='multipart/form-data')
+
+    def test_async_import_should_return_a_job_and_import_the_spooled_file(self):
+        # Arrange
+        catalogue = self._insert_catalogue(0)
+        csv_file = self._csv_file([self._product_row(catalogue, f'sku{index}') for index in range(3)])
+
+        # Action
+        response = self._post('/products:import?async=true', csv_file)
+        job = response.get_json()
+        finished_job = import_jobs.wait(job['id'], timeout=10)
+        status = self._client.get(response.headers['Location'])
+
+        # Assertions
+        self.assertEqual(202, response.status_code)
+        self.assertEqual('queued', job['status'])
+        self.assertEqual('finished', finished_job['status'])
+        self.assertEqual(finished_job, status.get_json())
+        self.assertEqual(3, finished_job['rows'])
+        self.assertEqual(3, finished_job['report']['inserted'])
+        self.assertGreater(finished_job['rows_per_second'], 0)
+        self.assertEqual(3, Product.query.count())
+        self.assertEqual([f"{job['id']}.json"], os.listdir(self._spool_dir.name))
+
+    def test_async_import_should_report_the_errors_of_a_failed_job(self):
+        # Arrange
+        catalogue = self._insert_catalogue(0)
+        csv_file = self._csv_file([self._product_row(catalogue, 'sku1', cost_values='-10.5')])
+
+        # Action
+        job = self._post('/products:import-by-supplier?async=true', csv_file).get_json()
+        failed_job = import_jobs.wait(job['id'], timeout=10)
+
+        # Assertions
+        self.assertEqual('failed', failed_job['status'])
+        self.assertIn('cost_values', failed_job['errors'][0])
+        self.assertEqual(0, Product.query.count())
+
+    @patch('app.domains.categories.actions.import_categories')
+    def test_async_import_of_categories_should_run_the_categories_importer(self, import_categories_mock):
+        # Arrange
+        read_csv_files = []
+        import_categories_mock.side_effect = lambda csv_file, progress, dry_run: \
+            read_csv_files.append(csv_file.read()) or {'inserted': 2, 'seconds': 0.01, 'rows_per_second': 200.0}
+        csv_file = self._csv_file([{'name': 'bebidas'}, {'name': 'doces'}])
+
+        # Action
+        job = self._post('/categories:import?async=true', csv_file).get_json()
+        finished_job = import_jobs.wait(job['id'], timeout=10)
+
+        # Assertions
+        self.assertEqual('finished', finished_job['status'])
+        self.assertEqual(200.0, finished_job['rows_per_second'])
+        self.assertEqual(['name\r\nbebidas\r\ndoces\r\n'], read_csv_files)
+
+    def test_get_job_should_return_404_when_the_job_does_not_exist(self):
+        # Action
+        responses = [self._client.get(f'/imports/{job_id}') for job_id in ('0' * 32, '..%2Fsettings', 'abc')]
+
+        # Assertions
+        self.assertEqual([404, 404, 404], [response.status_code for response in responses])
+        self.assertEqual('The import job does not exist', responses[0].get_json()['message'])
+
+    def test_submit_should_remove_the_status_of_jobs_finished_before_the_job_ttl(self):
+        # Arrange
+        self._app.config.update(IMPORT_JOB_TTL=60)
+        import_jobs.init_app(self._app)
+        for job_id, status in (('a' * 32, 'finished'), ('b' * 32, 'failed'), ('c' * 32, 'running'),
+                               ('d' * 32, 'finished')):
+            write_status(self._spool_dir.name, {'id': job_id, 'status': status})
+        expired_at = time.time() - 120
+        for job_id in ('a' * 32, 'b' * 32, 'c' * 32):
+            os.utime(os.path.join(self._spool_dir.name, f'{job_id}.json'), (expired_at, expired_at))
+
+        # Action
+        job = import_jobs.submit('categories', io.BytesIO(b'name\r\n'))
+        import_jobs.wait(job['id'], timeout=10)
+
+        # Assertions
+        self.assertEqual(sorted([f"{'c' * 32}.json", f"{'d' * 32}.json", f"{job['id']}.json"]),
+                         sorted(os.listdir(self._spool_dir.name)))
+
+    def test_init_app_should_reuse_the_executor(self):
+        # Arrange
+        jobs = ImportJobs()
+        jobs.init_app(self._app)
+        executor = jobs._executor
+
+        # Action
+        jobs.init_app(self._app)
+
+        # Assertions
+        self.assertIs(executor, jobs._executor)
+
+    @patch('app.domains.import_csv.jobs.response_cache')
+    @patch('app.domains.import_csv.jobs.run_job')
+    @patch('app.domains.import_csv.jobs.ProcessPoolExecutor', ThreadPoolExecutor)
+    def test_process_jobs_of_categories_should_invalidate_the_response_cache_in_the_web_process(self, run_job_mock,
+                                                                                                response_cache_mock):
+        # Arrange
+        self._app.config.update(IMPORT_EXECUTOR='process')
+        jobs = ImportJobs()
+        jobs.init_app(self._app)
+
+        # Action
+        jobs.submit('categories', io.BytesIO(b'name\r\nbebidas\r\n'))
+        jobs.submit('products', io.BytesIO(b'name\r\n'))
+        jobs._executor.shutdown(wait=True)
+
+        # Assertions
+        self.assertEqual(['categories', 'products'], [call.args[2] for call in run_job_mock.call_args_list])
+        response_cache_mock.invalidate.assert_called_once_with('categories')
@@ -1,3 +1,4 @@
+import io
 import unittest
 from uuid import uuid4
 import pytest
@@ -75,3 +76,90 @@ class TestImportsActions(unittest.TestCase):
         self.assertEqual(400, exc.value.code)
         self.assertEqual('Bad Request', exc.value.name)
         self.assertEqual("Check that the types of values match their columns", exc.value.description)
+
+    def test_action_iter_product_csv_file_should_yield_typed_rows_from_the_upload_stream(self):
+        # Arrange
+        id = str(uuid4())
+        upload = io.BytesIO('name,cost_values,unit_box,weight_unit,validity,sku,description,category_line_id,'
+                            'supplier_id\r\n'
+                            f'Açúcar,12.54,20,25.23,2099-10-10,342343,descrição,{id},{id}\r\n'
+                            f'Café,1.5,2,0.5,2099-10-10,342344,descrição,{id},{id}\r\n'.encode('utf-8'))
+
+        # Action
+        rows = iter_product_csv_file(open_csv_stream(upload))
+        first_row = next(rows)
+
+        # Assertions
+        self.assertEqual({'name': 'açúcar', 'cost_values': 12.54, 'unit_box': 20, 'weight_unit': 25.23,
+                          'validity': '2099-10-10', 'sku': '342343', 'description': 'descrição',
+                          'category_line_id': id, 'supplier_id': id}, first_row)
+        self.assertEqual(['342344'], [row['sku'] for row in rows])
+
+    def test_action_open_csv_stream_should_decode_characters_split_between_reads(self):
+        # Arrange
+        upload = io.BufferedReader(io.BytesIO('name\nção\n'.encode('utf-8')), buffer_size=1)
+
+        # Action
+        rows = list(iter_csv_file(open_csv_stream(upload), 'name'))
+
+        # Assertions
+        self.assertEqual([{'name': 'ção'}], rows)
+
+    def test_action_open_csv_stream_should_keep_a_line_separator_inside_a_value(self):
+        # Arrange
+        id = str(uuid4())
+        upload = io.BytesIO('name,cost_values,unit_box,weight_unit,validity,sku,description,category_line_id,'
+                            'supplier_id\r\n'
+                            f'Café,1.5,2,0.5,2099-10-10,342344,primeira\u2028segunda\x0cparte,{id},{id}\r\n'
+                            .encode('utf-8'))
+
+        # Action
+        rows = list(iter_product_csv_file(open_csv_stream(upload)))
+
+        # Assertions
+        self.assertEqual(['primeira\u2028segunda\x0cparte'], [row['description'] for row in rows])
+
+    def test_action_open_csv_stream_should_read_a_stream_without_readable(self):
+        # Arrange
+        class Stream:
+            def __init__(self, data: bytes):
+                self._data = io.BytesIO(data)
+
+            def read(self, size: int = -1) -> bytes:
+                return self._data.read(size)
+
+        # Action
+        rows = list(iter_csv_file(open_csv_stream(Stream('name\r\nção\r\n'.encode('utf-8'))), 'name'))
+
+        # Assertions
+        self.assertEqual([{'name': 'ção'}], rows)
+
+    def test_action_iter_product_csv_file_should_raise_a_data_already_exist_exception(self):
+        # Arrange
+        rows = iter_product_csv_file(open_csv_stream(io.BytesIO(b'name,sku\r\n')))
+        with pytest.raises(DataAlreadyExistsError) as exc:
+
+            # Action
+            next(rows)
+
+        # Assertions
+        self.assertEqual('All the data in the file has already been added', exc.value.description)
+
+    def test_action_iter_numbered_csv_rows_should_yield_the_line_where_each_row_starts(self):
+        # Arrange
+        csv_file = io.StringIO('name,sku\r\nnescau,1\r\n\r\n"leite\r\nninho",2\r\ncafe,3\r\n')
+
+        # Action
+        rows = list(iter_numbered_csv_rows(csv_file, ['name', 'sku']))
+
+        # Assertions
+        self.assertEqual([(2, {'name': 'nescau', 'sku': '1'}), (4, {'name': 'leite\r\nninho', 'sku': '2'}),
+                          (6, {'name': 'cafe', 'sku': '3'})], rows)
+
+    def test_action_iter_numbered_csv_rows_should_raise_a_column_exception(self):
+        # Arrange
+        rows = iter_numbered_csv_rows(io.StringIO('name\r\nnescau\r\n'), ['name', 'sku'])
+        with pytest.raises(ColumnsError):
+
+            # Action
+            next(rows)
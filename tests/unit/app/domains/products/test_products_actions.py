@@ -6,15 +6,26 @@ from sqlalchemy.exc import SQLAlchemyError
 import pytest
 
 from app.exceptions.exceptions_of_import import *
-from app.exceptions.exceptions import InvalidValueError, JsonError
+from app.exceptions.exceptions import InvalidValueError, JsonError, TextError, EmptyFieldsError
+from app.domains.products.models import Product
+from sqlalchemy.dialects import postgresql
+
+from app.domains.products.pricing import final_cost_of, reprice_category_statement
+from database import db
 from app.domains.products.actions import get as get_products, \
     create as create_products, \
     get_by_id as get_by_id_products, \
     update as update_products, IdNotExistError, \
-    inserting_products_from_the_csv_file_in_db as insert_data, \
-    validating_if_the_product_sku_already_exists_in_the_db as validate, \
-    validating_and_updating_if_the_product_sku_already_exists_in_the_db as validate_by_supplier, \
-    get_percentages
+    import_products, \
+    import_products_by_supplier, \
+    get_page_with_final_cost, \
+    get_by_id_with_final_cost, \
+    get_ids_by_sku, \
+    get_in_batches, \
+    validate_product_rows
+from app.domains.categories.actions import update as update_category, reprice as reprice_category
+from app.domains.category_lines.actions import update as update_category_line
+from tests.unit import AbstractDatabaseUnitTest
 
 
 class TestProductActions(unittest.TestCase):
@@ -174,10 +185,10 @@ class TestProductActions(unittest.TestCase):
         # Action
         product = update_products(id,
                                   {'name': 'Nestle',
-                                   'cost_values': 12,
+                                   'cost_values': 12.0,
                                    'unit_box': 5,
                                    'weight_unit': 0.70,
-                                   'validity': '2021-12-19',
+                                   'validity': '2099-12-19',
                                    'sku': '08767gyuvy865',
                                    'description': 'Descrição do produto',
                                    'category_line_id': id,
@@ -190,7 +201,7 @@ class TestProductActions(unittest.TestCase):
         self.assertEqual(product.cost_values, 12)
         self.assertEqual(product.unit_box, 5)
         self.assertEqual(product.weight_unit, 0.70)
-        self.assertEqual(product.validity, '2021-12-19')
+        self.assertEqual(product.validity, datetime.datetime(2099, 12, 19))
         self.assertEqual(product.sku, '08767gyuvy865')
         self.assertEqual(product.description, 'Descrição do produto')
         self.assertEqual(product.category_line_id, id)
@@ -239,9 +250,10 @@ class TestProductActions(unittest.TestCase):
         with pytest.raises(InvalidValueError) as exc:
             # Action
             update_products(id, {'name': 'Nestle', 'cost_values': 12.00, 'unit_box': 1, 'weight_unit': 0.70,
-                                 'validity': '2021-12-19', 'sku': '08767gyuvy865',
+                                 'validity': '2099-12-19', 'sku': '08767gyuvy865',
                                  'description': 'Descrição do produto',
-                                 'category_line_id': '7d2d8d86-1908-4a8b-b84a-2ebeb160b7ed'})
+                                 'category_line_id': '7d2d8d86-1908-4a8b-b84a-2ebeb160b7ed',
+                                 'supplier_id': '7d2d8d86-1908-4a8b-b84a-2ebeb160b7ed'})
 
         # Assertions
         self.assertEqual(400, exc.value.code)
@@ -249,192 +261,559 @@ class TestProductActions(unittest.TestCase):
         self.assertEqual('Check if the ID field(s) are entered correctly. If so, the following field(s) must be '
                          'unique: sku', exc.value.description)
 
-    @patch('app.domains.products.actions.Product')
-    @patch('app.domains.products.actions.save')
-    @patch('app.domains.products.actions.import_product_csv_file')
-    @patch('app.domains.products.actions.get')
-    def test_action_inserting_products_from_the_csv_file_in_db_should_return_a_list_of_saved_products(self,
-                                                                                                      get_mock,
-                                                                                                      import_csv_mock,
-                                                                                                      save_mock,
-                                                                                                      product_mock):
+
+class TestProductFinalCostActions(AbstractDatabaseUnitTest):
+
+    def test_action_get_page_with_final_cost_should_sum_the_percentages_to_the_cost(self):
         # Arrange
-        id = str(uuid4())
-        get_mock.return_value = [product_mock]
-        import_csv_mock.return_value = [{'name': 'name', 'cost_values': 12.54, 'unit_box': 20, 'weight_unit': 25.23,
-                                         'validity': "2021-10-10", 'sku': '342343', 'description': 'descricao',
-                                         'category_line_id': id, 'supplier_id': id}]
+        catalogue = self._insert_catalogue(2, category_percentage=20.0, category_line_percentage=15.0)
 
         # Action
-        response = insert_data(['import_csv'], 'sku', validate, [], [], [])
+        products, next_cursor = get_page_with_final_cost(['id', 'cost_values'], 500, None)
 
         # Assertions
-        self.assertTrue(get_mock.called)
-        self.assertTrue(import_csv_mock.called)
-        self.assertTrue(save_mock.called)
-        self.assertTrue(product_mock.called)
-        self.assertEqual([product_mock], get_mock.return_value)
-        self.assertEqual([save_mock()], response)
-        self.assertEqual([{'name': 'name', 'cost_values': 12.54, 'unit_box': 20, 'weight_unit': 25.23,
-                           'validity': "2021-10-10", 'sku': '342343', 'description': 'descricao',
-                           'category_line_id': id, 'supplier_id': id}], import_csv_mock.return_value)
+        self.assertEqual(2, len(products))
+        self.assertEqual({45.0, 46.0}, {product['cost_values'] for product in products})
+        self.assertEqual(set(catalogue['product_ids']), {product['id'] for product in products})
+        self.assertIsNone(next_cursor)
 
-    @patch('app.domains.products.actions.Product')
-    @patch('app.domains.products.actions.save')
-    @patch('app.domains.products.actions.import_product_csv_file')
-    @patch('app.domains.products.actions.get')
-    def test_action_inserting_products_from_the_csv_file_in_db_should_raise_a_invalid_value_error(self,
-                                                                                                  get_mock,
-                                                                                                  import_csv_mock,
-                                                                                                  save_mock,
-                                                                                                  product_mock):
+    def test_action_get_page_with_final_cost_should_issue_a_constant_number_of_statements(self):
         # Arrange
-        id = str(uuid4())
-        get_mock.return_value = [product_mock]
-        save_mock.side_effect = SQLAlchemyError
-        import_csv_mock.return_value = [{'name': 'name', 'cost_values': 12.54, 'unit_box': 20, 'weight_unit': 25.23,
-                                         'validity': "2021-10-10", 'sku': '342343', 'description': 'descricao',
-                                         'category_line_id': '342343', 'supplier_id': id}]
-        with pytest.raises(InvalidValueError) as exc:
+        self._insert_catalogue(1)
+        with self._count_statements() as statements:
+            get_page_with_final_cost(['id', 'cost_values'], 500, None)
+        statements_for_small_catalogue = len(statements)
+        for _ in range(5):
+            self._insert_catalogue(50)
 
+        # Action
+        with self._count_statements() as statements:
+            products, _ = get_page_with_final_cost(['id', 'cost_values'], 500, None)
+
+        # Assertions
+        self.assertEqual(251, len(products))
+        self.assertEqual(statements_for_small_catalogue, len(statements))
+        self.assertEqual(1, len(statements))
+
+    def test_action_get_page_with_final_cost_should_filter_the_products(self):
+        # Arrange
+        catalogue = self._insert_catalogue(3, category_percentage=20.0, category_line_percentage=15.0)
+        self._insert_catalogue(3)
+        db.session.execute(Product.__table__.update().where(Product.id == catalogue['product_ids'][2])
+                           .values(active=False, validity=datetime.datetime(2030, 1, 1)))
+
+        # Action
+        by_supplier, _ = get_page_with_final_cost(['id'], 500, None, {'supplier_id': catalogue['supplier_id']})
+        by_cost, _ = get_page_with_final_cost(['cost_values'], 500, None,
+                                              {'supplier_id': catalogue['supplier_id'], 'min_cost': 45.5,
+                                               'max_cost': 47.0})
+        inactive, _ = get_page_with_final_cost(['id'], 500, None, {'active': False})
+        expiring, _ = get_page_with_final_cost(['id'], 500, None,
+                                               {'validity_before': datetime.datetime(2031, 1, 1)})
+
+        # Assertions
+        self.assertEqual(set(catalogue['product_ids']), {product['id'] for product in by_supplier})
+        self.assertEqual([{'cost_values': 46.0}, {'cost_values': 47.0}], by_cost)
+        self.assertEqual([{'id': catalogue['product_ids'][2]}], inactive)
+        self.assertEqual([{'id': catalogue['product_ids'][2]}], expiring)
+
+    def test_action_get_page_with_final_cost_should_sort_by_the_final_cost(self):
+        # Arrange
+        self._insert_catalogue(5, category_percentage=20.0, category_line_percentage=15.0)
+        costs = []
+        after = None
+
+        # Action
+        while True:
+            products, after = get_page_with_final_cost(['cost_values'], 2, after, keys=('cost_values', 'id'),
+                                                       descending=True)
+            costs.extend(product['cost_values'] for product in products)
+            if not after:
+                break
+
+        # Assertions
+        self.assertEqual([49.0, 48.0, 47.0, 46.0, 45.0], costs)
+
+    def test_action_get_in_batches_should_return_every_product(self):
+        # Arrange
+        catalogue = self._insert_catalogue(5)
+
+        # Action
+        products = [product.id for product in get_in_batches(batch_size=2)]
+
+        # Assertions
+        self.assertEqual(sorted(catalogue['product_ids']), sorted(products))
+
+    def test_action_get_by_id_with_final_cost_should_return_the_product(self):
+        # Arrange
+        catalogue = self._insert_catalogue(1, category_percentage=5.0, category_line_percentage=2.5)
+
+        # Action
+        product = get_by_id_with_final_cost(catalogue['product_ids'][0])
+
+        # Assertions
+        self.assertEqual(catalogue['product_ids'][0], product['id'])
+        self.assertEqual(17.5, product['cost_values'])
+
+    def test_action_get_by_id_with_final_cost_should_raise_a_id_exception(self):
+        # Arrange
+        with pytest.raises(IdNotExistError) as exc:
             # Action
-            insert_data(['import_csv'], 'sku', validate, [], [], [])
+            get_by_id_with_final_cost(str(uuid4()))
 
         # Assertions
         self.assertEqual(400, exc.value.code)
-        self.assertEqual('Bad Request', exc.value.name)
-        self.assertEqual('Check if the ID field(s) are entered correctly. If so, the following field(s) must be '
-                         'unique: sku', exc.value.description)
+        self.assertEqual('The ID(s) inserted does not exist in the database', exc.value.description)
 
-    @patch('app.domains.products.actions.Product')
-    @patch('app.domains.products.actions.save')
-    @patch('app.domains.products.actions.import_product_csv_file')
-    @patch('app.domains.products.actions.get')
-    def test_action_inserting_products_from_the_csv_file_in_db_should_raise_a_data_already_exists_error(self,
-                                                                                                        get_mock,
-                                                                                                        import_csv_mock,
-                                                                                                        save_mock,
-                                                                                                        product_mock):
-        # Arrange
-        product_mock.side_effect = DataAlreadyExistsError
-        with pytest.raises(DataAlreadyExistsError) as exc:
+
+class TestProductUpdateActions(AbstractDatabaseUnitTest):
+
+    def test_action_update_with_partial_should_change_only_the_informed_fields(self):
+        # Arrange
+        catalogue = self._insert_catalogue(1)
+        product_id = catalogue['product_ids'][0]
+
+        # Action
+        with patch.object(Product, 'serialize') as serialize_mock:
+            product = update_products(product_id, {'name': 'Nescau', 'unit_box': 10}, partial=True)
+
+        # Assertions
+        self.assertFalse(serialize_mock.called)
+        product = Product.query.get(product_id)
+        self.assertEqual('Nescau', product.name)
+        self.assertEqual(10, product.unit_box)
+        self.assertEqual(10.0, product.cost_values)
+        self.assertEqual(catalogue['supplier_id'], product.supplier_id)
+
+    def test_action_update_with_partial_should_validate_only_the_informed_fields(self):
+        # Arrange
+        catalogue = self._insert_catalogue(1)
+
+        with pytest.raises(TextError) as exc:
+            # Action
+            update_products(catalogue['product_ids'][0], {'name': 'Nescau 2', 'sku': 'sku'}, partial=True)
+
+        # Assertions
+        self.assertEqual('The following field(s) must be only letters: name', exc.value.description)
+
+    def test_action_update_should_not_write_a_product_that_did_not_change(self):
+        # Arrange
+        catalogue = self._insert_catalogue(1)
+        product = Product.query.get(catalogue['product_ids'][0])
+        on_update = product.on_update
+
+        # Action
+        with self._count_statements() as statements:
+            update_products(product.id, {'name': product.name, 'cost_values': product.cost_values}, partial=True)
+
+        # Assertions
+        self.assertEqual([], [statement for statement in statements if statement.startswith('UPDATE')])
+        db.session.expire_all()
+        self.assertEqual(on_update, Product.query.get(product.id).on_update)
+
+    def test_action_update_should_require_every_field(self):
+        # Arrange
+        catalogue = self._insert_catalogue(1)
+
+        with pytest.raises(EmptyFieldsError) as exc:
             # Action
-            insert_data(['import_csv'], 'sku', validate, [], [], [])
+            update_products(catalogue['product_ids'][0], {'name': 'Nescau'})
+
+        # Assertions
+        self.assertIn('cost_values', exc.value.description)
+
+
+class TestProductFinalCostMaintenance(AbstractDatabaseUnitTest):
+
+    def _final_costs(self, product_ids: list) -> list:
+        db.session.expire_all()
+        return [Product.query.get(product_id).final_cost for product_id in product_ids]
+
+    def test_final_cost_of_should_be_computed_by_the_insert(self):
+        # Arrange
+        catalogue = self._insert_catalogue(0, category_percentage=20.0, category_line_percentage=15.0)
+
+        # Action
+        product_id = str(uuid4())
+        db.session.execute(Product.__table__.insert().values(
+            id=product_id, name='Nescau', cost_values=10.5, unit_box=5, weight_unit=0.5,
+            validity=datetime.datetime(2099, 12, 31), sku='sku', category_line_id=catalogue['category_line_id'],
+            supplier_id=catalogue['supplier_id'], final_cost=final_cost_of(10.5, catalogue['category_line_id'])))
+
+        # Assertions
+        self.assertEqual([45.5], self._final_costs([product_id]))
+
+    def test_update_should_refresh_the_final_cost_when_the_cost_changes(self):
+        # Arrange
+        catalogue = self._insert_catalogue(1, category_percentage=20.0, category_line_percentage=15.0)
+
+        # Action
+        update_products(catalogue['product_ids'][0], {'cost_values': 12.5}, partial=True)
+
+        # Assertions
+        self.assertEqual([47.5], self._final_costs(catalogue['product_ids']))
+
+    def test_category_line_update_should_refresh_only_its_products(self):
+        # Arrange
+        catalogue = self._insert_catalogue(2, category_percentage=20.0, category_line_percentage=15.0)
+        other_catalogue = self._insert_catalogue(1, category_percentage=20.0, category_line_percentage=15.0)
+
+        # Action
+        update_category_line(catalogue['category_line_id'], {'profit_percentage': 5.0}, partial=True)
+
+        # Assertions
+        self.assertEqual([35.0, 36.0], self._final_costs(catalogue['product_ids']))
+        self.assertEqual([45.0], self._final_costs(other_catalogue['product_ids']))
+
+    def test_category_update_should_refresh_the_products_of_its_category_lines(self):
+        # Arrange
+        catalogue = self._insert_catalogue(2, category_percentage=20.0, category_line_percentage=15.0)
+
+        # Action
+        update_category(catalogue['category_id'], {'profit_percentage': 30.0}, partial=True)
+
+        # Assertions
+        self.assertEqual([55.0, 56.0], self._final_costs(catalogue['product_ids']))
+
+    @patch('app.domains.categories.actions.response_cache')
+    @patch('app.domains.categories.actions.reprice_category')
+    def test_category_update_should_not_reprice_nor_invalidate_if_nothing_changed(self, reprice_category_mock,
+                                                                                  response_cache_mock):
+        # Arrange
+        catalogue = self._insert_catalogue(1, category_percentage=20.0)
+
+        # Action
+        update_category(catalogue['category_id'], {'profit_percentage': 20.0}, partial=True)
+
+        # Assertions
+        reprice_category_mock.assert_not_called()
+        response_cache_mock.invalidate.assert_not_called()
+
+    def test_reprice_should_update_only_the_products_of_the_category_and_report_them(self):
+        # Arrange
+        catalogue = self._insert_catalogue(2, category_percentage=20.0, category_line_percentage=15.0)
+        other_catalogue = self._insert_catalogue(1, category_percentage=20.0, category_line_percentage=15.0)
+
+        # Action
+        report = reprice_category(catalogue['category_id'], {'profit_percentage': 30.0})
+
+        # Assertions
+        self.assertEqual(catalogue['category_id'], report['category_id'])
+        self.assertEqual(2, report['repriced_products'])
+        self.assertGreaterEqual(report['seconds'], 0)
+        self.assertEqual([55.0, 56.0], self._final_costs(catalogue['product_ids']))
+        self.assertEqual([45.0], self._final_costs(other_catalogue['product_ids']))
+
+    def test_reprice_without_a_new_percentage_should_recompute_the_final_costs(self):
+        # Arrange
+        catalogue = self._insert_catalogue(1, category_percentage=20.0, category_line_percentage=15.0)
+        db.session.execute(Product.__table__.update().values(final_cost=0.0))
+        db.session.commit()
+
+        # Action
+        report = reprice_category(catalogue['category_id'])
+
+        # Assertions
+        self.assertEqual(1, report['repriced_products'])
+        self.assertEqual([45.0], self._final_costs(catalogue['product_ids']))
+
+    def test_reprice_statement_should_join_the_category_lines_on_postgresql(self):
+        # Action
+        statement = str(reprice_category_statement('id').compile(dialect=postgresql.dialect()))
+
+        # Assertions
+        self.assertIn('UPDATE products SET final_cost=(products.cost_values + categories.profit_percentage + '
+                      'category_lines.profit_percentage)', statement)
+        self.assertIn('FROM category_lines, categories', statement)
+        self.assertIn('products.category_line_id = category_lines.id', statement)
+
+    def test_import_products_should_save_the_final_cost(self):
+        # Arrange
+        catalogue = self._insert_catalogue(0, category_percentage=20.0, category_line_percentage=15.0)
+
+        # Action
+        import_products(self._csv_file([self._product_row(catalogue, 'sku1')]))
+
+        # Assertions
+        self.assertEqual({45.5}, {product.final_cost for product in get_products()})
+
+
+class TestProductImportActions(AbstractDatabaseUnitTest):
+
+    def test_action_get_ids_by_sku_should_return_only_the_requested_sku(self):
+        # Arrange
+        catalogue = self._insert_catalogue(3)
+        products = [Product.query.get(id) for id in catalogue['product_ids']]
+
+        # Action
+        with self._count_statements() as statements:
+            product_ids_by_sku = get_ids_by_sku([products[0].sku, products[2].sku, 'not saved'])
+
+        # Assertions
+        self.assertEqual({products[0].sku: products[0].id, products[2].sku: products[2].id}, product_ids_by_sku)
+        self.assertEqual(1, len(statements))
+        self.assertNotIn('products.name', statements[0])
+
+    def test_action_get_ids_by_sku_should_not_query_without_sku(self):
+        # Action
+        with self._count_statements() as statements:
+            product_ids_by_sku = get_ids_by_sku([])
+
+        # Assertions
+        self.assertEqual({}, product_ids_by_sku)
+        self.assertEqual([], statements)
+
+    def test_action_import_products_should_insert_the_new_products_in_chunks(self):
+        # Arrange
+        catalogue = self._insert_catalogue(0)
+        csv_file = self._csv_file([self._product_row(catalogue, f'sku{index}') for index in range(5)])
+
+        # Action
+        with self._count_statements() as statements:
+            report = import_products(csv_file, chunk_size=2)
+
+        # Assertions
+        self.assertEqual(5, report['inserted'])
+        self.assertIn('rows_per_second', report)
+        self.assertEqual(3, len([statement for statement in statements if statement.startswith('INSERT')]))
+        self.assertEqual(5, len(get_products()))
+
+    def test_action_import_products_should_skip_the_sku_already_saved(self):
+        # Arrange
+        catalogue = self._insert_catalogue(0)
+        import_products(self._csv_file([self._product_row(catalogue, 'sku0')]))
+        csv_file = self._csv_file([self._product_row(catalogue, 'sku0'), self._product_row(catalogue, 'sku1')])
+
+        # Action
+        report = import_products(csv_file)
+
+        # Assertions
+        self.assertEqual(1, report['inserted'])
+        self.assertEqual(['sku0', 'sku1'], sorted(product.sku for product in get_products()))
+
+    def test_action_import_products_should_not_insert_any_row_if_a_row_is_invalid(self):
+        # Arrange
+        catalogue = self._insert_catalogue(0)
+        csv_file = self._csv_file([self._product_row(catalogue, 'sku0'), self._product_row(catalogue, 'sku1'),
+                                   self._product_row(catalogue, 'sku2', name='produto 2')])
+        with pytest.raises(TextError) as exc:
+            # Action
+            import_products(csv_file, chunk_size=2)
+
+        # Assertions
+        self.assertEqual('The following field(s) must be only letters: name', exc.value.description)
+        self.assertEqual([], get_products())
+
+    def test_action_import_products_should_keep_the_committed_chunks_if_it_is_not_atomic(self):
+        # Arrange
+        catalogue = self._insert_catalogue(0)
+        csv_file = self._csv_file([self._product_row(catalogue, 'sku0'), self._product_row(catalogue, 'sku1'),
+                                   self._product_row(catalogue, 'sku2', name='produto 2')])
+        with pytest.raises(TextError):
+            # Action
+            import_products(csv_file, chunk_size=2, atomic=False)
+
+        # Assertions
+        self.assertEqual(['sku0', 'sku1'], sorted(product.sku for product in get_products()))
+
+    def test_action_import_products_should_raise_a_invalid_value_error(self):
+        # Arrange
+        catalogue = self._insert_catalogue(0)
+        csv_file = self._csv_file([self._product_row(catalogue, 'sku0'), self._product_row(catalogue, 'sku0')])
+        with pytest.raises(InvalidValueError) as exc:
+            # Action
+            import_products(csv_file)
 
         # Assertions
         self.assertEqual(400, exc.value.code)
-        self.assertEqual('Bad Request', exc.value.name)
+        self.assertEqual([], get_products())
+
+    def test_action_import_products_should_raise_a_data_already_exists_error(self):
+        # Arrange
+        catalogue = self._insert_catalogue(1)
+        sku = Product.query.get(catalogue['product_ids'][0]).sku
+        with pytest.raises(DataAlreadyExistsError) as exc:
+            # Action
+            import_products(self._csv_file([self._product_row(catalogue, sku)]))
+
+        # Assertions
         self.assertEqual('All the data in the file has already been added', exc.value.description)
 
-    @patch('app.domains.products.actions.Product')
-    @patch('app.domains.products.actions.save')
-    @patch('app.domains.products.actions.import_product_csv_file')
-    @patch('app.domains.products.actions.get')
-    def test_action_inserting_products_by_supplier_from_the_csv_file_in_db_should_return_a_list_of_saved_products(self,
-                                                                                                                  get_mock,
-                                                                                                                  import_csv_mock,
-                                                                                                                  save_mock,
-                                                                                                                  product_mock):
+    def test_action_validate_product_rows_should_report_the_line_of_the_invalid_rows(self):
         # Arrange
-        id = str(uuid4())
-        get_mock.return_value = [product_mock]
-        import_csv_mock.return_value = [{'name': 'name', 'cost_values': 12.54, 'unit_box': 20, 'weight_unit': 25.23,
-                                         'validity': "2021-10-10", 'sku': '342343', 'description': 'descricao',
-                                         'category_line_id': id, 'supplier_id': id}]
+        catalogue = self._insert_catalogue(0)
+        rows = [(2, self._product_row(catalogue, 'sku0')), (3, self._product_row(catalogue, 'sku1', cost_values='x')),
+                (5, self._product_row(catalogue, 'sku2', name='produto 2'))]
 
         # Action
-        response = insert_data(['import_csv'], 'sku', validate_by_supplier, [], [], [])
+        products, errors = validate_product_rows(rows)
 
         # Assertions
-        self.assertTrue(get_mock.called)
-        self.assertTrue(import_csv_mock.called)
-        self.assertTrue(save_mock.called)
-        self.assertTrue(product_mock.called)
-        self.assertEqual([product_mock], get_mock.return_value)
-        self.assertEqual([save_mock()], response)
-        self.assertEqual([{'name': 'name', 'cost_values': 12.54, 'unit_box': 20, 'weight_unit': 25.23,
-                           'validity': "2021-10-10", 'sku': '342343', 'description': 'descricao',
-                           'category_line_id': id, 'supplier_id': id}], import_csv_mock.return_value)
-
-    @patch('app.domains.products.actions.update')
-    @patch('app.domains.products.actions.Product')
-    @patch('app.domains.products.actions.import_product_csv_file')
-    @patch('app.domains.products.actions.get')
-    def test_action_inserting_products_by_supplier_from_the_csv_file_in_db_should_update_a_list_of_saved_products(self,
-                                                                                                                  get_mock,
-                                                                                                                  import_csv_mock,
-                                                                                                                  product_mock,
-                                                                                                                  update_mock):
+        self.assertEqual(['sku0'], [product['sku'] for product in products])
+        self.assertEqual(datetime.datetime(2099, 12, 31), products[0]['validity'])
+        self.assertEqual([{'line': 3, 'column': 'cost_values', 'error': 'Check that the types of values match their '
+                                                                       'columns'},
+                          {'line': 5, 'column': 'name', 'error': 'The following field(s) must be only letters: name'}],
+                         errors)
+
+    def test_action_import_products_should_validate_the_rows_in_processes(self):
         # Arrange
-        id = str(uuid4())
-        product_mock.sku = 'teste'
-        get_mock.return_value = [product_mock]
-        import_csv_mock.return_value = [{'name': 'name', 'cost_values': 12.54, 'unit_box': 20, 'weight_unit': 25.23,
-                                         'validity': "2021-10-10", 'sku': 'teste', 'description': 'descricao',
-                                         'category_line_id': id, 'supplier_id': id}]
+        catalogue = self._insert_catalogue(0)
+        csv_file = self._csv_file([self._product_row(catalogue, f'sku{index}') for index in range(5)] +
+                                  [self._product_row(catalogue, 'sku5', name='produto 5')])
 
         # Action
-        response = insert_data(['import_csv'], 'sku', validate_by_supplier, [], [], [])
+        report = import_products(csv_file, chunk_size=2, atomic=False, validation_workers=2)
 
         # Assertions
-        self.assertTrue(get_mock.called)
-        self.assertTrue(import_csv_mock.called)
-        self.assertEqual([product_mock], get_mock.return_value)
-        self.assertEqual([update_mock()], response)
-        self.assertEqual([{'name': 'name', 'cost_values': 12.54, 'unit_box': 20, 'weight_unit': 25.23,
-                           'validity': "2021-10-10", 'sku': 'teste', 'description': 'descricao',
-                           'category_line_id': id, 'supplier_id': id}], import_csv_mock.return_value)
+        self.assertEqual(5, report['inserted'])
+        self.assertEqual([{'line': 7, 'column': 'name', 'error': 'The following field(s) must be only letters: name'}],
+                         report['errors'])
+        self.assertEqual({45.5}, {product.final_cost for product in get_products()})
 
-    @patch('app.domains.products.actions.Product')
-    @patch('app.domains.products.actions.save')
-    @patch('app.domains.products.actions.import_product_csv_file')
-    @patch('app.domains.products.actions.get')
-    def test_action_inserting_products_from_the_csv_file_in_db_should_raise_a_id_error(self,
-                                                                                       get_mock,
-                                                                                       import_csv_mock,
-                                                                                       save_mock,
-                                                                                       product_mock):
+    def test_action_import_products_should_report_every_invalid_line_and_insert_nothing_if_it_is_atomic(self):
         # Arrange
-        id = str(uuid4())
-        get_mock.return_value = [product_mock]
-        save_mock.side_effect = SQLAlchemyError
-        import_csv_mock.return_value = [{'name': 'name', 'cost_values': 12.54, 'unit_box': 20, 'weight_unit': 25.23,
-                                         'validity': "2021-10-10", 'sku': '342343', 'description': 'descricao',
-                                         'category_line_id': '342343', 'supplier_id': id}]
-        with pytest.raises(IdNotExistError) as exc:
+        catalogue = self._insert_catalogue(0)
+        csv_file = self._csv_file([self._product_row(catalogue, 'sku0', cost_values='x'),
+                                   self._product_row(catalogue, 'sku1'),
+                                   self._product_row(catalogue, 'sku2', name='produto 2')])
+        with pytest.raises(InvalidRowsError) as exc:
             # Action
-            insert_data(['import_csv'], 'sku', validate_by_supplier, [], [], [])
+            import_products(csv_file, chunk_size=2, validation_workers=2)
 
         # Assertions
-        self.assertEqual(400, exc.value.code)
-        self.assertEqual('Bad Request', exc.value.name)
-        self.assertEqual('The ID(s) inserted does not exist in the database', exc.value.description)
+        self.assertEqual('The following line(s) of the file have invalid values: line 2, column cost_values: Check '
+                         'that the types of values match their columns; line 4, column name: The following field(s) '
+                         'must be only letters: name', exc.value.description)
+        self.assertEqual([], get_products())
 
-    @patch('app.domains.products.actions.get_category_by_id')
-    @patch('app.domains.products.actions.get_category_line_by_id')
-    def test_action_get_percentages(self,
-                                    get_category_line_by_id_mock,
-                                    get_category_by_id_mock):
+    def test_action_validate_product_rows_should_report_every_invalid_column_of_a_row(self):
         # Arrange
-        id = str(uuid4())
-        _id = str(uuid4())
+        catalogue = self._insert_catalogue(0)
+        row = self._product_row(catalogue, 'sku0', name='produto 0', validity='2000-01-01')
+        del row['description']
+
+        # Action
+        _, errors = validate_product_rows([(2, row), (3, self._product_row(catalogue, 'sku1', name='produto 1',
+                                                                           validity='2000-01-01'))])
+
+        # Assertions
+        self.assertEqual([(2, 'description'), (3, 'name'), (3, 'validity')],
+                         [(error['line'], error['column']) for error in errors])
+        self.assertEqual('The validity date inserted is past it is expiry date', errors[2]['error'])
+
+    def test_action_import_products_should_collect_the_errors_and_insert_the_valid_rows(self):
+        # Arrange
+        catalogue = self._insert_catalogue(0)
+        csv_file = self._csv_file([self._product_row(catalogue, 'sku0'),
+                                   self._product_row(catalogue, 'sku1', unit_box='x'),
+                                   self._product_row(catalogue, 'sku2')])
+
+        # Action
+        report = import_products(csv_file, chunk_size=2, collect_errors=True)
+
+        # Assertions
+        self.assertEqual(2, report['inserted'])
+        self.assertEqual([{'line': 3, 'column': 'unit_box', 'error': 'Check that the types of values match their '
+                                                                    'columns'}], report['errors'])
+        self.assertEqual(['sku0', 'sku2'], sorted(product.sku for product in get_products()))
 
-        category_line = Mock()
-        category_line.id = id
-        category_line.category_id = _id
-        category_line.profit_percentage = 15.0
+    def test_action_import_products_by_supplier_should_insert_and_update_the_products(self):
+        # Arrange
+        catalogue = self._insert_catalogue(0)
+        import_products(self._csv_file([self._product_row(catalogue, 'sku0')]))
+        saved_product = Product.query.filter_by(sku='sku0').one()
+        csv_file = self._csv_file([self._product_row(catalogue, 'sku0', cost_values='99.9', name='nescau'),
+                                   self._product_row(catalogue, 'sku1')])
+
+        # Action
+        report = import_products_by_supplier(csv_file)
+
+        # Assertions
+        self.assertEqual(2, report['imported'])
+        products = {product.sku: product for product in get_products()}
+        self.assertEqual(saved_product.id, products['sku0'].id)
+        self.assertEqual(99.9, products['sku0'].cost_values)
+        self.assertEqual('nescau', products['sku0'].name)
+        self.assertEqual(10.5, products['sku1'].cost_values)
+
+    def test_action_import_products_by_supplier_should_issue_a_constant_number_of_statements_per_chunk(self):
+        # Arrange
+        catalogue = self._insert_catalogue(0)
+        import_products(self._csv_file([self._product_row(catalogue, f'sku{index}') for index in range(20)]))
+        csv_file = self._csv_file([self._product_row(catalogue, f'sku{index}', cost_values='20.5')
+                                   for index in range(40)])
+
+        # Action
+        with self._count_statements() as statements:
+            import_products_by_supplier(csv_file)
+
+        # Assertions
+        self.assertEqual(4, len(statements))
+        self.assertEqual({20.5}, {product.cost_values for product in get_products()})
+        self.assertEqual({55.5}, {product.final_cost for product in get_products()})
+        self.assertEqual(40, len(get_products()))
+
+    def test_action_import_products_by_supplier_should_report_the_diff_without_writing_if_it_is_a_dry_run(self):
+        # Arrange
+        catalogue = self._insert_catalogue(0)
+        import_products(self._csv_file([self._product_row(catalogue, 'sku0'), self._product_row(catalogue, 'sku1')]))
+        csv_file = self._csv_file([self._product_row(catalogue, 'sku0'),
+                                   self._product_row(catalogue, 'sku1', cost_values='20.5'),
+                                   self._product_row(catalogue, 'sku2')])
+
+        # Action
+        with self._count_statements() as statements:
+            report = import_products_by_supplier(csv_file, dry_run=True)
 
-        category = Mock()
-        category.id = _id
-        category.profit_percentage = 20.0
+        # Assertions
+        self.assertEqual((1, 1, 1), (report['inserted'], report['updated'], report['unchanged']))
+        self.assertTrue(report['dry_run'])
+        self.assertEqual([{'action': 'insert', 'sku': 'sku2'},
+                          {'action': 'update', 'sku': 'sku1', 'changes': {'cost_values': [10.5, 20.5]}}],
+                         report['sample'])
+        self.assertEqual(['SELECT'], [statement.split()[0] for statement in statements])
+        self.assertEqual({10.5}, {product.cost_values for product in get_products()})
+
+    def test_action_import_products_by_supplier_should_skip_the_unchanged_rows(self):
+        # Arrange
+        catalogue = self._insert_catalogue(0)
+        rows = [self._product_row(catalogue, f'sku{index}') for index in range(3)]
+        import_products(self._csv_file(rows))
+        on_update = {product.sku: product.on_update for product in get_products()}
+        db.session.remove()
+
+        # Action
+        with self._count_statements() as statements:
+            report = import_products_by_supplier(self._csv_file(rows))
 
-        get_category_line_by_id_mock.return_value = category_line
-        get_category_by_id_mock.return_value = category
+        # Assertions
+        self.assertEqual((0, 3), (report['imported'], report['unchanged']))
+        self.assertEqual(['SELECT'], [statement.split()[0] for statement in statements])
+        self.assertEqual(on_update, {product.sku: product.on_update for product in get_products()})
+
+    def test_action_import_products_should_count_the_new_rows_without_inserting_if_it_is_a_dry_run(self):
+        # Arrange
+        catalogue = self._insert_catalogue(1)
+        sku = Product.query.get(catalogue['product_ids'][0]).sku
+        csv_file = self._csv_file([self._product_row(catalogue, sku), self._product_row(catalogue, 'sku1')])
 
         # Action
-        sum_of_porcentages = get_percentages(id)
+        report = import_products(csv_file, dry_run=True)
 
         # Assertions
-        self.assertTrue(get_category_by_id_mock.called)
-        self.assertTrue(get_category_line_by_id_mock.called)
-        self.assertEqual(sum_of_porcentages, 35.0)
+        self.assertEqual((1, 1), (report['inserted'], report['skipped']))
+        self.assertEqual([{'action': 'insert', 'sku': 'sku1'}], report['sample'])
+        self.assertEqual([sku], [product.sku for product in get_products()])
+
+    def test_action_import_products_by_supplier_should_raise_a_id_error(self):
+        # Arrange
+        catalogue = self._insert_catalogue(0)
+        csv_file = self._csv_file([self._product_row(catalogue, 'sku0'), self._product_row(catalogue, 'sku0')])
+        with pytest.raises(IdNotExistError) as exc:
+            # Action
+            import_products_by_supplier(csv_file)
+
+        # Assertions
+        self.assertEqual('The ID(s) inserted does not exist in the database', exc.value.description)
+        self.assertEqual([], get_products())
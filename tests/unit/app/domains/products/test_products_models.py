@@ -157,35 +157,3 @@ class TestProductModels(unittest.TestCase):
         self.assertEqual("The field(s) 'name', 'cost_values', 'weight_unit', 'description', 'category_line_id', "
                          "'supplier_id' must be the following maximum sizes respectively: 80, 2 decimal places, "
                          "3 decimal places, 150, 36, 36", exc.value.description)
-
-    @patch('app.domains.products.models.Product')
-    def test_products_models_serialize_final_cost_method(self, product_mock):
-        # Arrange
-        _id = str(uuid4())
-        id = str(uuid4())
-        product_mock.query.filter.return_value.first.return_value = []
-        products = Product(id=_id, active=False, name='Nescau', cost_values=10.15, unit_box=5, weight_unit=0.550,
-                           validity="2021-12-31", sku='09ub124ibbi413', description='Descrição...',
-                           category_line_id=id, supplier_id=id,
-                           on_create=datetime.datetime.now().strftime("%Y-%m-%d %H:%M"),
-                           on_update=datetime.datetime.now().strftime("%Y-%m-%d %H:%M"))
-
-        # Action
-        response = products.serialize_final_cost(15.0)
-
-        # Assertions
-        self.assertEqual(type(response), dict)
-        self.assertIsInstance(products, Product)
-        self.assertEqual({'active': False,
-                          'category_line_id': id,
-                          'cost_values': 25.15,
-                          'description': 'Descrição...',
-                          'id': _id,
-                          'name': 'Nescau',
-                          'on_create': datetime.datetime.now().strftime("%Y-%m-%d %H:%M"),
-                          'on_update': datetime.datetime.now().strftime("%Y-%m-%d %H:%M"),
-                          'sku': '09ub124ibbi413',
-                          'supplier_id': id,
-                          'unit_box': 5,
-                          'validity': '2021-12-31',
-                          'weight_unit': 0.55}, response)
@@ -2,6 +2,7 @@ import pytest
 import io
 import csv
 from uuid import uuid4
+from unittest import mock
 from unittest.mock import patch, MagicMock, Mock
 
 from tests.unit import AbstractViewUnitTest
@@ -11,14 +12,10 @@ from app.domains.products.views import validating_if_json_is_correct
 
 class TestProductsViews(AbstractViewUnitTest):
 
-    @patch('app.domains.products.views.get_products')
-    @patch('app.domains.products.views.get_percentages')
-    def test_get_products_should_be_1(self, get_percentages_mock, get_products_mock):
+    @patch('app.domains.products.views.get_product_page_with_final_cost')
+    def test_get_products_should_be_1(self, get_products_with_final_cost_mock):
         # Arrange
-        obj = Mock()
-        get_percentages_mock.return_value = [50]
-        obj.serialize_final_cost = MagicMock(return_value={})
-        get_products_mock.return_value = [obj]
+        get_products_with_final_cost_mock.return_value = ([{}], None)
 
         # Action
         response = self._client.get('/products')
@@ -26,25 +23,44 @@ class TestProductsViews(AbstractViewUnitTest):
 
         # Assertions
         self.assertEqual(len(data), 1)
-        get_products_mock.assert_called_once()
+        get_products_with_final_cost_mock.assert_called_once()
+
+    @patch('app.domains.products.views.get_product_page_with_final_cost')
+    def test_get_products_should_send_the_filters_and_the_sort(self, get_products_with_final_cost_mock):
+        # Arrange
+        get_products_with_final_cost_mock.return_value = ([{}], None)
+        supplier_id = str(uuid4())
+
+        # Action
+        response = self._client.get(f'/products?supplier_id={supplier_id}&max_cost=10.5&active=true&sort=-cost_values')
+
+        # Assertions
+        self.assertEqual(response.status_code, 200)
+        get_products_with_final_cost_mock.assert_called_once_with(
+            fields=mock.ANY, limit=500, after=None, keys=('cost_values', 'id'), descending=True,
+            filters={'supplier_id': supplier_id, 'max_cost': 10.5, 'active': True})
+
+    def test_get_products_should_raise_a_filter_exception(self):
+        # Action
+        response = self._client.get('/products?validity_before=31-12-2099')
+
+        # Assertions
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual('The following filter(s) have an invalid value: validity_before',
+                         response.get_json()['message'])
 
-    @patch('app.domains.products.views.get_percentages')
-    @patch('app.domains.products.views.get_products_by_id')
-    def test_get_products_by_id_should_be_1(self, get_products_by_id_mock, get_percentages_mock):
+    @patch('app.domains.products.views.get_product_by_id_with_final_cost')
+    def test_get_products_by_id_should_be_1(self, get_product_by_id_with_final_cost_mock):
         # Arrange
         id = str(uuid4())
-        obj = Mock()
-        get_percentages_mock.return_value = [50]
-        obj.serialize_final_cost = MagicMock(return_value={})
-        get_products_by_id_mock.id = id
-        get_products_by_id_mock.return_value = obj
+        get_product_by_id_with_final_cost_mock.return_value = {}
 
         # Action
         response = self._client.get('/products/{}'.format(id))
 
         # Assertions
         self.assertEqual(response.status_code, 200)
-        get_products_by_id_mock.assert_called_once_with(id)
+        get_product_by_id_with_final_cost_mock.assert_called_once_with(id)
 
     @patch('app.domains.products.views.create_products')
     def test_post_products_should_be_created(self, create_products_mock):
@@ -129,7 +145,23 @@ class TestProductsViews(AbstractViewUnitTest):
             'description': 'Descrição...'
         })
 
-    @patch('app.domains.products.views.get_products')
+    @patch('app.domains.products.views.update_products')
+    def test_patch_products_should_be_partially_updated(self, update_products_mock):
+        # Arrange
+        _id = '1f6d2021-0e2a-4ba3-0011-5472b6df7244'
+        obj = Mock()
+        obj.serialize = MagicMock(return_value={'id': _id, 'name': 'produto'})
+        update_products_mock.return_value = obj
+
+        # Action
+        response = self._client.patch(f'/products/{_id}', json={'name': 'produto'})
+
+        # Assertions
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(1, obj.serialize.call_count)
+        update_products_mock.assert_called_once_with(_id, {'name': 'produto'}, partial=True)
+
+    @patch('app.domains.products.views.get_products_in_batches')
     def test_if_export_is_sending_file_to_download(self, get_product_mock):
         # Arrange
         obj_view = Mock()
@@ -144,8 +176,8 @@ class TestProductsViews(AbstractViewUnitTest):
         self.assertEqual(response.headers["Content-Disposition"], "attachment; filename=Products.csv")
         self.assertEqual(response.headers["Content-type"], "text/csv")
 
-    @patch('app.domains.products.actions.save')
-    def test_import_product_route_method(self, save_mock):
+    @patch('app.domains.products.views.import_products')
+    def test_import_product_route_method(self, import_products_mock):
         # Arrange
         id = str(uuid4())
         data1 = {'name': 'teste um', 'cost_values': 12.54, 'unit_box': 20, 'weight_unit': 25.23,
@@ -158,17 +190,70 @@ class TestProductsViews(AbstractViewUnitTest):
         writer.writerow(data)
         bytes_data = bytes(csv_file.getvalue(), 'utf-8')
         data['data_file'] = (io.BytesIO(bytes_data), 'import.csv')
+        import_products_mock.return_value = {'inserted': 1, 'seconds': 0.01, 'rows_per_second': 100.0}
 
         # Action
-        response = self._client.post('/products:import', data=data, follow_redirects=True,
+        response = self._client.post('/products:import?atomic=false', data=data, follow_redirects=True,
                                      content_type='multipart/form-data')
         data = response.get_json()
-        save_mock(data)
 
         # Assertions
-        save_mock.assert_called_with(data)
         self.assertEqual(response.status_code, 200)
-        self.assertEqual(0, len(data))
+        self.assertEqual({'inserted': 1, 'seconds': 0.01, 'rows_per_second': 100.0}, data)
+        self.assertEqual(1000, import_products_mock.call_args.kwargs['chunk_size'])
+        self.assertFalse(import_products_mock.call_args.kwargs['atomic'])
+        self.assertNotIn('validation_workers', import_products_mock.call_args.kwargs)
+
+    @patch('app.domains.products.views.import_products_by_supplier')
+    def test_import_by_supplier_route_should_validate_in_processes_if_it_is_parallel(self, import_mock):
+        # Arrange
+        import_mock.return_value = {'imported': 1, 'seconds': 0.01, 'rows_per_second': 100.0, 'errors': []}
+        data = {'data_file': (io.BytesIO(b'name\r\nnescau\r\n'), 'import.csv')}
+
+        # Action
+        response = self._client.post('/products:import-by-supplier?parallel=true', data=data,
+                                     content_type='multipart/form-data')
+
+        # Assertions
+        self.assertEqual(200, response.status_code)
+        self.assertEqual(2, import_mock.call_args.kwargs['validation_workers'])
+
+    @patch('app.domains.products.views.import_products')
+    def test_import_route_should_return_the_collected_errors_as_csv(self, import_products_mock):
+        # Arrange
+        import_products_mock.return_value = {'inserted': 1, 'seconds': 0.01, 'rows_per_second': 100.0,
+                                             'errors': [{'line': 3, 'column': 'unit_box', 'error': 'invalid'}]}
+        data = {'data_file': (io.BytesIO(b'name\r\nnescau\r\n'), 'import.csv')}
+
+        # Action
+        response = self._client.post('/products:import?collect_errors=true&report=csv', data=data,
+                                     content_type='multipart/form-data')
+
+        # Assertions
+        self.assertEqual(200, response.status_code)
+        self.assertEqual('text/csv', response.headers['Content-Type'])
+        self.assertEqual('1', response.headers['X-Import-Inserted'])
+        self.assertEqual('100.0', response.headers['X-Import-Rows-Per-Second'])
+        self.assertEqual('line,column,error\r\n3,unit_box,invalid\r\n', response.get_data(as_text=True))
+        self.assertTrue(import_products_mock.call_args.kwargs['collect_errors'])
+
+    @patch('app.domains.products.views.import_products')
+    def test_import_route_should_leave_the_dry_run_sample_out_of_the_csv_report(self, import_products_mock):
+        # Arrange
+        import_products_mock.return_value = {'inserted': 1, 'seconds': 0.01, 'rows_per_second': 100.0,
+                                             'dry_run': True, 'errors': [],
+                                             'sample': [{'action': 'insert', 'name': 'café ☕'}]}
+        data = {'data_file': (io.BytesIO(b'name\r\nnescau\r\n'), 'import.csv')}
+
+        # Action
+        response = self._client.post('/products:import?dry_run=true&collect_errors=true&report=csv', data=data,
+                                     content_type='multipart/form-data')
+
+        # Assertions
+        self.assertEqual(200, response.status_code)
+        self.assertEqual('True', response.headers['X-Import-Dry-Run'])
+        self.assertNotIn('X-Import-Sample', response.headers)
+        self.assertEqual('line,column,error\r\n', response.get_data(as_text=True))
 
     def test_import_route_method_if_has_no_file(self):
         # Arrange
@@ -183,10 +268,10 @@ class TestProductsViews(AbstractViewUnitTest):
 
         # Assertions
         self.assertEqual(response.status_code, 400)
-        self.assertEqual(response.data, b'{"code": 400, "message": "No file"}')
+        self.assertEqual({'code': 400, 'message': 'No file'}, response.get_json())
 
-    @patch('app.domains.products.actions.save')
-    def test_import_product_by_supplier_route_method(self, save_mock):
+    @patch('app.domains.products.views.import_products_by_supplier')
+    def test_import_product_by_supplier_route_method(self, import_products_by_supplier_mock):
         # Arrange
         id = str(uuid4())
         data1 = {'name': 'teste um', 'cost_values': 12.54, 'unit_box': 20, 'weight_unit': 25.23,
@@ -199,16 +284,16 @@ class TestProductsViews(AbstractViewUnitTest):
         writer.writerow(data)
         bytes_data = bytes(csv_file.getvalue(), 'utf-8')
         data['data_file'] = (io.BytesIO(bytes_data), 'import.csv')
+        import_products_by_supplier_mock.return_value = {'imported': 1, 'seconds': 0.01, 'rows_per_second': 100.0}
 
         # Action
         response = self._client.post('/products:import-by-supplier', data=data, follow_redirects=True,
                                      content_type='multipart/form-data')
-        save_mock(response)
 
         # Assertions
-        save_mock.assert_called_with(response)
         self.assertEqual(response.status_code, 200)
-        self.assertEqual(10, len(data))
+        self.assertEqual({'imported': 1, 'seconds': 0.01, 'rows_per_second': 100.0}, response.get_json())
+        self.assertTrue(import_products_by_supplier_mock.call_args.kwargs['atomic'])
 
     def test_import_by_supplier_route_method_if_has_no_file(self):
         # Arrange
@@ -222,4 +307,17 @@ class TestProductsViews(AbstractViewUnitTest):
 
         # Assertions
         self.assertEqual(response.status_code, 400)
-        self.assertEqual(response.data, b'{"code": 400, "message": "No file"}')
+        self.assertEqual({'code': 400, 'message': 'No file'}, response.get_json())
+
+    @patch('app.domains.products.views.create_products_batch')
+    def test_batch_route_should_return_422_when_the_atomic_batch_has_errors(self, create_many_mock):
+        # Arrange
+        create_many_mock.return_value = {'created': 0, 'failed': 1, 'results': [{'index': 0, 'error': 'error'}]}
+
+        # Action
+        response = self._client.post('/products:batch', json=[{}])
+
+        # Assertions
+        create_many_mock.assert_called_once_with([{}], atomic=True)
+        self.assertEqual(response.status_code, 422)
+        self.assertEqual(response.get_json()['results'], [{'index': 0, 'error': 'error'}])
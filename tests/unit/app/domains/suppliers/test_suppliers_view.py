@@ -8,12 +8,10 @@ from app.domains.suppliers.views import validating_if_json_is_correct
 
 class TestSuppliersView(AbstractViewUnitTest):
 
-    @patch('app.domains.suppliers.views.get_suppliers')
+    @patch('app.domains.suppliers.views.get_supplier_page')
     def test_get_suppliers_should_be_1(self, get_supplier_mock):
         # Arrange
-        obj = Mock()
-        obj.serialize_summed_version = MagicMock(return_value={})
-        get_supplier_mock.return_value = [obj]
+        get_supplier_mock.return_value = ([{}], None)
 
         # Action
         response = self._client.get('/suppliers')
@@ -21,7 +19,8 @@ class TestSuppliersView(AbstractViewUnitTest):
 
         # Assertions
         self.assertEqual(len(data), 1)
-        get_supplier_mock.assert_called_once()
+        get_supplier_mock.assert_called_once_with(fields=['id', 'trading_name', 'on_create', 'on_update'],
+                                                  limit=500, after=None)
 
     @patch('app.domains.suppliers.views.get_supplier_by_id')
     def test_get_user_by_id_should_be_1(self, get_supplier_by_id_mock):
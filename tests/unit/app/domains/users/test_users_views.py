@@ -4,12 +4,10 @@ from unittest.mock import patch, MagicMock, Mock
 
 class TestUsersViews(AbstractViewUnitTest):
 
-    @patch('app.domains.users.views.get_users')
+    @patch('app.domains.users.views.get_user_page')
     def test_get_users_should_be_1(self, get_user_mock):
         # Arrange
-        obj = Mock()
-        obj.serialize = MagicMock(return_value={})
-        get_user_mock.return_value = [obj]
+        get_user_mock.return_value = ([{}], None)
 
         # Action
         response = self._client.get('/users')
@@ -0,0 +1,87 @@
+import datetime
+import decimal
+import json
+import unittest
+from unittest.mock import patch
+
+from flask import Flask, jsonify
+
+from app.serialization import StdlibJSONEncoder, json_encoder_for, init_app, stream_json_array, orjson
+
+
+class TestSerialization(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self._app = Flask(__name__)
+
+    def _jsonify(self, encoder: type, data):
+        self._app.json_encoder = encoder
+        with self._app.app_context():
+            return jsonify(data).get_json()
+
+    @unittest.skipUnless(orjson, 'orjson is not installed')
+    def test_encoders_should_serialize_datetimes_as_iso_8601(self):
+        # Arrange
+        data = {'validity': datetime.datetime(2099, 12, 31), 'on_create': datetime.datetime(2021, 1, 2, 3, 4, 5, 6),
+                'day': datetime.date(2099, 12, 31), 'cost_values': decimal.Decimal('10.50')}
+        encoders = (StdlibJSONEncoder, json_encoder_for({'JSON_ENCODER': 'orjson'}))
+
+        # Action
+        outputs = [self._jsonify(encoder, data) for encoder in encoders]
+
+        # Assertions
+        self.assertEqual(outputs[0], outputs[1])
+        self.assertEqual({'validity': '2099-12-31T00:00:00', 'on_create': '2021-01-02T03:04:05.000006',
+                          'day': '2099-12-31', 'cost_values': '10.50'}, outputs[0])
+
+    @unittest.skipUnless(orjson, 'orjson is not installed')
+    def test_orjson_encoder_should_sort_the_keys_like_the_stdlib(self):
+        # Action
+        encoded = json.dumps({'b': 1, 'a': 2}, cls=json_encoder_for({'JSON_ENCODER': 'orjson'}), sort_keys=True)
+
+        # Assertions
+        self.assertEqual('{"a":2,"b":1}', encoded)
+
+    def test_json_encoder_for_should_fall_back_to_the_stdlib(self):
+        # Action
+        with patch('app.serialization.orjson', None):
+            encoder = json_encoder_for({'JSON_ENCODER': 'orjson'})
+
+        # Assertions
+        self.assertIs(StdlibJSONEncoder, encoder)
+        self.assertIs(StdlibJSONEncoder, json_encoder_for({'JSON_ENCODER': 'stdlib'}))
+
+    @unittest.skipUnless(orjson, 'orjson is not installed')
+    def test_json_encoder_for_should_use_orjson_by_default(self):
+        # Action
+        encoder = json_encoder_for({})
+
+        # Assertions
+        self.assertIsNot(StdlibJSONEncoder, encoder)
+        self.assertTrue(issubclass(encoder, StdlibJSONEncoder))
+        self.assertEqual('{"a":1}', json.dumps({'a': 1}, cls=encoder))
+
+    def test_stream_json_array_should_stream_a_valid_array_in_batches(self):
+        # Arrange
+        init_app(self._app)
+        items = [{'id': index, 'on_create': datetime.datetime(2099, 12, 31)} for index in range(5)]
+
+        # Action
+        with self._app.test_request_context():
+            response = stream_json_array(iter(items), headers={'X-Next-Cursor': 'cursor'}, batch_size=2)
+            chunks = list(response.response)
+
+        # Assertions
+        self.assertTrue(response.is_streamed)
+        self.assertEqual('cursor', response.headers['X-Next-Cursor'])
+        self.assertEqual(5, len(chunks))
+        self.assertEqual([{**item, 'on_create': '2099-12-31T00:00:00'} for item in items], json.loads(''.join(chunks)))
+
+    def test_stream_json_array_should_stream_an_empty_array(self):
+        # Action
+        with self._app.test_request_context():
+            response = stream_json_array([])
+            body = ''.join(response.response)
+
+        # Assertions
+        self.assertEqual('[]', body)
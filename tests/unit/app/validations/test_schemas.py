@@ -0,0 +1,117 @@
+import unittest
+
+from app.domains.products.models import PRODUCT_SCHEMA, validating_size_of_fields as validating_product_sizes
+from app.domains.suppliers.models import SUPPLIER_SCHEMA, validating_maximum_size_of_fields, \
+    validating_minimum_size_of_fields, validating_equal_size_of_fields
+from app.validations.schemas import Schema, empty_fields, int_fields, maximum_size_fields
+from app.validations.validations import *
+
+
+def validating_product_chain(**data):
+    validating_empty_fields(['active', 'description'], **data)
+    validating_if_field_is_not_str(['active', 'on_create', 'on_update', 'cost_values', 'unit_box', 'weight_unit',
+                                    'validity'], **data)
+    validating_if_field_is_bool(['active'], **data)
+    validating_if_field_is_alpha(['name'], **data)
+    validating_validity(['validity'], **data)
+    validating_if_field_is_int(['unit_box'], **data)
+    validating_if_field_is_float(['cost_values', 'weight_unit'], **data)
+    validating_product_sizes(**data)
+
+
+def validating_supplier_chain(**data):
+    validating_empty_fields(['description'], **data)
+    validating_if_field_is_not_str(['active', 'on_create', 'on_update'], **data)
+    validating_if_field_is_bool(['active'], **data)
+    validating_if_field_is_numeric(['phone', 'cnpj'], **data)
+    validating_if_field_is_alpha(['company_name', 'trading_name'], **data)
+    validating_email(**data)
+    validating_maximum_size_of_fields(**data)
+    validating_minimum_size_of_fields(**data)
+    validating_equal_size_of_fields(**data)
+
+
+def raised_by(validate, data):
+    try:
+        validate(data)
+    except Exception as error:
+        return type(error), str(error)
+    return None
+
+
+PRODUCT = {'name': 'Leite', 'cost_values': 10.5, 'unit_box': 12, 'weight_unit': 1.0, 'validity': '2099-12-31',
+           'sku': '123', 'description': 'Leite integral', 'category_line_id': 'category-line-id',
+           'supplier_id': 'supplier-id'}
+
+SUPPLIER = {'company_name': 'Nestle', 'cnpj': '12345678901234', 'trading_name': 'Nestle', 'phone': '4733333333',
+            'email': 'nestle@nestle.com', 'address_id': 'address-id', 'category_id': 'category-id'}
+
+
+class TestSchemas(unittest.TestCase):
+
+    def test_product_schema_should_raise_the_same_exceptions_of_the_validator_chain(self):
+        # Arrange
+        cases = [{}, {'name': ''}, {'name': 'Leite 2'}, {'name': 'a' * 81}, {'cost_values': '10'},
+                 {'cost_values': -1.0}, {'cost_values': 10.555}, {'cost_values': 100}, {'weight_unit': 1.2345},
+                 {'unit_box': 1.5}, {'unit_box': -1}, {'sku': -1}, {'validity': '31-12-2099'},
+                 {'validity': '2000-01-01'}, {'active': 'yes'}, {'active': False}, {'description': None},
+                 {'description': 'a' * 151}, {'supplier_id': 'a' * 37}, {'name': '', 'unit_box': 1.5},
+                 {'name': 'Leite 2', 'validity': '2000-01-01', 'cost_values': 1.555}]
+
+        for case in cases:
+            data = {**PRODUCT, **case}
+
+            # Action
+            expected = raised_by(lambda data: validating_product_chain(**data), data)
+            result = raised_by(PRODUCT_SCHEMA.validate, data)
+
+            # Assertions
+            self.assertEqual(result, expected, case)
+
+    def test_supplier_schema_should_raise_the_same_exceptions_of_the_validator_chain(self):
+        # Arrange
+        cases = [{}, {'phone': '47333'}, {'phone': '473333333333'}, {'phone': '47-3333-3333'}, {'cnpj': '123'},
+                 {'email': 'nestle'}, {'email': 'a' * 190 + '@nestle.com'}, {'company_name': 'Nestle 2'},
+                 {'trading_name': ''}, {'active': 1}, {'address_id': 'a' * 37, 'cnpj': '1'}]
+
+        for case in cases:
+            data = {**SUPPLIER, **case}
+
+            # Action
+            expected = raised_by(lambda data: validating_supplier_chain(**data), data)
+            result = raised_by(SUPPLIER_SCHEMA.validate, data)
+
+            # Assertions
+            self.assertEqual(result, expected, case)
+
+    def test_validate_should_report_the_fields_in_the_order_they_were_informed(self):
+        # Arrange
+        schema = Schema(empty_fields([]), int_fields(['unit_box']), maximum_size_fields({'name': 3}))
+
+        # Action
+        with self.assertRaises(EmptyFieldsError) as error:
+            schema.validate({'name': '', 'sku': 'sku', 'description': ' '})
+
+        # Assertions
+        self.assertEqual(str(error.exception), str(EmptyFieldsError(['name', 'description'])))
+
+    def test_first_error_should_return_none_when_the_data_is_valid(self):
+        # Arrange
+        schema = Schema(empty_fields([]), maximum_size_fields({'name': 3}), fields=['name'])
+
+        # Action
+        result = schema.first_error({'name': 'abc', 'unknown': 'x'})
+
+        # Assertions
+        self.assertIsNone(result)
+
+    def test_field_errors_should_return_the_error_of_every_failed_rule_with_its_fields(self):
+        # Arrange
+        schema = Schema(empty_fields([]), int_fields(['unit_box']), maximum_size_fields({'name': 3}))
+
+        # Action
+        field_errors = schema.field_errors({'name': 'abcd', 'unit_box': 'x', 'description': ''})
+
+        # Assertions
+        self.assertEqual([['description'], ['unit_box'], ['name']], [fields for fields, _ in field_errors])
+        self.assertEqual(str(SizeError([3], ['name'], 'maximum')), str(field_errors[2][1]))
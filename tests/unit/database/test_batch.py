@@ -0,0 +1,90 @@
+import pytest
+
+from app.domains.categories.actions import create_many as create_categories
+from app.domains.categories.models import Category
+from app.domains.products.actions import create_many as create_products
+from app.domains.products.models import Product
+from app.exceptions.exceptions_of_batch import BatchError, BatchSizeError
+from database import db
+from database.batch import insert_batch, batch_status
+from tests.unit import AbstractDatabaseUnitTest
+
+
+class TestBatch(AbstractDatabaseUnitTest):
+
+    def _product_item(self, catalogue: dict, sku: str, **data) -> dict:
+        return {'name': 'Nescau', 'cost_values': 10.5, 'unit_box': 5, 'weight_unit': 0.5, 'validity': '2099-12-31',
+                'sku': sku, 'description': 'Descrição...', 'category_line_id': catalogue['category_line_id'],
+                'supplier_id': catalogue['supplier_id'], **data}
+
+    def test_create_many_should_insert_all_the_items_in_one_statement(self):
+        # Arrange
+        items = [{'name': 'bebidas', 'profit_percentage': 10.0}, {'name': 'doces', 'profit_percentage': 20.0}]
+
+        # Action
+        with self._count_statements() as statements:
+            report = create_categories(items)
+
+        # Assertions
+        self.assertEqual(2, report['created'])
+        self.assertEqual(0, report['failed'])
+        self.assertEqual([0, 1], [result['index'] for result in report['results']])
+        self.assertEqual({'bebidas', 'doces'}, {category.name for category in Category.query.all()})
+        self.assertEqual(1, len([statement for statement in statements if statement.startswith('INSERT')]))
+        self.assertEqual(201, batch_status(report))
+
+    def test_create_many_should_report_the_indexes_of_the_invalid_items_and_insert_nothing(self):
+        # Arrange
+        items = [{'name': 'bebidas', 'profit_percentage': 10.0}, {'name': 'doces'}, 'doces',
+                 {'name': 'bebidas', 'profit_percentage': 10.0}]
+
+        # Action
+        report = create_categories(items)
+
+        # Assertions
+        self.assertEqual(0, report['created'])
+        self.assertEqual(3, report['failed'])
+        self.assertEqual([1, 2, 3], [result['index'] for result in report['results']])
+        self.assertIn('name, profit_percentage', report['results'][0]['error'])
+        self.assertIn('repeated', report['results'][2]['error'])
+        self.assertEqual([], Category.query.all())
+        self.assertEqual(422, batch_status(report))
+
+    def test_create_many_should_insert_the_valid_items_when_it_is_not_atomic(self):
+        # Arrange
+        self._insert(Category, name='bebidas', profit_percentage=10.0)
+        items = [{'name': 'bebidas', 'profit_percentage': 10.0}, {'name': 'doces', 'profit_percentage': 20.0}]
+
+        # Action
+        report = create_categories(items, atomic=False)
+
+        # Assertions
+        self.assertEqual(1, report['created'])
+        self.assertIn('unique: name', report['results'][0]['error'])
+        self.assertEqual('doces', Category.query.get(report['results'][1]['id']).name)
+        self.assertEqual(207, batch_status(report))
+
+    def test_create_many_should_save_the_final_cost_of_the_products(self):
+        # Arrange
+        catalogue = self._insert_catalogue(0, category_percentage=20.0, category_line_percentage=15.0)
+        items = [self._product_item(catalogue, 'sku1'), self._product_item(catalogue, 'sku2', cost_values=-1.0)]
+
+        # Action
+        report = create_products(items, atomic=False)
+
+        # Assertions
+        db.session.expire_all()
+        product = Product.query.get(report['results'][0]['id'])
+        self.assertEqual(45.5, product.final_cost)
+        self.assertEqual(1, report['failed'])
+        self.assertIn('cost_values', report['results'][1]['error'])
+
+    def test_insert_batch_should_raise_a_batch_error_when_the_data_is_not_a_list(self):
+        with pytest.raises(BatchError):
+            # Action
+            insert_batch(Category, {'name': 'bebidas'}, ['name'], lambda category: None)
+
+    def test_insert_batch_should_raise_a_batch_size_error_when_the_batch_is_too_big(self):
+        with pytest.raises(BatchSizeError):
+            # Action
+            insert_batch(Category, [{'name': 'bebidas'}] * 3, ['name'], lambda category: None, max_size=2)
@@ -0,0 +1,112 @@
+import datetime
+import re
+from contextlib import contextmanager
+from typing import List, Tuple
+
+from sqlalchemy import event
+
+from app.domains.products.models import Product
+from app.domains.suppliers.models import Supplier
+from app.domains.category_lines.models import CategoryLine
+from app.domains.products.actions import get_page_with_final_cost, get_ids_by_sku
+from app.domains.suppliers.actions import get_page as get_supplier_page
+from app.domains.categories.actions import get_page as get_category_page
+from app.domains.addresses.actions import get_page as get_address_page
+from database import db
+from tests.unit import AbstractDatabaseUnitTest
+
+FULL_SCAN = re.compile(r'^SCAN (\w+)$')
+TEMP_SORT = 'USE TEMP B-TREE'
+
+
+class TestIndexes(AbstractDatabaseUnitTest):
+
+    def setUp(self) -> None:
+        super().setUp()
+        self._catalogue = self._insert_catalogue(20)
+
+    @contextmanager
+    def _capture_statements(self):
+        statements = []
+
+        def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+            statements.append((statement, parameters))
+
+        event.listen(db.engine, 'before_cursor_execute', _before_cursor_execute)
+        try:
+            yield statements
+        finally:
+            event.remove(db.engine, 'before_cursor_execute', _before_cursor_execute)
+
+    def _query_plans(self, statements: List[Tuple[str, tuple]]) -> List[List[str]]:
+        connection = db.session.connection()
+        return [[row[-1] for row in connection.execute(f'EXPLAIN QUERY PLAN {statement}', parameters)]
+                for statement, parameters in statements]
+
+    def _assert_uses_indexes(self, statements: List[Tuple[str, tuple]]):
+        self.assertTrue(statements)
+        for (statement, _), plan in zip(statements, self._query_plans(statements)):
+            for detail in plan:
+                self.assertIsNone(FULL_SCAN.match(detail), f'{detail} in {statement}')
+                self.assertNotIn(TEMP_SORT, detail, statement)
+
+    def test_products_by_supplier_should_use_an_index(self):
+        # Action
+        with self._capture_statements() as statements:
+            Product.query.filter(Product.supplier_id == self._catalogue['supplier_id']).all()
+
+        # Assertions
+        self._assert_uses_indexes(statements)
+
+    def test_category_lines_and_suppliers_by_category_should_use_an_index(self):
+        # Action
+        with self._capture_statements() as statements:
+            CategoryLine.query.filter(CategoryLine.category_id == self._catalogue['category_id']).all()
+            Supplier.query.filter(Supplier.category_id == self._catalogue['category_id']).all()
+            Supplier.query.filter(Supplier.address_id == self._catalogue['address_id']).all()
+
+        # Assertions
+        self._assert_uses_indexes(statements)
+
+    def test_filtered_product_pages_should_be_read_in_index_order(self):
+        # Action
+        with self._capture_statements() as statements:
+            get_page_with_final_cost(['id'], 5, None, {'supplier_id': self._catalogue['supplier_id']})
+            get_page_with_final_cost(['id'], 5, None, {'category_line_id': self._catalogue['category_line_id']})
+            get_page_with_final_cost(['id'], 5, None, {'validity_before': datetime.datetime(2100, 1, 1)},
+                                     keys=('validity', 'id'))
+
+        # Assertions
+        self._assert_uses_indexes(statements)
+
+    def test_active_products_listing_should_use_an_index(self):
+        # Action
+        with self._capture_statements() as statements:
+            Product.query.filter(Product.active).order_by(Product.on_create, Product.id).limit(5).all()
+
+        # Assertions
+        self._assert_uses_indexes(statements)
+        self.assertIn('USING INDEX ix_products_', ' '.join(self._query_plans(statements)[0]))
+
+    def test_pages_should_be_read_in_index_order(self):
+        # Arrange
+        _, after = get_page_with_final_cost(['id', 'cost_values'], 5, None)
+
+        # Action
+        with self._capture_statements() as statements:
+            get_page_with_final_cost(['id', 'cost_values'], 5, None)
+            get_page_with_final_cost(['id', 'cost_values'], 5, after)
+            get_supplier_page(['id'], 5, None)
+            get_category_page(['id'], 5, None)
+            get_address_page(['id'], 5, None)
+
+        # Assertions
+        self._assert_uses_indexes(statements)
+
+    def test_import_lookup_by_sku_should_use_an_index(self):
+        # Action
+        with self._capture_statements() as statements:
+            get_ids_by_sku(['sku1', 'sku2'])
+
+        # Assertions
+        self._assert_uses_indexes(statements)
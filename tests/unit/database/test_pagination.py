@@ -0,0 +1,237 @@
+import datetime
+import pytest
+
+from app.domains.categories.models import Category
+from app.exceptions.exceptions_of_pagination import LimitError, FieldsError, CursorError, FilterError, SortError
+from database.pagination import paginate, parse_page_arguments, columns_of, encode_cursor, decode_cursor, \
+    parse_sort_argument, parse_filter_arguments, to_bool, to_date
+from tests.unit import AbstractDatabaseUnitTest
+
+
+class TestPagination(AbstractDatabaseUnitTest):
+
+    def _insert_categories(self, size: int, on_create: datetime.datetime = None) -> list:
+        return [self._insert(Category, name=f'category{index}', profit_percentage=float(index),
+                             on_create=on_create or datetime.datetime(2020, 8, 4) + datetime.timedelta(days=index))
+                for index in range(size)]
+
+    def test_paginate_should_walk_every_row_once_using_the_cursor(self):
+        # Arrange
+        ids = self._insert_categories(5, on_create=datetime.datetime(2020, 8, 4))
+        columns = columns_of(Category, ['id', 'name', 'on_create'])
+        pages = []
+        after = None
+
+        # Action
+        while True:
+            rows, after = paginate(Category.query, columns, ['id'], 2, after)
+            pages.append(rows)
+            if not after:
+                break
+
+        # Assertions
+        self.assertEqual([2, 2, 1], [len(page) for page in pages])
+        self.assertEqual(sorted(ids), [row['id'] for page in pages for row in page])
+
+    def test_paginate_should_select_only_the_requested_fields(self):
+        # Arrange
+        self._insert_categories(3)
+        columns = columns_of(Category, ['id', 'name', 'profit_percentage', 'on_create'])
+
+        # Action
+        with self._count_statements() as statements:
+            rows, next_cursor = paginate(Category.query, columns, ['name'], 500, None)
+
+        # Assertions
+        self.assertEqual([{'name': 'category0'}, {'name': 'category1'}, {'name': 'category2'}], rows)
+        self.assertIsNone(next_cursor)
+        self.assertEqual(1, len(statements))
+        self.assertNotIn('profit_percentage', statements[0])
+
+    def test_paginate_should_walk_every_row_once_in_descending_order(self):
+        # Arrange
+        self._insert_categories(5)
+        columns = columns_of(Category, ['id', 'name', 'profit_percentage'])
+        names = []
+        after = None
+
+        # Action
+        while True:
+            rows, after = paginate(Category.query, columns, ['name'], 2, after, ('profit_percentage', 'id'), True)
+            names.extend(row['name'] for row in rows)
+            if not after:
+                break
+
+        # Assertions
+        self.assertEqual(['category4', 'category3', 'category2', 'category1', 'category0'], names)
+
+    def test_parse_sort_argument_should_return_the_keys_and_the_direction(self):
+        # Action
+        default_sort = parse_sort_argument({}, ['on_create', 'name'])
+        sort = parse_sort_argument({'sort': '-name'}, ['on_create', 'name'])
+
+        # Assertions
+        self.assertEqual({'keys': ('on_create', 'id'), 'descending': False}, default_sort)
+        self.assertEqual({'keys': ('name', 'id'), 'descending': True}, sort)
+
+    def test_parse_sort_argument_should_raise_a_sort_exception(self):
+        # Arrange
+        with pytest.raises(SortError) as exc:
+            # Action
+            parse_sort_argument({'sort': 'email'}, ['on_create', 'name'])
+
+        # Assertions
+        self.assertEqual(400, exc.value.code)
+        self.assertEqual("The sort must be one of the following field(s), optionally prefixed with '-': on_create, name",
+                         exc.value.description)
+
+    def test_parse_filter_arguments_should_convert_only_the_informed_filters(self):
+        # Action
+        filters = parse_filter_arguments({'active': 'False', 'validity_before': '2099-12-31', 'limit': '10'},
+                                         {'active': to_bool, 'validity_before': to_date, 'min_cost': float})
+
+        # Assertions
+        self.assertEqual({'active': False, 'validity_before': datetime.datetime(2099, 12, 31)}, filters)
+
+    def test_parse_filter_arguments_should_raise_a_filter_exception(self):
+        # Arrange
+        with pytest.raises(FilterError) as exc:
+            # Action
+            parse_filter_arguments({'active': 'yes', 'min_cost': 'ten', 'max_cost': '10'},
+                                   {'active': to_bool, 'min_cost': float, 'max_cost': float})
+
+        # Assertions
+        self.assertEqual(400, exc.value.code)
+        self.assertEqual('The following filter(s) have an invalid value: active, min_cost', exc.value.description)
+
+    def test_parse_page_arguments_should_return_the_defaults(self):
+        # Action
+        arguments = parse_page_arguments({}, ['id', 'name'], ['id'])
+
+        # Assertions
+        self.assertEqual({'fields': ['id'], 'limit': 500, 'after': None}, arguments)
+
+    def test_parse_page_arguments_should_raise_a_limit_exception(self):
+        # Arrange
+        with pytest.raises(LimitError) as exc:
+            # Action
+            parse_page_arguments({'limit': '501'}, ['id'])
+
+        # Assertions
+        self.assertEqual(400, exc.value.code)
+        self.assertEqual('The limit must be an integer between 1 and 500', exc.value.description)
+
+    def test_parse_page_arguments_should_raise_a_fields_exception(self):
+        # Arrange
+        with pytest.raises(FieldsError) as exc:
+            # Action
+            parse_page_arguments({'fields': 'id,email'}, ['id', 'name'])
+
+        # Assertions
+        self.assertEqual(400, exc.value.code)
+        self.assertEqual('The following field(s) cannot be selected: email', exc.value.description)
+
+    def test_decode_cursor_should_return_the_encoded_values(self):
+        # Arrange
+        on_create = datetime.datetime(2020, 8, 4, 10, 15, 57)
+        cursor = encode_cursor([on_create, 'id'])
+
+        # Action
+        values = decode_cursor(cursor, {'on_create': Category.on_create, 'id': Category.id})
+
+        # Assertions
+        self.assertEqual([on_create, 'id'], values)
+
+    def test_decode_cursor_should_raise_a_cursor_exception(self):
+        # Arrange
+        with pytest.raises(CursorError) as exc:
+            # Action
+            decode_cursor('not a cursor', {'on_create': Category.on_create, 'id': Category.id})
+
+        # Assertions
+        self.assertEqual(400, exc.value.code)
+        self.assertEqual("The cursor informed in 'after' is invalid", exc.value.description)
+
+    def test_decode_cursor_should_raise_a_cursor_exception_for_values_of_the_wrong_type(self):
+        # Arrange
+        cursors = [encode_cursor(['not a date', 'id']), encode_cursor([10, 'id']),
+                   encode_cursor([datetime.datetime(2020, 8, 4), ['id']]),
+                   encode_cursor([datetime.datetime(2020, 8, 4), {'id': 'id'}])]
+
+        for cursor in cursors:
+            with pytest.raises(CursorError):
+                # Action
+                decode_cursor(cursor, {'on_create': Category.on_create, 'id': Category.id})
+
+    def test_decode_cursor_should_parse_an_iso_on_create(self):
+        # Action
+        values = decode_cursor(encode_cursor(['2020-08-04T10:15:57', 'id']),
+                               {'on_create': Category.on_create, 'id': Category.id})
+
+        # Assertions
+        self.assertEqual([datetime.datetime(2020, 8, 4, 10, 15, 57), 'id'], values)
+
+    def test_get_categories_route_should_answer_400_for_a_cursor_of_the_wrong_type(self):
+        # Arrange
+        self._insert_categories(3)
+
+        # Action
+        response = self._client.get(f"/categories?after={encode_cursor([10, 'id'])}")
+
+        # Assertions
+        self.assertEqual(400, response.status_code)
+
+    def test_paginate_should_raise_a_cursor_exception_for_a_cursor_of_another_sort(self):
+        # Arrange
+        self._insert_categories(3)
+        columns = columns_of(Category, ['id', 'name', 'profit_percentage', 'on_create'])
+        _, after = paginate(Category.query, columns, ['name'], 2, None, ('name', 'id'))
+
+        for keys, descending in [(('profit_percentage', 'id'), False), (('on_create', 'id'), False),
+                                 (('name', 'id'), True)]:
+            with pytest.raises(CursorError):
+                # Action
+                paginate(Category.query, columns, ['name'], 2, after, keys, descending)
+
+    def test_decode_cursor_should_check_the_values_against_the_key_columns(self):
+        # Arrange
+        key_columns = {'profit_percentage': Category.profit_percentage, 'id': Category.id}
+        cursors = [encode_cursor(['10.5', 'id'], ('profit_percentage', 'id')),
+                   encode_cursor([{'value': 1}, 'id'], ('profit_percentage', 'id')),
+                   encode_cursor([True, 'id'], ('profit_percentage', 'id')),
+                   encode_cursor([None, 'id'], ('profit_percentage', 'id'))]
+
+        for cursor in cursors:
+            with pytest.raises(CursorError):
+                # Action
+                decode_cursor(cursor, key_columns)
+
+        # Assertions
+        self.assertEqual([10.0, 'id'], decode_cursor(encode_cursor([10, 'id'], ('profit_percentage', 'id')),
+                                                     key_columns))
+
+    def test_get_products_route_should_answer_400_for_a_cursor_of_another_sort(self):
+        # Arrange
+        cursor = encode_cursor(['produto', 'id'], ('name', 'id'))
+
+        # Action
+        responses = [self._client.get(f'/products?sort=cost_values&after={cursor}'),
+                     self._client.get(f'/products?sort=-name&after={cursor}'),
+                     self._client.get(f"/products?sort=name&after={encode_cursor([{}, 'id'], ('name', 'id'))}")]
+
+        # Assertions
+        self.assertEqual([400, 400, 400], [response.status_code for response in responses])
+        self.assertEqual(200, self._client.get(f'/products?sort=name&after={cursor}').status_code)
+
+    def test_get_categories_route_should_send_the_next_cursor_header(self):
+        # Arrange
+        self._insert_categories(3)
+
+        # Action
+        response = self._client.get('/categories?limit=2&fields=name')
+        next_response = self._client.get(f"/categories?limit=2&fields=name&after={response.headers['X-Next-Cursor']}")
+
+        # Assertions
+        self.assertEqual([{'name': 'category0'}, {'name': 'category1'}], response.get_json())
+        self.assertEqual([{'name': 'category2'}], next_response.get_json())
+        self.assertNotIn('X-Next-Cursor', next_response.headers)
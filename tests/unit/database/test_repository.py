@@ -0,0 +1,93 @@
+import unittest
+from uuid import uuid4
+
+import pytest
+from sqlalchemy.dialects import postgresql
+
+from app.domains.categories.models import Category
+from app.domains.products.models import Product
+from database import db
+from database.repository import on_conflict_do_update, chunked, unit_of_work, in_unit_of_work, save, commit, \
+    upsert_many
+from tests.unit import AbstractDatabaseUnitTest
+
+
+class TestRepository(unittest.TestCase):
+
+    def test_on_conflict_do_update_should_update_only_the_informed_fields(self):
+        # Action
+        statement = str(on_conflict_do_update(Product, 'sku', ['name', 'cost_values'])
+                        .compile(dialect=postgresql.dialect()))
+
+        # Assertions
+        self.assertIn('ON CONFLICT (sku) DO UPDATE SET', statement)
+        self.assertIn('name = excluded.name', statement)
+        self.assertIn('cost_values = excluded.cost_values', statement)
+        self.assertIn('on_update = %(param_1)s', statement)
+        self.assertNotIn('id = excluded.id', statement)
+        self.assertIn('WHERE products.name IS DISTINCT FROM excluded.name OR products.cost_values IS DISTINCT FROM '
+                      'excluded.cost_values', statement)
+
+    def test_chunked_should_split_the_iterable(self):
+        # Action
+        chunks = list(chunked(iter(range(5)), 2))
+
+        # Assertions
+        self.assertEqual([[0, 1], [2, 3], [4]], chunks)
+
+
+class TestUnitOfWork(AbstractDatabaseUnitTest):
+
+    def _names(self) -> set:
+        db.session.expire_all()
+        return {category.name for category in Category.query.all()}
+
+    def test_unit_of_work_should_commit_once_at_the_end(self):
+        # Action
+        with unit_of_work() as work:
+            save(Category(name='bebidas', profit_percentage=10.0))
+            work.add_all([Category(name='doces', profit_percentage=20.0)])
+            self.assertTrue(in_unit_of_work())
+
+        # Assertions
+        self.assertFalse(in_unit_of_work())
+        self.assertEqual({'bebidas', 'doces'}, self._names())
+
+    def test_unit_of_work_should_roll_back_every_write_when_an_error_is_raised(self):
+        # Action
+        with pytest.raises(ValueError):
+            with unit_of_work() as work:
+                work.insert_many(Category, [{'id': str(uuid4()), 'name': 'bebidas', 'profit_percentage': 10.0}])
+                with unit_of_work():
+                    save(Category(name='doces', profit_percentage=20.0))
+                    commit()
+                raise ValueError()
+
+        # Assertions
+        self.assertEqual(set(), self._names())
+
+    def test_savepoint_should_roll_back_only_its_own_writes(self):
+        # Action
+        with unit_of_work() as work:
+            work.add(Category(name='bebidas', profit_percentage=10.0))
+            work.flush()
+            with pytest.raises(ValueError):
+                with work.savepoint():
+                    work.add(Category(name='doces', profit_percentage=20.0))
+                    raise ValueError()
+
+        # Assertions
+        self.assertEqual({'bebidas'}, self._names())
+
+    def test_upsert_many_should_not_update_the_rows_that_did_not_change(self):
+        # Arrange
+        categories = [{'id': str(uuid4()), 'name': 'bebidas', 'profit_percentage': 10.0},
+                      {'id': str(uuid4()), 'name': 'doces', 'profit_percentage': 20.0}]
+        db.session.execute(Category.__table__.insert(), categories)
+
+        # Action
+        with self._count_statements() as statements:
+            upsert_many(Category, [{**category} for category in categories], 'id', ['name', 'profit_percentage'])
+
+        # Assertions
+        self.assertEqual(['SELECT'], [statement.split()[0] for statement in statements])